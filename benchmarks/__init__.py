@@ -0,0 +1 @@
+"""Speed and memory benchmarks of pyresolvemetrics, see ``python -m benchmarks``."""
@@ -0,0 +1,117 @@
+"""Command line entry point of the benchmarks.
+
+Run the suite and store its results::
+
+    $ python -m benchmarks run --sizes 1e3 1e5 1e7 --output new.json
+
+Compare the results of two runs::
+
+    $ python -m benchmarks compare old.json new.json
+
+Check that importing the library and scoring a few pairs stays cheap::
+
+    $ python -m benchmarks startup --budget 0.05
+"""
+
+import argparse
+import sys
+
+from benchmarks import harness
+from benchmarks.generators import DISTRIBUTIONS
+from benchmarks.suite import CASES, FORMS
+
+
+def _size(text: str) -> int:
+    return int(float(text))
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="measure the benchmark cases")
+    run.add_argument(
+        "--sizes",
+        type=_size,
+        nargs="+",
+        default=[10**3, 10**4, 10**5, 10**6, 10**7],
+        help="numbers of records, e.g. 1e3 1e6",
+    )
+    run.add_argument("--forms", nargs="+", choices=FORMS, default=list(FORMS))
+    run.add_argument(
+        "--cases", nargs="+", choices=sorted(CASES), help="all cases by default"
+    )
+    run.add_argument("--distribution", choices=DISTRIBUTIONS, default="zipf")
+    run.add_argument("--error-rate", type=float, default=0.1)
+    run.add_argument("--giant-fraction", type=float, default=0.0)
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--max-pairs", type=_size, default=20_000_000)
+    run.add_argument("--max-set-records", type=_size, default=100_000)
+    run.add_argument("--repeat", type=int, default=3)
+    run.add_argument("--output", help="JSON file receiving the results")
+
+    compare = commands.add_parser("compare", help="compare two runs")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare.add_argument(
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="time ratio above which a case counts as a regression",
+    )
+
+    startup = commands.add_parser(
+        "startup", help="time the import of the library in a new process"
+    )
+    startup.add_argument(
+        "--budget",
+        type=float,
+        default=0.05,
+        help="seconds above which the startup counts as a regression",
+    )
+    startup.add_argument("--repeat", type=int, default=5)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parser().parse_args(argv)
+    if args.command == "run":
+        results = harness.run(
+            args.sizes,
+            args.forms,
+            args.cases,
+            max_set_records=args.max_set_records,
+            repeat=args.repeat,
+            distribution=args.distribution,
+            error_rate=args.error_rate,
+            giant_fraction=args.giant_fraction,
+            seed=args.seed,
+            max_pairs=args.max_pairs,
+        )
+        if args.output:
+            harness.save(results, args.output)
+        return 0
+
+    if args.command == "startup":
+        measurement = harness.startup(args.repeat)
+        print(
+            f"startup {measurement['seconds']:.4f}s "
+            f"(budget {args.budget:.4f}s), "
+            f"numpy {'imported' if measurement['imports_numpy'] else 'not imported'}"
+        )
+        return int(measurement["seconds"] > args.budget or measurement["imports_numpy"])
+
+    rows = harness.compare(
+        harness.load(args.baseline), harness.load(args.current), args.threshold
+    )
+    for row in rows:
+        print(
+            f"{row['benchmark']:<34} {row['form']:<6} {row['records']:>10} "
+            f"time x{row['time_ratio']:<7.2f} memory x{row['memory_ratio']:<7.2f} "
+            f"{row['status']}"
+        )
+    return int(any(row["status"] == "slower" for row in rows))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""Synthetic ground truths and entity resolution results."""
+
+import numpy as np
+
+DISTRIBUTIONS = ("uniform", "zipf")
+
+
+def cluster_sizes(
+    n_records: int,
+    rng: np.random.Generator,
+    distribution: str = "zipf",
+    mean_size: float = 3.0,
+    exponent: float = 2.5,
+    max_size: int = 1_000,
+    giant_fraction: float = 0.0,
+) -> np.ndarray:
+    """Draw the sizes of the clusters of a ground truth.
+
+    :param n_records: the total number of records.
+    :param rng: the source of randomness.
+    :param distribution: ``"uniform"`` draws sizes around ``mean_size``, while
+        ``"zipf"`` draws a heavy tail of large clusters among many singletons,
+        which is more skewed the lower the ``exponent``.
+    :param mean_size: the average size of uniformly distributed clusters.
+    :param exponent: the exponent of Zipf distributed cluster sizes.
+    :param max_size: the largest size of the drawn clusters, which keeps the
+        number of pairs roughly linear in the number of records.
+    :param giant_fraction: the fraction of records which are placed in a
+        single giant cluster.
+    :returns: the cluster sizes, which add up to ``n_records``.
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"unknown distribution: {distribution}")
+    giant = int(n_records * giant_fraction)
+    sizes = [np.array([giant])] if giant else []
+    remaining = n_records - giant
+    while remaining > 0:
+        batch = max(int(remaining / mean_size), 16)
+        if distribution == "uniform":
+            drawn = 1 + rng.poisson(mean_size - 1, batch)
+        else:
+            drawn = rng.zipf(exponent, batch)
+            drawn = drawn[drawn <= max_size]
+        drawn = drawn[np.cumsum(drawn) <= remaining]
+        if len(drawn) == 0:
+            drawn = np.array([remaining])
+        sizes.append(drawn)
+        remaining -= int(drawn.sum())
+    return np.concatenate(sizes).astype(np.int64)
+
+
+def partition(sizes: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Assign shuffled records to clusters of the given sizes.
+
+    :returns: the cluster label of each record.
+    """
+    labels = np.repeat(np.arange(len(sizes)), sizes)
+    rng.shuffle(labels)
+    return labels
+
+
+def perturb(
+    labels: np.ndarray, error_rate: float, rng: np.random.Generator
+) -> np.ndarray:
+    """Simulate the result of an imperfect entity resolution task.
+
+    Each record is misplaced with probability ``error_rate``: half of the
+    misplaced records are split off into clusters of their own, while the
+    others are merged into a random cluster.
+
+    :returns: the result cluster label of each record.
+    """
+    result = labels.copy()
+    wrong = np.flatnonzero(rng.random(len(labels)) < error_rate)
+    split = rng.random(len(wrong)) < 0.5
+    n_clusters = int(labels.max(initial=-1)) + 1
+    result[wrong[split]] = n_clusters + np.arange(np.count_nonzero(split))
+    result[wrong[~split]] = rng.integers(
+        0, max(n_clusters, 1), np.count_nonzero(~split)
+    )
+    return result
+
+
+def pair_count(labels: np.ndarray) -> int:
+    """The number of pairs of records placed together by ``labels``."""
+    sizes = np.bincount(labels[labels >= 0])
+    return int((sizes * (sizes - 1) // 2).sum())
+
+
+def pairs(labels: np.ndarray) -> np.ndarray:
+    """Enumerate the pairs of records placed together by ``labels``.
+
+    :returns: an ``(m, 2)`` array of record indices.
+    """
+    present = np.flatnonzero(labels >= 0)
+    order = present[np.argsort(labels[present], kind="stable")]
+    starts = np.flatnonzero(np.r_[True, np.diff(labels[order]) != 0])
+    sizes = np.diff(np.r_[starts, len(order)])
+    chunks = []
+    for size in np.unique(sizes[sizes > 1]):
+        members = order[starts[sizes == size][:, None] + np.arange(size)]
+        first, second = np.triu_indices(size, 1)
+        chunks.append(
+            np.stack([members[:, first].ravel(), members[:, second].ravel()], 1)
+        )
+    if not chunks:
+        return np.empty((0, 2), dtype=np.int64)
+    return np.concatenate(chunks).astype(np.int64)
+
+
+def as_sets(labels: np.ndarray) -> frozenset[frozenset]:
+    """Convert a label array into a partition given as a set of sets."""
+    present = np.flatnonzero(labels >= 0)
+    order = present[np.argsort(labels[present], kind="stable")]
+    starts = np.flatnonzero(np.r_[True, np.diff(labels[order]) != 0])
+    return frozenset(
+        frozenset(cluster.tolist()) for cluster in np.split(order, starts[1:])
+    )
+
+
+def as_pair_set(pair_array: np.ndarray) -> set[tuple[int, int]]:
+    """Convert a pair array into a set of pairs."""
+    return set(map(tuple, pair_array.tolist()))
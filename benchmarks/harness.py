@@ -0,0 +1,201 @@
+"""Timing and memory measurements of the benchmark cases."""
+
+import gc
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Callable, Iterable
+
+import numpy as np
+
+import pyresolvemetrics
+from benchmarks.suite import CASES, Dataset, Skip
+
+
+def measure(call: Callable[[], object], repeat: int = 3) -> dict[str, float]:
+    """Time a call and trace the memory it allocates.
+
+    The call is timed ``repeat`` times without tracing, keeping the fastest
+    run, then run once more under :mod:`tracemalloc`, which also sees the
+    buffers allocated by NumPy.
+
+    :returns: the best time in seconds and the peak of the allocated bytes.
+    """
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        call()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"seconds": min(timings), "peak_bytes": peak}
+
+
+def metadata() -> dict[str, str]:
+    """Describe the versions and the machine a benchmark ran on."""
+    return {
+        "pyresolvemetrics": _package_version(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
+
+
+def _package_version() -> str:
+    try:
+        from importlib.metadata import version
+
+        return version(pyresolvemetrics.__name__)
+    except Exception:
+        return "unknown"
+
+
+def run(
+    sizes: Iterable[int],
+    forms: Iterable[str],
+    cases: Iterable[str] | None = None,
+    max_set_records: int = 100_000,
+    repeat: int = 3,
+    log: Callable[[str], None] = print,
+    **dataset_options,
+) -> dict:
+    """Run the benchmark cases over datasets of increasing sizes.
+
+    :param sizes: the numbers of records of the datasets.
+    :param forms: the input forms to benchmark, ``"arrays"`` and/or ``"sets"``.
+    :param cases: the names of the cases to run, all of them by default.
+    :param max_set_records: the largest dataset converted to sets of sets.
+    :param repeat: the number of timed runs of each case.
+    :param log: receives a line of progress for each measurement.
+    :param dataset_options: further parameters of every :class:`Dataset`.
+    :returns: the measurements, along with the metadata of the run.
+    """
+    names = list(CASES if cases is None else cases)
+    unknown = set(names) - set(CASES)
+    if unknown:
+        raise ValueError(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+    results = []
+    for size in sizes:
+        data = Dataset(size, **dataset_options)
+        for form in forms:
+            for name in names:
+                entry = {"benchmark": name, "form": form, "records": size}
+                try:
+                    if form == "sets" and size > max_set_records:
+                        raise Skip(f"sets are limited to {max_set_records} records")
+                    entry.update(measure(CASES[name](data, form), repeat))
+                    memory = entry["peak_bytes"] / 2**20
+                    log(
+                        f"{name:<34} {form:<6} {size:>10} "
+                        f"{entry['seconds']:>10.4f}s {memory:>9.1f}MiB"
+                    )
+                except Skip as reason:
+                    entry["skipped"] = str(reason)
+                results.append(entry)
+    return {
+        "metadata": metadata(),
+        "dataset": {"sizes": list(sizes), **Dataset(0, **dataset_options).__dict__},
+        "results": results,
+    }
+
+
+def _key(entry: dict) -> tuple:
+    return entry["benchmark"], entry["form"], entry["records"]
+
+
+def compare(baseline: dict, current: dict, threshold: float = 1.2) -> list[dict]:
+    """Compare the measurements of two runs.
+
+    :param baseline: the results of a previous :func:`run`.
+    :param current: the results of a later :func:`run`.
+    :param threshold: the ratio of times above which a case is reported as a
+        regression, and below the inverse of which as an improvement.
+    :returns: one row per case measured in both runs, with the time and peak
+        memory ratios of the current run over the baseline.
+    """
+    previous = {_key(e): e for e in baseline["results"] if "seconds" in e}
+    rows = []
+    for entry in current["results"]:
+        before = previous.get(_key(entry))
+        if before is None or "seconds" not in entry:
+            continue
+        time_ratio = entry["seconds"] / max(before["seconds"], 1e-9)
+        memory_ratio = entry["peak_bytes"] / max(before["peak_bytes"], 1)
+        status = "same"
+        if time_ratio > threshold:
+            status = "slower"
+        elif time_ratio < 1 / threshold:
+            status = "faster"
+        rows.append(
+            {
+                "benchmark": entry["benchmark"],
+                "form": entry["form"],
+                "records": entry["records"],
+                "time_ratio": time_ratio,
+                "memory_ratio": memory_ratio,
+                "status": status,
+            }
+        )
+    return rows
+
+
+# Scores a couple of pairs the way a short-lived command line process would,
+# then reports whether doing so imported NumPy.
+_STARTUP_SCRIPT = """
+import sys
+import pyresolvemetrics
+pyresolvemetrics.f1({("a", "b"), ("c", "d")}, {("a", "b"), ("b", "c")})
+print("numpy" in sys.modules)
+"""
+
+
+def startup(repeat: int = 5) -> dict:
+    """Time a fresh interpreter which imports the library and scores pairs.
+
+    The time of a bare interpreter is subtracted, so that only the cost of
+    the library remains.
+
+    :param repeat: the number of processes started, keeping the fastest.
+    :returns: the best time in seconds and whether NumPy was imported.
+    """
+
+    def best(script: str) -> tuple[float, str]:
+        timings, output = [], ""
+        for _ in range(repeat):
+            start = time.perf_counter()
+            output = subprocess.run(
+                [sys.executable, "-c", script],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            timings.append(time.perf_counter() - start)
+        return min(timings), output
+
+    bare, _ = best("pass")
+    seconds, output = best(_STARTUP_SCRIPT)
+    return {
+        "seconds": max(seconds - bare, 0.0),
+        "imports_numpy": output.strip() == "True",
+    }
+
+
+def save(results: dict, path: str) -> None:
+    with open(path, "w") as file:
+        json.dump(results, file, indent=2)
+
+
+def load(path: str) -> dict:
+    with open(path) as file:
+        return json.load(file)
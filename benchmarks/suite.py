@@ -0,0 +1,285 @@
+"""Benchmark cases covering the public functions of pyresolvemetrics.
+
+Each case prepares its inputs from a :class:`Dataset` and returns the call to
+measure, so that only the work of the library is timed.
+"""
+
+import os
+import tempfile
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Callable
+
+import numpy as np
+
+import pyresolvemetrics as prm
+from benchmarks import generators
+
+FORMS = ("arrays", "sets")
+
+
+class Skip(Exception):
+    """Raised by a case which cannot run on a dataset."""
+
+
+@dataclass
+class Dataset:
+    """A synthetic ground truth and result, converted lazily to every form.
+
+    :param n_records: the number of records.
+    :param distribution: the distribution of the ground truth cluster sizes.
+    :param error_rate: the fraction of records misplaced by the result.
+    :param giant_fraction: the fraction of records in one giant cluster.
+    :param seed: the seed of the generators.
+    :param max_pairs: the largest pair set which may be enumerated.
+    """
+
+    n_records: int
+    distribution: str = "zipf"
+    error_rate: float = 0.1
+    giant_fraction: float = 0.0
+    seed: int = 0
+    max_pairs: int = 20_000_000
+
+    @cached_property
+    def ground_truth(self) -> np.ndarray:
+        rng = np.random.default_rng(self.seed)
+        sizes = generators.cluster_sizes(
+            self.n_records,
+            rng,
+            self.distribution,
+            giant_fraction=self.giant_fraction,
+        )
+        return generators.partition(sizes, rng)
+
+    @cached_property
+    def result(self) -> np.ndarray:
+        rng = np.random.default_rng(self.seed + 1)
+        return generators.perturb(self.ground_truth, self.error_rate, rng)
+
+    def _pairs(self, labels: np.ndarray) -> np.ndarray:
+        count = generators.pair_count(labels)
+        if count > self.max_pairs:
+            raise Skip(f"{count} pairs exceed the limit of {self.max_pairs}")
+        return generators.pairs(labels)
+
+    @cached_property
+    def ground_truth_pairs(self) -> np.ndarray:
+        return self._pairs(self.ground_truth)
+
+    @cached_property
+    def result_pairs(self) -> np.ndarray:
+        return self._pairs(self.result)
+
+    @cached_property
+    def ground_truth_sets(self) -> frozenset[frozenset]:
+        return generators.as_sets(self.ground_truth)
+
+    @cached_property
+    def result_sets(self) -> frozenset[frozenset]:
+        return generators.as_sets(self.result)
+
+    @cached_property
+    def ground_truth_pair_set(self) -> set[tuple[int, int]]:
+        return generators.as_pair_set(self.ground_truth_pairs)
+
+    @cached_property
+    def result_pair_set(self) -> set[tuple[int, int]]:
+        return generators.as_pair_set(self.result_pairs)
+
+    def partitions(self, form: str) -> tuple:
+        if form == "arrays":
+            return self.ground_truth, self.result
+        return self.ground_truth_sets, self.result_sets
+
+    def pairs(self, form: str) -> tuple:
+        if form == "arrays":
+            return self.ground_truth_pairs, self.result_pairs
+        return self.ground_truth_pair_set, self.result_pair_set
+
+    def scores(self, count: int) -> np.ndarray:
+        return np.random.default_rng(self.seed + 2).random(count)
+
+
+Case = Callable[[Dataset, str], Callable[[], object]]
+CASES: dict[str, Case] = {}
+
+
+def case(name: str) -> Callable[[Case], Case]:
+    def register(prepare: Case) -> Case:
+        CASES[name] = prepare
+        return prepare
+
+    return register
+
+
+def _algebraic(metric: Callable) -> Case:
+    def prepare(data: Dataset, form: str):
+        ground_truth, result = data.partitions(form)
+        return lambda: metric(ground_truth, result)
+
+    return prepare
+
+
+def _probabilistic(metric: Callable) -> Case:
+    def prepare(data: Dataset, form: str):
+        ground_truth, result = data.pairs(form)
+        return lambda: metric(ground_truth, result)
+
+    return prepare
+
+
+for _metric in (
+    prm.pair_precision,
+    prm.pair_recall,
+    prm.pair_comparison_measure,
+    prm.cluster_precision,
+    prm.cluster_recall,
+    prm.cluster_comparison_measure,
+    prm.rand_index,
+    prm.adjusted_rand_index,
+    prm.twi,
+    prm.fowlkes_mallows_index,
+    prm.normalized_mutual_information,
+    prm.adjusted_mutual_information,
+    prm.homogeneity,
+    prm.completeness,
+    prm.v_measure,
+    prm.bcubed_precision,
+    prm.bcubed_recall,
+    prm.generalized_merge_distance,
+):
+    case(_metric.__name__)(_algebraic(_metric))
+
+for _metric in (
+    prm.precision,
+    prm.recall,
+    prm.f1,
+    prm.f_beta,
+    prm.jaccard_index,
+    prm.confusion,
+):
+    case(_metric.__name__)(_probabilistic(_metric))
+
+
+@case("Evaluation.compute_all")
+def _evaluation(data: Dataset, form: str):
+    ground_truth, result = data.partitions(form)
+    return lambda: prm.Evaluation(ground_truth, result).compute_all()
+
+
+@case("GroundTruth.from_partition")
+def _index_partition(data: Dataset, form: str):
+    ground_truth, _ = data.partitions(form)
+    return lambda: prm.GroundTruth.from_partition(ground_truth)
+
+
+@case("GroundTruth.from_pairs")
+def _index_pairs(data: Dataset, form: str):
+    ground_truth, _ = data.pairs(form)
+    return lambda: prm.GroundTruth.from_pairs(ground_truth)
+
+
+@case("evaluate_many")
+def _evaluate_many(data: Dataset, form: str):
+    ground_truth, result = data.partitions(form)
+    return lambda: prm.evaluate_many(ground_truth, [result] * 4)
+
+
+@case("to_label_arrays")
+def _to_label_arrays(data: Dataset, form: str):
+    if form != "sets":
+        raise Skip("converts sets")
+    return lambda: prm.to_label_arrays(data.ground_truth_sets, data.result_sets)
+
+
+@case("to_pair_arrays")
+def _to_pair_arrays(data: Dataset, form: str):
+    if form != "sets":
+        raise Skip("converts sets")
+    return lambda: prm.to_pair_arrays(data.ground_truth_pair_set, data.result_pair_set)
+
+
+@case("connected_components")
+def _connected_components(data: Dataset, form: str):
+    _, result = data.pairs(form)
+    return lambda: prm.connected_components(result)
+
+
+@case("confusion of a partition")
+def _partition_confusion(data: Dataset, form: str):
+    ground_truth, _ = data.partitions(form)
+    _, result = data.pairs(form)
+    index = prm.GroundTruth.from_partition(ground_truth)
+    return lambda: prm.confusion(index, result)
+
+
+@case("streaming_confusion")
+def _streaming_confusion(data: Dataset, form: str):
+    ground_truth, result = data.pairs(form)
+    if form == "arrays":
+        chunks = np.array_split(result, 16)
+    else:
+        items = list(result)
+        chunks = [items[i::16] for i in range(16)]
+    return lambda: prm.streaming_confusion(ground_truth, chunks)
+
+
+@case("precision_recall_curve")
+def _precision_recall_curve(data: Dataset, form: str):
+    ground_truth, result = data.pairs(form)
+    scores = data.scores(len(result))
+    if form == "sets":
+        result = list(result)
+    return lambda: prm.precision_recall_curve(ground_truth, result, scores)
+
+
+@case("clustering_curve")
+def _clustering_curve(data: Dataset, form: str):
+    ground_truth, _ = data.partitions(form)
+    edges = data.result_pairs
+    if form == "sets":
+        edges = edges.tolist()
+    return lambda: prm.clustering_curve(ground_truth, edges, data.scores(len(edges)))
+
+
+@case("ResolutionTracker")
+def _tracker(data: Dataset, form: str):
+    ground_truth, _ = data.partitions(form)
+    records = data.result.tolist()
+
+    def replay():
+        tracker = prm.ResolutionTracker(ground_truth)
+        for record, cluster in enumerate(records):
+            tracker.add_record(record, cluster)
+        return tracker.compute_all()
+
+    return replay
+
+
+@case("bootstrap")
+def _bootstrap(data: Dataset, form: str):
+    ground_truth, result = data.partitions(form)
+    return lambda: prm.bootstrap(ground_truth, result, n_resamples=100, seed=0)
+
+
+@case("jackknife")
+def _jackknife(data: Dataset, form: str):
+    ground_truth, result = data.partitions(form)
+    return lambda: prm.jackknife(ground_truth, result)
+
+
+@case("save_partition+load_ground_truth")
+def _storage(data: Dataset, form: str):
+    ground_truth, _ = data.partitions(form)
+
+    def round_trip():
+        handle, path = tempfile.mkstemp(suffix=".bin")
+        os.close(handle)
+        try:
+            prm.save_partition(path, ground_truth)
+            return prm.load_ground_truth(path).pair_count
+        finally:
+            os.remove(path)
+
+    return round_trip
@@ -1,6 +1,6 @@
 import json
 
-from matchescu.metrics import fsm, algebraic
+import pyresolvemetrics as prm
 
 
 def _load_json(file_path: str):
@@ -27,25 +27,21 @@ if __name__ == "__main__":
     gt_pairs = list(_hashable_pair(pair) for pair in gt["fsm"])
     er_pairs = list(_hashable_pair(pair) for pair in er["fsm"])
 
-    print("precision", fsm.precision(gt_pairs, er_pairs))
-    print("recall", fsm.recall(gt_pairs, er_pairs))
-    print("F1", fsm.f1(gt_pairs, er_pairs))
+    print("precision", prm.precision(gt_pairs, er_pairs))
+    print("recall", prm.recall(gt_pairs, er_pairs))
+    print("F1", prm.f1(gt_pairs, er_pairs))
 
     gt_partition = list(_extract_cluster(c) for c in gt["algebraic"])
     er_partition = list(_extract_cluster(c) for c in er["algebraic"])
 
-    print("pairwise precision", algebraic.pair_precision(gt_partition, er_partition))
-    print("pairwise recall", algebraic.pair_recall(gt_partition, er_partition))
-    print("pairwise F1", algebraic.pair_comparison_measure(gt_partition, er_partition))
-
-    print("cluster precision", algebraic.cluster_precision(gt_partition, er_partition))
-    print("cluster recall", algebraic.cluster_recall(gt_partition, er_partition))
-    print(
-        "cluster F1", algebraic.cluster_comparison_measure(gt_partition, er_partition)
-    )
-
-    print("Rand index", algebraic.rand_index(gt_partition, er_partition))
-    print(
-        "adjusted Rand index", algebraic.adjusted_rand_index(gt_partition, er_partition)
-    )
-    print("Talburt-Wang index", algebraic.twi(gt_partition, er_partition))
+    print("pairwise precision", prm.pair_precision(gt_partition, er_partition))
+    print("pairwise recall", prm.pair_recall(gt_partition, er_partition))
+    print("pairwise F1", prm.pair_comparison_measure(gt_partition, er_partition))
+
+    print("cluster precision", prm.cluster_precision(gt_partition, er_partition))
+    print("cluster recall", prm.cluster_recall(gt_partition, er_partition))
+    print("cluster F1", prm.cluster_comparison_measure(gt_partition, er_partition))
+
+    print("Rand index", prm.rand_index(gt_partition, er_partition))
+    print("adjusted Rand index", prm.adjusted_rand_index(gt_partition, er_partition))
+    print("Talburt-Wang index", prm.twi(gt_partition, er_partition))
@@ -1,21 +1,167 @@
-from pyresolvemetrics._probabilistic import precision, recall, f1
-from pyresolvemetrics._algebraic import (
-    pair_precision,
-    pair_recall,
-    pair_comparison_measure,
-    cluster_precision,
-    cluster_recall,
-    cluster_comparison_measure,
-    rand_index,
-    adjusted_rand_index,
-    twi,
-)
+"""Entity resolution metrics.
+
+The submodules are only imported once one of their names is first accessed,
+so that scoring sets of pairs neither imports NumPy nor pays for the parts of
+the library it does not use.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pyresolvemetrics._probabilistic import (
+        Confusion,
+        confusion,
+        precision,
+        recall,
+        f1,
+        f_beta,
+        jaccard_index,
+    )
+    from pyresolvemetrics._algebraic import (
+        pair_precision,
+        pair_recall,
+        pair_comparison_measure,
+        cluster_precision,
+        cluster_recall,
+        cluster_comparison_measure,
+        rand_index,
+        adjusted_rand_index,
+        twi,
+        fowlkes_mallows_index,
+        normalized_mutual_information,
+        adjusted_mutual_information,
+        homogeneity,
+        completeness,
+        v_measure,
+        bcubed_precision,
+        bcubed_recall,
+        generalized_merge_distance,
+        ClusterDiagnostics,
+        cluster_diagnostics,
+    )
+    from pyresolvemetrics._async import AsyncEvaluator
+    from pyresolvemetrics._contingency import to_label_arrays
+    from pyresolvemetrics._closure import connected_components
+    from pyresolvemetrics._curves import PrecisionRecallCurve, precision_recall_curve
+    from pyresolvemetrics._evaluation import Evaluation
+    from pyresolvemetrics._errors import ClusterError, ClusterErrors, PairErrors
+    from pyresolvemetrics._ground_truth import GroundTruth
+    from pyresolvemetrics._instrumentation import PhaseRecord, instrument
+    from pyresolvemetrics._incremental import (
+        ClusteringCurve,
+        ResolutionTracker,
+        clustering_curve,
+    )
+    from pyresolvemetrics._parallel import evaluate_many
+    from pyresolvemetrics._resampling import ConfidenceInterval, bootstrap, jackknife
+    from pyresolvemetrics._weighted import sample_estimates, weighted_confusion
+    from pyresolvemetrics._storage import (
+        save_partition,
+        save_pairs,
+        load_partition,
+        load_pairs,
+        load_records,
+        load_ground_truth,
+    )
+    from pyresolvemetrics._sharding import (
+        PartialContingency,
+        shard_of,
+        write_shards,
+        count_shard,
+        evaluate_shards,
+    )
+    from pyresolvemetrics._streaming import ConfusionAccumulator, streaming_confusion
+    from pyresolvemetrics._pairs import to_pair_arrays
+
+_EXPORTS = {
+    "Confusion": "pyresolvemetrics._probabilistic",
+    "confusion": "pyresolvemetrics._probabilistic",
+    "precision": "pyresolvemetrics._probabilistic",
+    "recall": "pyresolvemetrics._probabilistic",
+    "f1": "pyresolvemetrics._probabilistic",
+    "f_beta": "pyresolvemetrics._probabilistic",
+    "jaccard_index": "pyresolvemetrics._probabilistic",
+    "pair_precision": "pyresolvemetrics._algebraic",
+    "pair_recall": "pyresolvemetrics._algebraic",
+    "pair_comparison_measure": "pyresolvemetrics._algebraic",
+    "cluster_precision": "pyresolvemetrics._algebraic",
+    "cluster_recall": "pyresolvemetrics._algebraic",
+    "cluster_comparison_measure": "pyresolvemetrics._algebraic",
+    "rand_index": "pyresolvemetrics._algebraic",
+    "adjusted_rand_index": "pyresolvemetrics._algebraic",
+    "twi": "pyresolvemetrics._algebraic",
+    "fowlkes_mallows_index": "pyresolvemetrics._algebraic",
+    "normalized_mutual_information": "pyresolvemetrics._algebraic",
+    "adjusted_mutual_information": "pyresolvemetrics._algebraic",
+    "homogeneity": "pyresolvemetrics._algebraic",
+    "completeness": "pyresolvemetrics._algebraic",
+    "v_measure": "pyresolvemetrics._algebraic",
+    "bcubed_precision": "pyresolvemetrics._algebraic",
+    "bcubed_recall": "pyresolvemetrics._algebraic",
+    "generalized_merge_distance": "pyresolvemetrics._algebraic",
+    "ClusterDiagnostics": "pyresolvemetrics._algebraic",
+    "cluster_diagnostics": "pyresolvemetrics._algebraic",
+    "AsyncEvaluator": "pyresolvemetrics._async",
+    "to_label_arrays": "pyresolvemetrics._contingency",
+    "connected_components": "pyresolvemetrics._closure",
+    "PrecisionRecallCurve": "pyresolvemetrics._curves",
+    "precision_recall_curve": "pyresolvemetrics._curves",
+    "Evaluation": "pyresolvemetrics._evaluation",
+    "ClusterError": "pyresolvemetrics._errors",
+    "ClusterErrors": "pyresolvemetrics._errors",
+    "PairErrors": "pyresolvemetrics._errors",
+    "GroundTruth": "pyresolvemetrics._ground_truth",
+    "PhaseRecord": "pyresolvemetrics._instrumentation",
+    "instrument": "pyresolvemetrics._instrumentation",
+    "ClusteringCurve": "pyresolvemetrics._incremental",
+    "ResolutionTracker": "pyresolvemetrics._incremental",
+    "clustering_curve": "pyresolvemetrics._incremental",
+    "evaluate_many": "pyresolvemetrics._parallel",
+    "ConfidenceInterval": "pyresolvemetrics._resampling",
+    "bootstrap": "pyresolvemetrics._resampling",
+    "jackknife": "pyresolvemetrics._resampling",
+    "sample_estimates": "pyresolvemetrics._weighted",
+    "weighted_confusion": "pyresolvemetrics._weighted",
+    "save_partition": "pyresolvemetrics._storage",
+    "save_pairs": "pyresolvemetrics._storage",
+    "load_partition": "pyresolvemetrics._storage",
+    "load_pairs": "pyresolvemetrics._storage",
+    "load_records": "pyresolvemetrics._storage",
+    "load_ground_truth": "pyresolvemetrics._storage",
+    "PartialContingency": "pyresolvemetrics._sharding",
+    "shard_of": "pyresolvemetrics._sharding",
+    "write_shards": "pyresolvemetrics._sharding",
+    "count_shard": "pyresolvemetrics._sharding",
+    "evaluate_shards": "pyresolvemetrics._sharding",
+    "ConfusionAccumulator": "pyresolvemetrics._streaming",
+    "streaming_confusion": "pyresolvemetrics._streaming",
+    "to_pair_arrays": "pyresolvemetrics._pairs",
+}
+
+
+def __getattr__(name: str):
+    try:
+        module = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
 
 
 __all__ = [
     "precision",
     "recall",
     "f1",
+    "f_beta",
+    "jaccard_index",
+    "Confusion",
+    "confusion",
     "pair_precision",
     "pair_recall",
     "pair_comparison_measure",
@@ -25,4 +171,50 @@ __all__ = [
     "adjusted_rand_index",
     "rand_index",
     "twi",
+    "fowlkes_mallows_index",
+    "normalized_mutual_information",
+    "adjusted_mutual_information",
+    "homogeneity",
+    "completeness",
+    "v_measure",
+    "bcubed_precision",
+    "bcubed_recall",
+    "generalized_merge_distance",
+    "ClusterDiagnostics",
+    "cluster_diagnostics",
+    "ClusterError",
+    "ClusterErrors",
+    "PairErrors",
+    "to_label_arrays",
+    "to_pair_arrays",
+    "connected_components",
+    "Evaluation",
+    "ConfusionAccumulator",
+    "streaming_confusion",
+    "PrecisionRecallCurve",
+    "precision_recall_curve",
+    "ClusteringCurve",
+    "clustering_curve",
+    "ResolutionTracker",
+    "evaluate_many",
+    "AsyncEvaluator",
+    "GroundTruth",
+    "ConfidenceInterval",
+    "bootstrap",
+    "jackknife",
+    "sample_estimates",
+    "weighted_confusion",
+    "save_partition",
+    "save_pairs",
+    "load_partition",
+    "load_pairs",
+    "load_records",
+    "load_ground_truth",
+    "PhaseRecord",
+    "instrument",
+    "PartialContingency",
+    "shard_of",
+    "write_shards",
+    "count_shard",
+    "evaluate_shards",
 ]
@@ -1,13 +1,16 @@
-import itertools
-from functools import reduce
-from typing import Generator, Hashable
+import math
+from typing import Callable, Hashable, Iterable, NamedTuple
 
 import numpy as np
 
-from pyresolvemetrics._utils import _safe_division, _symmetric_hash
+from pyresolvemetrics._contingency import Contingency, ContingencyCounts
+from pyresolvemetrics._ground_truth import GroundTruth, _contingency
+from pyresolvemetrics._instrumentation import _instrumented
+from pyresolvemetrics._utils import Partition, _safe_division
 
 
-def twi(ground_truth: frozenset[frozenset], result: frozenset[frozenset]) -> float:
+@_instrumented
+def twi(ground_truth: Partition | GroundTruth, result: Partition) -> float:
     """Compute the Talburt-Wang index.
 
     The Talburt-Wang Index (TWI) evaluates the similarity between two partitions
@@ -15,37 +18,30 @@ def twi(ground_truth: frozenset[frozenset], result: frozenset[frozenset]) -> flo
     ratio of the number of overlaps to the total number of subsets in both
     partitions.
 
-    :param ground_truth: a set of sets. Represents the ideal algebraic partition
-        induced by the entity resolution relation over an algebraic set.
-    :param result: a set of sets. Represents the partition produced by the
-        entity resolution task over the same algebraic set as the ground truth.
+    :param ground_truth: a set of sets, or an array holding the ground truth
+        cluster label of each record. Represents the ideal algebraic partition
+        induced by the entity resolution relation over an algebraic set. It
+        may also be indexed beforehand as a :class:`GroundTruth`.
+    :param result: a set of sets, or an array holding the result cluster label
+        of each record. Represents the partition produced by the entity
+        resolution task over the same algebraic set as the ground truth.
 
     :returns: a floating point value between 0.0 and 1.0. A TWI of 1 indicates
         identical partitions, while lower values suggest lesser degrees of
         similarity.
     """
-    numerator = len(ground_truth) * len(result)
-    overlap = reduce(
-        lambda x, _: x + 1,
-        filter(
-            lambda intersection: len(intersection) > 0,
-            itertools.starmap(
-                lambda x, y: x & y, itertools.product(ground_truth, result)
-            ),
-        ),
-        0,
-    )
-    denominator = overlap**2
-    return numerator / denominator if denominator != 0 else 0
+    table = _contingency(ground_truth, result)
+    return _twi(table)
 
 
-def _comb_n_2(value: int) -> int:
-    return (value * (value - 1)) // 2
+def _twi(table: ContingencyCounts) -> float:
+    numerator = table.n_rows * table.n_cols
+    denominator = table.overlap**2
+    return numerator / denominator if denominator != 0 else 0
 
 
-def rand_index(
-    ground_truth: frozenset[frozenset], result: frozenset[frozenset]
-) -> float:
+@_instrumented
+def rand_index(ground_truth: Partition | GroundTruth, result: Partition) -> float:
     r"""Compute the Rand index.
 
     The Rand Index is a measure of similarity between two data clusterings,
@@ -53,38 +49,31 @@ def rand_index(
     pairs that are either clustered together or separately in both partitions
     relative to all possible pairs.
 
-    :param ground_truth: a set of sets. Represents the ideal algebraic partition
-        induced by the entity resolution relation over an algebraic set.
-    :param result: a set of sets. Represents the partition produced by the
-        entity resolution task over the same algebraic set as the ground truth.
+    :param ground_truth: a set of sets, or an array holding the ground truth
+        cluster label of each record. Represents the ideal algebraic partition
+        induced by the entity resolution relation over an algebraic set. It
+        may also be indexed beforehand as a :class:`GroundTruth`.
+    :param result: a set of sets, or an array holding the result cluster label
+        of each record. Represents the partition produced by the entity
+        resolution task over the same algebraic set as the ground truth.
     :returns: a floating point value between 0.0 and 1.0. A Rand index of 1
         indicates perfect pairwise agreement.
     """
+    table = _contingency(ground_truth, result)
+    return _rand_index(table)
 
-    contingency_table = np.array(
-        [
-            [len(gt_cluster & er_cluster) for er_cluster in result]
-            for gt_cluster in ground_truth
-        ],
-        dtype=np.int32,
-    )
-    if len(np.shape(contingency_table)) == 1:
-        return 0
-    comb_2 = np.vectorize(_comb_n_2)
-    tp_fp = np.sum(comb_2(np.sum(contingency_table, axis=0)))
-    tp_fn = np.sum(comb_2(np.sum(contingency_table, axis=1)))
-    tp = np.sum(comb_2(contingency_table))
-    fp = tp_fp - tp
-    fn = tp_fn - tp
-    tn = _comb_n_2(np.sum(contingency_table)) - tp - fp - fn
-    if (tp + tn + fp + fn) == 0:
-        return 0
 
-    return (tp + tn) / (tp + tn + fp + fn)
+def _rand_index(table: ContingencyCounts) -> float:
+    tp = table.cell_pairs
+    fp = table.col_pairs - tp
+    fn = table.row_pairs - tp
+    tn = table.total_pairs - tp - fp - fn
+    return _safe_division(tp + tn, tp + tn + fp + fn)
 
 
+@_instrumented
 def adjusted_rand_index(
-    ground_truth: frozenset[frozenset], result: frozenset[frozenset]
+    ground_truth: Partition | GroundTruth, result: Partition
 ) -> float:
     """Compute the adjusted Rand index.
 
@@ -94,59 +83,36 @@ def adjusted_rand_index(
     more accurate assessment of clustering similarity, especially when dealing
     with random or arbitrary partitions.
 
-    :param ground_truth: a set of sets. Represents the ideal algebraic partition
-        induced by the entity resolution relation over an algebraic set.
-    :param result: a set of sets. Represents the partition produced by the
-        entity resolution task over the same algebraic set as the ground truth.
+    :param ground_truth: a set of sets, or an array holding the ground truth
+        cluster label of each record. Represents the ideal algebraic partition
+        induced by the entity resolution relation over an algebraic set. It
+        may also be indexed beforehand as a :class:`GroundTruth`.
+    :param result: a set of sets, or an array holding the result cluster label
+        of each record. Represents the partition produced by the entity
+        resolution task over the same algebraic set as the ground truth.
 
     :returns: a floating point value between -1.0 and 1.0. An ARI of 1
         indicates perfect pairwise agreement. Negative values indicate that the
         agreement between clusters is less than the one expected to occur
         through random chance (i.e. there is a significant disagreement).
     """
-    initial_data_size = reduce(
-        lambda count, cluster: count + len(cluster), ground_truth, 0
-    )
-    cn2 = _comb_n_2(initial_data_size)
-
-    contingency_table = np.array(
-        [
-            [len(gt_cluster & er_cluster) for er_cluster in result]
-            for gt_cluster in ground_truth
-        ],
-        dtype=np.int32,
-    )
-    a = np.sum(contingency_table, axis=1)
-    b = np.sum(contingency_table, axis=0)
-    comb_2 = np.vectorize(_comb_n_2)
-    x = np.sum(comb_2(contingency_table))
-    y = np.sum(comb_2(a))
-    w = np.sum(comb_2(b))
-    z = (y * w) / cn2
-    if y + w == 2 * z:
-        return 1.0
-    ari = 2 * (x - z) / ((y + w) - 2 * z)
+    table = _contingency(ground_truth, result)
+    return _adjusted_rand_index(table)
 
-    return ari
 
-
-def _cluster_pairs(
-    cluster: frozenset,
-) -> Generator[tuple[Hashable, Hashable], None, None]:
-    yield from itertools.combinations(cluster, 2)
-
-
-def _partition_pair_hashes(
-    input_data: frozenset[frozenset],
-) -> Generator[int, None, None]:
-    yield from map(
-        _symmetric_hash, itertools.chain.from_iterable(map(_cluster_pairs, input_data))
-    )
+def _adjusted_rand_index(table: ContingencyCounts) -> float:
+    cn2 = table.ground_truth_record_pairs
+    x = table.cell_pairs
+    y = table.row_pairs
+    w = table.col_pairs
+    z = _safe_division(y * w, cn2)
+    if y + w == 2 * z:
+        return 1.0
+    return 2 * (x - z) / ((y + w) - 2 * z)
 
 
-def pair_precision(
-    ground_truth: frozenset[frozenset], result: frozenset[frozenset]
-) -> float:
+@_instrumented
+def pair_precision(ground_truth: Partition | GroundTruth, result: Partition) -> float:
     r"""Compute the pair precision over entity resolution clusters.
 
     Pair precision is defined as the number of pairwise combinations of elements
@@ -157,19 +123,26 @@ def pair_precision(
 
         |Pairs(G) \cap Pairs(R)| \over |Pairs(R)|
 
-    :param ground_truth: a set of sets. Represents the ideal algebraic partition
-        induced by the entity resolution relation over an algebraic set.
-    :param result: a set of sets. Represents the partition produced by the
-        entity resolution task over the same algebraic set as the ground truth.
+    The pairs are counted from the contingency table of the two partitions,
+    so no pair is ever enumerated.
+
+    :param ground_truth: a set of sets, or an array holding the ground truth
+        cluster label of each record. Represents the ideal algebraic partition
+        induced by the entity resolution relation over an algebraic set. It
+        may also be indexed beforehand as a :class:`GroundTruth`.
+    :param result: a set of sets, or an array holding the result cluster label
+        of each record. Represents the partition produced by the entity
+        resolution task over the same algebraic set as the ground truth.
     """
-    gt_pairs = set(_partition_pair_hashes(ground_truth))
-    res_pairs = set(_partition_pair_hashes(result))
-    return _safe_division(len(gt_pairs & res_pairs), len(res_pairs))
+    return _pair_precision(_contingency(ground_truth, result))
 
 
-def pair_recall(
-    ground_truth: frozenset[frozenset], result: frozenset[frozenset]
-) -> float:
+def _pair_precision(table: ContingencyCounts) -> float:
+    return _safe_division(table.cell_pairs, table.result_pairs)
+
+
+@_instrumented
+def pair_recall(ground_truth: Partition | GroundTruth, result: Partition) -> float:
     r"""Compute the pair recall over entity resolution clusters.
 
     Pair recall is defined as the number of pairwise combinations of elements
@@ -180,18 +153,27 @@ def pair_recall(
 
         |Pairs(G) \cap Pairs(R)| \over |Pairs(G)|
 
-    :param ground_truth: a set of sets. Represents the ideal algebraic partition
-        induced by the entity resolution relation over an algebraic set.
-    :param result: a set of sets. Represents the partition produced by the
-        entity resolution task over the same algebraic set as the ground truth.
+    The pairs are counted from the contingency table of the two partitions,
+    so no pair is ever enumerated.
+
+    :param ground_truth: a set of sets, or an array holding the ground truth
+        cluster label of each record. Represents the ideal algebraic partition
+        induced by the entity resolution relation over an algebraic set. It
+        may also be indexed beforehand as a :class:`GroundTruth`.
+    :param result: a set of sets, or an array holding the result cluster label
+        of each record. Represents the partition produced by the entity
+        resolution task over the same algebraic set as the ground truth.
     """
-    gt_pairs = set(_partition_pair_hashes(ground_truth))
-    res_pairs = set(_partition_pair_hashes(result))
-    return _safe_division(len(gt_pairs & res_pairs), len(gt_pairs))
+    return _pair_recall(_contingency(ground_truth, result))
+
+
+def _pair_recall(table: ContingencyCounts) -> float:
+    return _safe_division(table.cell_pairs, table.ground_truth_pairs)
 
 
+@_instrumented
 def pair_comparison_measure(
-    ground_truth: frozenset[frozenset], result: frozenset[frozenset]
+    ground_truth: Partition | GroundTruth, result: Partition
 ) -> float:
     r"""Compute the pair comparison measure.
 
@@ -202,18 +184,26 @@ def pair_comparison_measure(
 
         2 \cdot pp \cdot pr \over pp + pr
 
-    :param ground_truth: a set of sets. Represents the ideal algebraic partition
-        induced by the entity resolution relation over an algebraic set.
-    :param result: a set of sets. Represents the partition produced by the
-        entity resolution task over the same algebraic set as the ground truth.
+    :param ground_truth: a set of sets, or an array holding the ground truth
+        cluster label of each record. Represents the ideal algebraic partition
+        induced by the entity resolution relation over an algebraic set. It
+        may also be indexed beforehand as a :class:`GroundTruth`.
+    :param result: a set of sets, or an array holding the result cluster label
+        of each record. Represents the partition produced by the entity
+        resolution task over the same algebraic set as the ground truth.
     """
-    pp = pair_precision(ground_truth, result)
-    pr = pair_recall(ground_truth, result)
+    return _pair_comparison_measure(_contingency(ground_truth, result))
+
+
+def _pair_comparison_measure(table: ContingencyCounts) -> float:
+    pp = _pair_precision(table)
+    pr = _pair_recall(table)
     return _safe_division(2 * pp * pr, pp + pr)
 
 
+@_instrumented
 def cluster_precision(
-    ground_truth: frozenset[frozenset], result: frozenset[frozenset]
+    ground_truth: Partition | GroundTruth, result: Partition
 ) -> float:
     r"""Compute the cluster precision over entity resolution clusters.
 
@@ -225,17 +215,27 @@ def cluster_precision(
 
         |Clusters(G) \cap Clusters(R)| \over |Clusters(R)|
 
-    :param ground_truth: a set of sets. Represents the ideal algebraic partition
-        induced by the entity resolution relation over an algebraic set.
-    :param result: a set of sets. Represents the partition produced by the
-        entity resolution task over the same algebraic set as the ground truth.
+    Common clusters are the cells of the contingency table of the two
+    partitions which hold a whole cluster of both, so the clusters are never
+    hashed and can be given as any collections of records.
+
+    :param ground_truth: a set of sets, or an array holding the ground truth
+        cluster label of each record. Represents the ideal algebraic partition
+        induced by the entity resolution relation over an algebraic set. It
+        may also be indexed beforehand as a :class:`GroundTruth`.
+    :param result: a set of sets, or an array holding the result cluster label
+        of each record. Represents the partition produced by the entity
+        resolution task over the same algebraic set as the ground truth.
     """
-    return _safe_division(len(ground_truth & result), len(result))
+    return _cluster_precision(_contingency(ground_truth, result))
 
 
-def cluster_recall(
-    ground_truth: frozenset[frozenset], result: frozenset[frozenset]
-) -> float:
+def _cluster_precision(table: ContingencyCounts) -> float:
+    return _safe_division(table.exact_matches, table.n_cols)
+
+
+@_instrumented
+def cluster_recall(ground_truth: Partition | GroundTruth, result: Partition) -> float:
     r"""Compute the cluster recall over entity resolution clusters.
 
     Cluster recall is defined as the number of common clusters between
@@ -246,16 +246,28 @@ def cluster_recall(
 
         |Clusters(G) \cap Clusters(R)| \over |Clusters(G)|
 
-    :param ground_truth: a set of sets. Represents the ideal algebraic partition
-        induced by the entity resolution relation over an algebraic set.
-    :param result: a set of sets. Represents the partition produced by the
-        entity resolution task over the same algebraic set as the ground truth.
+    Common clusters are the cells of the contingency table of the two
+    partitions which hold a whole cluster of both, so the clusters are never
+    hashed and can be given as any collections of records.
+
+    :param ground_truth: a set of sets, or an array holding the ground truth
+        cluster label of each record. Represents the ideal algebraic partition
+        induced by the entity resolution relation over an algebraic set. It
+        may also be indexed beforehand as a :class:`GroundTruth`.
+    :param result: a set of sets, or an array holding the result cluster label
+        of each record. Represents the partition produced by the entity
+        resolution task over the same algebraic set as the ground truth.
     """
-    return _safe_division(len(ground_truth & result), len(ground_truth))
+    return _cluster_recall(_contingency(ground_truth, result))
 
 
+def _cluster_recall(table: ContingencyCounts) -> float:
+    return _safe_division(table.exact_matches, table.n_rows)
+
+
+@_instrumented
 def cluster_comparison_measure(
-    ground_truth: frozenset[frozenset], result: frozenset[frozenset]
+    ground_truth: Partition | GroundTruth, result: Partition
 ) -> float:
     r"""Compute the cluster comparison measure.
 
@@ -266,11 +278,515 @@ def cluster_comparison_measure(
 
         2 \cdot cp \cdot cr \over cp + cr
 
-    :param ground_truth: a set of sets. Represents the ideal algebraic partition
-        induced by the entity resolution relation over an algebraic set.
-    :param result: a set of sets. Represents the partition produced by the
-        entity resolution task over the same algebraic set as the ground truth.
+    :param ground_truth: a set of sets, or an array holding the ground truth
+        cluster label of each record. Represents the ideal algebraic partition
+        induced by the entity resolution relation over an algebraic set. It
+        may also be indexed beforehand as a :class:`GroundTruth`.
+    :param result: a set of sets, or an array holding the result cluster label
+        of each record. Represents the partition produced by the entity
+        resolution task over the same algebraic set as the ground truth.
     """
-    cp = cluster_precision(ground_truth, result)
-    cr = cluster_recall(ground_truth, result)
+    return _cluster_comparison_measure(_contingency(ground_truth, result))
+
+
+def _cluster_comparison_measure(table: ContingencyCounts) -> float:
+    cp = _cluster_precision(table)
+    cr = _cluster_recall(table)
     return _safe_division(2 * cp * cr, cp + cr)
+
+
+@_instrumented
+def fowlkes_mallows_index(
+    ground_truth: Partition | GroundTruth, result: Partition
+) -> float:
+    r"""Compute the Fowlkes-Mallows index.
+
+    The Fowlkes-Mallows index is the geometric mean of the pair precision and
+    the pair recall over the records found in both partitions. Given the
+    number of pairs placed together by both partitions (tp), by the result
+    only (fp) and by the ground truth only (fn):
+
+    .. math::
+
+        tp \over \sqrt{(tp + fp) \cdot (tp + fn)}
+
+    :param ground_truth: a set of sets, or an array holding the ground truth
+        cluster label of each record. Represents the ideal algebraic partition
+        induced by the entity resolution relation over an algebraic set. It
+        may also be indexed beforehand as a :class:`GroundTruth`.
+    :param result: a set of sets, or an array holding the result cluster label
+        of each record. Represents the partition produced by the entity
+        resolution task over the same algebraic set as the ground truth.
+    :returns: a floating point value between 0.0 and 1.0, where 1.0 indicates
+        identical partitions.
+    """
+    return _fowlkes_mallows_index(_contingency(ground_truth, result))
+
+
+def _fowlkes_mallows_index(table: ContingencyCounts) -> float:
+    tp = table.cell_pairs
+    if tp == 0:
+        return 0.0
+    return math.sqrt(tp / table.col_pairs) * math.sqrt(tp / table.row_pairs)
+
+
+def _single_clusters(table: Contingency) -> bool:
+    """Whether neither partition divides the shared records."""
+    n_rows = np.count_nonzero(table.row_sums)
+    n_cols = np.count_nonzero(table.col_sums)
+    return n_rows == n_cols and n_rows <= 1
+
+
+@_instrumented
+def normalized_mutual_information(
+    ground_truth: Partition | GroundTruth, result: Partition
+) -> float:
+    r"""Compute the normalized mutual information.
+
+    The mutual information (MI) of the two partitions over the records found in
+    both of them is divided by the arithmetic mean of their entropies, H(G)
+    and H(R).
+
+    .. math::
+
+        MI(G, R) \over (H(G) + H(R)) / 2
+
+    :param ground_truth: a set of sets, or an array holding the ground truth
+        cluster label of each record. Represents the ideal algebraic partition
+        induced by the entity resolution relation over an algebraic set. It
+        may also be indexed beforehand as a :class:`GroundTruth`.
+    :param result: a set of sets, or an array holding the result cluster label
+        of each record. Represents the partition produced by the entity
+        resolution task over the same algebraic set as the ground truth.
+    :returns: a floating point value between 0.0 and 1.0, where 1.0 indicates
+        identical partitions.
+    """
+    return _normalized_mutual_information(_contingency(ground_truth, result))
+
+
+def _normalized_mutual_information(table: Contingency) -> float:
+    if _single_clusters(table):
+        return 1.0
+    information = table.mutual_information
+    if information == 0:
+        return 0.0
+    return information / ((table.ground_truth_entropy + table.result_entropy) / 2)
+
+
+def _expected_mutual_information(
+    row_sums: np.ndarray, col_sums: np.ndarray, total: int
+) -> float:
+    """Expected mutual information of partitions with the given cluster sizes.
+
+    The sum runs over every possible count of shared records between a ground
+    truth and a result cluster, under the hypergeometric model of random
+    partitions. Clusters of equal sizes contribute equally, so the sum only
+    runs over pairs of distinct sizes, weighted by how often they occur.
+    """
+    a_sizes, a_counts = np.unique(row_sums[row_sums > 0], return_counts=True)
+    b_sizes, b_counts = np.unique(col_sums[col_sums > 0], return_counts=True)
+    log_factorial = np.zeros(total + 1)
+    np.cumsum(np.log(np.arange(1, total + 1)), out=log_factorial[1:])
+    expected = 0.0
+    for a, a_count in zip(a_sizes.tolist(), a_counts.tolist()):
+        low = np.maximum(1, a + b_sizes - total)
+        high = np.minimum(a, b_sizes)
+        lengths = np.maximum(high - low + 1, 0)
+        # Every possible count n of each pair of sizes, in a flat array.
+        b = np.repeat(b_sizes, lengths)
+        weights = np.repeat(b_counts, lengths)
+        starts = np.repeat(np.cumsum(lengths) - lengths, lengths)
+        n = np.repeat(low, lengths) + np.arange(len(b)) - starts
+        log_probability = (
+            log_factorial[a]
+            + log_factorial[b]
+            + log_factorial[total - a]
+            + log_factorial[total - b]
+            - log_factorial[total]
+            - log_factorial[n]
+            - log_factorial[a - n]
+            - log_factorial[b - n]
+            - log_factorial[total - a - b + n]
+        )
+        information = n / total * np.log(n * total / (a * b.astype(np.float64)))
+        expected += a_count * float(
+            (weights * information * np.exp(log_probability)).sum()
+        )
+    return expected
+
+
+@_instrumented
+def adjusted_mutual_information(
+    ground_truth: Partition | GroundTruth, result: Partition
+) -> float:
+    r"""Compute the adjusted mutual information.
+
+    The adjusted mutual information (AMI) corrects the mutual information (MI)
+    of the two partitions over the records found in both of them for chance,
+    by subtracting its expected value (EMI) over random partitions with the
+    same cluster sizes. It is normalized by the arithmetic mean of their
+    entropies, H(G) and H(R).
+
+    .. math::
+
+        MI(G, R) - EMI(G, R) \over (H(G) + H(R)) / 2 - EMI(G, R)
+
+    :param ground_truth: a set of sets, or an array holding the ground truth
+        cluster label of each record. Represents the ideal algebraic partition
+        induced by the entity resolution relation over an algebraic set. It
+        may also be indexed beforehand as a :class:`GroundTruth`.
+    :param result: a set of sets, or an array holding the result cluster label
+        of each record. Represents the partition produced by the entity
+        resolution task over the same algebraic set as the ground truth.
+    :returns: a floating point value of at most 1.0, where 1.0 indicates
+        identical partitions and values around 0.0 the agreement of random
+        partitions.
+    """
+    return _adjusted_mutual_information(_contingency(ground_truth, result))
+
+
+def _adjusted_mutual_information(table: Contingency) -> float:
+    if _single_clusters(table):
+        return 1.0
+    expected = _expected_mutual_information(table.row_sums, table.col_sums, table.total)
+    mean_entropy = (table.ground_truth_entropy + table.result_entropy) / 2
+    denominator = mean_entropy - expected
+    epsilon = np.finfo(np.float64).eps
+    if denominator < 0:
+        denominator = min(denominator, -epsilon)
+    else:
+        denominator = max(denominator, epsilon)
+    return (table.mutual_information - expected) / denominator
+
+
+@_instrumented
+def homogeneity(ground_truth: Partition | GroundTruth, result: Partition) -> float:
+    r"""Compute the homogeneity of the result clusters.
+
+    A result is homogeneous when each of its clusters only holds records of a
+    single ground truth cluster. Over the records found in both partitions,
+    homogeneity is the share of the entropy of the ground truth, H(G), which
+    the result explains.
+
+    .. math::
+
+        1 - {H(G | R) \over H(G)}
+
+    :param ground_truth: a set of sets, or an array holding the ground truth
+        cluster label of each record. Represents the ideal algebraic partition
+        induced by the entity resolution relation over an algebraic set. It
+        may also be indexed beforehand as a :class:`GroundTruth`.
+    :param result: a set of sets, or an array holding the result cluster label
+        of each record. Represents the partition produced by the entity
+        resolution task over the same algebraic set as the ground truth.
+    """
+    return _homogeneity(_contingency(ground_truth, result))
+
+
+def _homogeneity(table: Contingency) -> float:
+    if table.ground_truth_entropy == 0:
+        return 1.0
+    return table.mutual_information / table.ground_truth_entropy
+
+
+@_instrumented
+def completeness(ground_truth: Partition | GroundTruth, result: Partition) -> float:
+    r"""Compute the completeness of the result clusters.
+
+    A result is complete when the records of each ground truth cluster are
+    all placed in a single result cluster. Over the records found in both
+    partitions, completeness is the share of the entropy of the result, H(R),
+    which the ground truth explains.
+
+    .. math::
+
+        1 - {H(R | G) \over H(R)}
+
+    :param ground_truth: a set of sets, or an array holding the ground truth
+        cluster label of each record. Represents the ideal algebraic partition
+        induced by the entity resolution relation over an algebraic set. It
+        may also be indexed beforehand as a :class:`GroundTruth`.
+    :param result: a set of sets, or an array holding the result cluster label
+        of each record. Represents the partition produced by the entity
+        resolution task over the same algebraic set as the ground truth.
+    """
+    return _completeness(_contingency(ground_truth, result))
+
+
+def _completeness(table: Contingency) -> float:
+    if table.result_entropy == 0:
+        return 1.0
+    return table.mutual_information / table.result_entropy
+
+
+@_instrumented
+def v_measure(
+    ground_truth: Partition | GroundTruth, result: Partition, beta: float = 1.0
+) -> float:
+    r"""Compute the V-measure.
+
+    The V-measure is the weighted harmonic mean of homogeneity (h) and
+    completeness (c), where completeness is considered ``beta`` times as
+    important as homogeneity.
+
+    .. math::
+
+        (1 + \beta) \cdot h \cdot c \over \beta \cdot h + c
+
+    :param ground_truth: a set of sets, or an array holding the ground truth
+        cluster label of each record. Represents the ideal algebraic partition
+        induced by the entity resolution relation over an algebraic set. It
+        may also be indexed beforehand as a :class:`GroundTruth`.
+    :param result: a set of sets, or an array holding the result cluster label
+        of each record. Represents the partition produced by the entity
+        resolution task over the same algebraic set as the ground truth.
+    :param beta: the relative importance of completeness over homogeneity.
+    """
+    return _v_measure(_contingency(ground_truth, result), beta)
+
+
+def _v_measure(table: Contingency, beta: float = 1.0) -> float:
+    h = _homogeneity(table)
+    c = _completeness(table)
+    return _safe_division((1 + beta) * h * c, beta * h + c)
+
+
+@_instrumented
+def bcubed_precision(ground_truth: Partition | GroundTruth, result: Partition) -> float:
+    r"""Compute the B-cubed precision.
+
+    The precision of a record is the share of the records of its result
+    cluster (R(r)) which belong to its ground truth cluster (G(r)). B-cubed
+    precision averages it over the records of the result, so records missing
+    from the ground truth have a precision of 0.
+
+    .. math::
+
+        {1 \over |R|} \sum_{r} {|G(r) \cap R(r)| \over |R(r)|}
+
+    Records of the same cell of the contingency table share their precision,
+    so the average is computed per cell rather than per record.
+
+    :param ground_truth: a set of sets, or an array holding the ground truth
+        cluster label of each record. Represents the ideal algebraic partition
+        induced by the entity resolution relation over an algebraic set. It
+        may also be indexed beforehand as a :class:`GroundTruth`.
+    :param result: a set of sets, or an array holding the result cluster label
+        of each record. Represents the partition produced by the entity
+        resolution task over the same algebraic set as the ground truth.
+    """
+    return _bcubed_precision(_contingency(ground_truth, result))
+
+
+def _bcubed_precision(table: Contingency) -> float:
+    counts = table.counts.astype(np.float64)
+    correct = (counts**2 / table.result_sizes[table.cols]).sum()
+    return _safe_division(float(correct), int(table.result_sizes.sum()))
+
+
+@_instrumented
+def bcubed_recall(ground_truth: Partition | GroundTruth, result: Partition) -> float:
+    r"""Compute the B-cubed recall.
+
+    The recall of a record is the share of the records of its ground truth
+    cluster (G(r)) which belong to its result cluster (R(r)). B-cubed recall
+    averages it over the records of the ground truth, so records missing from
+    the result have a recall of 0.
+
+    .. math::
+
+        {1 \over |G|} \sum_{r} {|G(r) \cap R(r)| \over |G(r)|}
+
+    Records of the same cell of the contingency table share their recall, so
+    the average is computed per cell rather than per record.
+
+    :param ground_truth: a set of sets, or an array holding the ground truth
+        cluster label of each record. Represents the ideal algebraic partition
+        induced by the entity resolution relation over an algebraic set. It
+        may also be indexed beforehand as a :class:`GroundTruth`.
+    :param result: a set of sets, or an array holding the result cluster label
+        of each record. Represents the partition produced by the entity
+        resolution task over the same algebraic set as the ground truth.
+    """
+    return _bcubed_recall(_contingency(ground_truth, result))
+
+
+def _bcubed_recall(table: Contingency) -> float:
+    counts = table.counts.astype(np.float64)
+    correct = (counts**2 / table.ground_truth_sizes[table.rows]).sum()
+    return _safe_division(float(correct), table.ground_truth_records)
+
+
+MergeCost = Callable[[np.ndarray, np.ndarray], np.ndarray | float]
+
+
+def _unit_cost(x: np.ndarray, y: np.ndarray) -> float:
+    return 1.0
+
+
+def _preceding(values: np.ndarray, groups: np.ndarray) -> np.ndarray:
+    """Sum the values preceding each one within its run of equal groups."""
+    if len(values) == 0:
+        return values
+    before = np.cumsum(values) - values
+    starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+    lengths = np.diff(np.r_[starts, len(groups)])
+    return before - np.repeat(before[starts], lengths)
+
+
+@_instrumented
+def generalized_merge_distance(
+    ground_truth: Partition | GroundTruth,
+    result: Partition,
+    merge_cost: MergeCost = _unit_cost,
+    split_cost: MergeCost = _unit_cost,
+) -> float:
+    r"""Compute the generalized merge distance.
+
+    The generalized merge distance (GMD) is the cost of the cheapest sequence
+    of cluster splits and merges turning the result into the ground truth,
+    over the records found in both partitions. Each result cluster is split
+    into its intersections with the ground truth clusters, which are then
+    merged back together. The cost of splitting a cluster into parts of
+    sizes ``x`` and ``y``, or of merging such parts, is given by the cost
+    functions. By default, every operation costs 1.
+
+    The operations are read off the contingency table of the two partitions,
+    in a single pass over its cells.
+
+    :param ground_truth: a set of sets, or an array holding the ground truth
+        cluster label of each record. Represents the ideal algebraic partition
+        induced by the entity resolution relation over an algebraic set. It
+        may also be indexed beforehand as a :class:`GroundTruth`.
+    :param result: a set of sets, or an array holding the result cluster label
+        of each record. Represents the partition produced by the entity
+        resolution task over the same algebraic set as the ground truth.
+    :param merge_cost: the cost of merging clusters of sizes ``x`` and ``y``.
+        It receives arrays of sizes and returns an array of costs, or a
+        constant cost.
+    :param split_cost: the cost of splitting a cluster into parts of sizes
+        ``x`` and ``y``, in the same form as ``merge_cost``.
+    """
+    return _generalized_merge_distance(
+        _contingency(ground_truth, result), merge_cost, split_cost
+    )
+
+
+def _generalized_merge_distance(
+    table: Contingency,
+    merge_cost: MergeCost = _unit_cost,
+    split_cost: MergeCost = _unit_cost,
+) -> float:
+    # Result clusters are visited in turn: each one is split into its cells,
+    # and every cell is merged with the earlier cells of its ground truth
+    # cluster.
+    order = np.lexsort((table.rows, table.cols))
+    rows, cols, counts = table.rows[order], table.cols[order], table.counts[order]
+    split = _preceding(counts, cols)
+    by_row = np.argsort(rows, kind="stable")
+    merged = np.empty_like(counts)
+    merged[by_row] = _preceding(counts[by_row], rows[by_row])
+
+    cost = 0.0
+    for sizes, cost_function in ((split, split_cost), (merged, merge_cost)):
+        later = sizes > 0
+        x, y = counts[later], sizes[later]
+        cost += float(np.broadcast_to(cost_function(x, y), x.shape).sum())
+    return cost
+
+
+class ClusterDiagnostics(NamedTuple):
+    """The clusters of a result, compared with those of its ground truth.
+
+    Clusters given as label arrays are identified by their labels, whereas
+    clusters of sets of sets are identified by their position in the
+    iteration order of their partition.
+
+    :param matched: pairs of a ground truth cluster and the identical result
+        cluster.
+    :param split: ground truth clusters whose records are spread over several
+        result clusters.
+    :param merged: result clusters which hold records of several ground truth
+        clusters.
+    """
+
+    matched: list[tuple[Hashable, Hashable]]
+    split: list[Hashable]
+    merged: list[Hashable]
+
+
+def cluster_diagnostics(
+    ground_truth: Partition | GroundTruth, result: Partition
+) -> ClusterDiagnostics:
+    """List the clusters which a result matched exactly, split and merged.
+
+    The clusters are read off the contingency table which the cluster metrics
+    count exact matches from.
+
+    :param ground_truth: a set of sets, or an array holding the ground truth
+        cluster label of each record. Represents the ideal algebraic partition
+        induced by the entity resolution relation over an algebraic set. It
+        may also be indexed beforehand as a :class:`GroundTruth`.
+    :param result: a set of sets, or an array holding the result cluster label
+        of each record. Represents the partition produced by the entity
+        resolution task over the same algebraic set as the ground truth.
+    """
+    return _cluster_diagnostics(_contingency(ground_truth, result))
+
+
+def _identify(clusters: np.ndarray, labels: np.ndarray | None) -> list[Hashable]:
+    return (clusters if labels is None else labels[clusters]).tolist()
+
+
+def _cluster_diagnostics(table: Contingency) -> ClusterDiagnostics:
+    rows, cols = table.matched_clusters()
+    return ClusterDiagnostics(
+        matched=list(
+            zip(
+                _identify(rows, table.ground_truth_labels),
+                _identify(cols, table.result_labels),
+            )
+        ),
+        split=_identify(table.split_clusters(), table.ground_truth_labels),
+        merged=_identify(table.merged_clusters(), table.result_labels),
+    )
+
+
+_METRICS = {
+    "pair_precision": _pair_precision,
+    "pair_recall": _pair_recall,
+    "pair_comparison_measure": _pair_comparison_measure,
+    "cluster_precision": _cluster_precision,
+    "cluster_recall": _cluster_recall,
+    "cluster_comparison_measure": _cluster_comparison_measure,
+    "rand_index": _rand_index,
+    "adjusted_rand_index": _adjusted_rand_index,
+    "twi": _twi,
+    "fowlkes_mallows_index": _fowlkes_mallows_index,
+}
+
+# Metrics which need the cells of a whole contingency table, rather than the
+# aggregate counts which are also maintained incrementally and resampled.
+_TABLE_METRICS = {
+    "normalized_mutual_information": _normalized_mutual_information,
+    "adjusted_mutual_information": _adjusted_mutual_information,
+    "homogeneity": _homogeneity,
+    "completeness": _completeness,
+    "v_measure": _v_measure,
+    "bcubed_precision": _bcubed_precision,
+    "bcubed_recall": _bcubed_recall,
+    "generalized_merge_distance": _generalized_merge_distance,
+}
+
+_ALL_METRICS = {**_METRICS, **_TABLE_METRICS}
+
+
+def _select_metrics(
+    metrics: Iterable[str] | None, available: dict = _ALL_METRICS
+) -> tuple[str, ...]:
+    """Validate the names of algebraic metrics, defaulting to all of them."""
+    metrics = tuple(available if metrics is None else metrics)
+    unknown = set(metrics) - set(available)
+    if unknown:
+        raise ValueError(f"unknown metrics: {', '.join(sorted(unknown))}")
+    return metrics
@@ -0,0 +1,249 @@
+import asyncio
+import functools
+import math
+from collections import OrderedDict
+from collections.abc import Sized
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Callable, Hashable, Iterable
+
+import numpy as np
+
+from pyresolvemetrics import _algebraic, _probabilistic
+from pyresolvemetrics._evaluation import Evaluation
+from pyresolvemetrics._ground_truth import GroundTruth
+
+_PAIR_METRICS = (
+    "confusion",
+    "precision",
+    "recall",
+    "f1",
+    "f_beta",
+    "jaccard_index",
+)
+_PARTITION_METRICS = (
+    "pair_precision",
+    "pair_recall",
+    "pair_comparison_measure",
+    "cluster_precision",
+    "cluster_recall",
+    "cluster_comparison_measure",
+    "rand_index",
+    "adjusted_rand_index",
+    "twi",
+    "fowlkes_mallows_index",
+    "normalized_mutual_information",
+    "adjusted_mutual_information",
+    "homogeneity",
+    "completeness",
+    "v_measure",
+    "bcubed_precision",
+    "bcubed_recall",
+    "generalized_merge_distance",
+    "cluster_diagnostics",
+)
+
+
+def _records(value, limit: int) -> float:
+    """Count the records of an input, or the items of its pairs.
+
+    Counting stops once it exceeds ``limit``. Inputs which can only be
+    iterated once are not counted, and are deemed larger than any limit.
+    """
+    if value is None:
+        return 0
+    if isinstance(value, GroundTruth):
+        if value._partition is not None:
+            return int(value._partition.sizes.sum())
+        return 2 * len(value._pairs.keys)
+    if isinstance(value, np.ndarray):
+        return value.size
+    if not isinstance(value, Sized):
+        return math.inf
+    total = 0
+    for item in value:
+        if isinstance(item, str) or not isinstance(item, Sized):
+            return len(value)  # labels, or counts of outcomes
+        total += len(item)
+        if total > limit:
+            break
+    return total
+
+
+def _compute_all(
+    ground_truth, result, metrics: tuple[str, ...] | None
+) -> dict[str, float]:
+    return Evaluation(ground_truth, result).compute_all(metrics)
+
+
+class AsyncEvaluator:
+    """Compute metrics from asyncio code without blocking the event loop.
+
+    Every metric of the package has a coroutine counterpart of the same name,
+    e.g. ``await evaluator.adjusted_rand_index(ground_truth, result)``, which
+    also takes the ``key`` of the ground truth in the cache of indexes.
+    Evaluations of few records run right away on the event loop, where an
+    executor round trip would cost more than the work. Larger ones run in the
+    executor, after the ground truth is indexed once: concurrent requests for
+    the same ground truth wait for a single index, which is then cached.
+
+    Cancelling a request returns control to its caller at once and drops work
+    which did not start yet. Work already running in the executor cannot be
+    interrupted; it completes in the background and its outcome is discarded.
+
+    :param executor: runs the evaluations, by default a pool of threads owned
+        by the evaluator, which NumPy mostly lets run in parallel. With a pool
+        of processes, ground truths and results are pickled for every request,
+        unless the ground truth is mapped from a file by
+        :func:`load_ground_truth`.
+    :param inline_records: the largest number of records of the ground truth
+        and the result, combined, which is evaluated on the event loop. The
+        records of pairs are counted once per pair they appear in.
+    :param cache_size: the number of indexed ground truths kept, least
+        recently used first out.
+    """
+
+    def __init__(
+        self,
+        executor: Executor | None = None,
+        inline_records: int = 10_000,
+        cache_size: int = 8,
+    ) -> None:
+        self._owned = executor is None
+        self._executor = executor
+        self.inline_records = inline_records
+        self.cache_size = cache_size
+        # Key -> (ground truth, future index). The ground truth is kept so that
+        # its id, the default key, cannot be reused while it is cached.
+        self._indexes: OrderedDict[Hashable, tuple[Any, asyncio.Future]] = OrderedDict()
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(thread_name_prefix="pyresolvemetrics")
+        return self._executor
+
+    async def run(self, function: Callable, *args, **kwargs) -> Any:
+        """Call any function of the package in the executor.
+
+        Use it for work without a counterpart, e.g. :func:`bootstrap`.
+        """
+        loop = asyncio.get_running_loop()
+        call = functools.partial(function, *args, **kwargs)
+        return await loop.run_in_executor(self.executor, call)
+
+    async def index(
+        self, ground_truth, kind: str = "partition", key: Hashable | None = None
+    ) -> GroundTruth:
+        """Index a ground truth once, however many requests ask for it.
+
+        :param ground_truth: a partition or a set of pairs, as accepted by
+            :meth:`GroundTruth.from_partition` and :meth:`GroundTruth.from_pairs`.
+        :param kind: ``"partition"`` or ``"pairs"``, how to index it.
+        :param key: identifies the ground truth in the cache, e.g. the path it
+            was read from, so that equal copies share an index. The identity of
+            the ``ground_truth`` object by default, so that only requests for
+            the very same object share an index.
+        """
+        if isinstance(ground_truth, GroundTruth):
+            return ground_truth
+        if kind not in ("partition", "pairs"):
+            raise ValueError(f"unknown kind of ground truth: {kind}")
+        if key is None:
+            key = (kind, "object", id(ground_truth))
+            entry = self._indexes.get(key)
+            if entry is not None and entry[0] is not ground_truth:
+                entry = None
+        else:
+            key = (kind, "key", key)
+            entry = self._indexes.get(key)
+        if entry is None:
+            build = (
+                GroundTruth.from_partition
+                if kind == "partition"
+                else GroundTruth.from_pairs
+            )
+            future = asyncio.ensure_future(self.run(build, ground_truth))
+            future.add_done_callback(functools.partial(self._forget_failure, key))
+            entry = self._indexes[key] = (ground_truth, future)
+            while len(self._indexes) > self.cache_size:
+                self._indexes.popitem(last=False)
+        else:
+            self._indexes.move_to_end(key)
+        # A cancelled request must not cancel the index other requests await.
+        return await asyncio.shield(entry[1])
+
+    def _forget_failure(self, key: Hashable, future: asyncio.Future) -> None:
+        if future.cancelled() or future.exception() is not None:
+            entry = self._indexes.get(key)
+            if entry is not None and entry[1] is future:
+                del self._indexes[key]
+
+    async def _evaluate(
+        self,
+        kind: str,
+        function: Callable,
+        ground_truth,
+        result,
+        key: Hashable | None = None,
+        **kwargs,
+    ) -> Any:
+        limit = self.inline_records
+        if _records(ground_truth, limit) + _records(result, limit) <= limit:
+            return function(ground_truth, result, **kwargs)
+        if result is not None:
+            ground_truth = await self.index(ground_truth, kind, key)
+        return await self.run(function, ground_truth, result, **kwargs)
+
+    async def compute_all(
+        self,
+        ground_truth,
+        result,
+        metrics: Iterable[str] | None = None,
+        key: Hashable | None = None,
+    ) -> dict[str, float]:
+        """Compute the algebraic metrics of :meth:`Evaluation.compute_all`.
+
+        :param key: identifies the ground truth in the cache, see :meth:`index`.
+        """
+        metrics = None if metrics is None else tuple(metrics)
+        return await self._evaluate(
+            "partition", _compute_all, ground_truth, result, key, metrics=metrics
+        )
+
+    def close(self) -> None:
+        """Shut down the executor, if the evaluator created it."""
+        self._indexes.clear()
+        if self._owned and self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    async def __aenter__(self) -> "AsyncEvaluator":
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        self.close()
+
+
+def _counterpart(kind: str, function: Callable) -> Callable:
+    @functools.wraps(function)
+    async def counterpart(
+        self: AsyncEvaluator, ground_truth, result=None, *, key=None, **kwargs
+    ):
+        return await self._evaluate(kind, function, ground_truth, result, key, **kwargs)
+
+    counterpart.__doc__ = (
+        f"Compute :func:`{function.__name__}` without blocking the event loop.\n\n"
+        ":param key: identifies the ground truth in the cache, see "
+        ":meth:`AsyncEvaluator.index`."
+    )
+    return counterpart
+
+
+for _name in _PAIR_METRICS:
+    setattr(
+        AsyncEvaluator, _name, _counterpart("pairs", getattr(_probabilistic, _name))
+    )
+for _name in _PARTITION_METRICS:
+    setattr(
+        AsyncEvaluator, _name, _counterpart("partition", getattr(_algebraic, _name))
+    )
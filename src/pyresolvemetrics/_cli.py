@@ -0,0 +1,344 @@
+"""Command line evaluation of entity resolution results.
+
+Evaluate every result file of a directory against a ground truth and print
+the metrics as JSON::
+
+    $ pyresolvemetrics --kind partition gt.jsonl results/ --workers 4
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+from typing import Callable, Hashable, Iterable, Iterator, Sequence
+
+import numpy as np
+
+from pyresolvemetrics._algebraic import _select_metrics
+from pyresolvemetrics._contingency import _PartitionIndex
+from pyresolvemetrics._evaluation import Evaluation
+from pyresolvemetrics._ground_truth import GroundTruth
+from pyresolvemetrics._parallel import _process_pool, _shared
+from pyresolvemetrics._probabilistic import precision, recall, f1
+from pyresolvemetrics._readers import (
+    FORMATS,
+    PathLike,
+    detect_format,
+    prefetch,
+    read_assignments,
+    read_pairs,
+)
+from pyresolvemetrics._storage import (
+    _read_header,
+    load_ground_truth,
+    load_pairs,
+    load_partition,
+    load_records,
+)
+from pyresolvemetrics._streaming import ConfusionAccumulator
+
+KINDS = ("pairs", "partition")
+PAIR_METRICS = {"precision": precision, "recall": recall, "f1": f1}
+
+
+class _Reference:
+    """A ground truth read from a file, along with the ids of its records.
+
+    ``ids`` maps the identifier of each record to its position, or is ``None``
+    when records are identified by their positions.
+    """
+
+    def __init__(
+        self, kind: str, ground_truth: GroundTruth, ids: dict[Hashable, int] | None
+    ) -> None:
+        self.kind = kind
+        self.ground_truth = ground_truth
+        self.ids = ids
+
+
+def _format(path: PathLike, format: str | None) -> str:
+    return detect_format(path) if format is None else format
+
+
+def _kind(path: PathLike, format: str, kind: str | None) -> str:
+    if format == "binary":
+        stored = _read_header(path)[0]["kind"]
+        if stored not in KINDS:
+            raise ValueError(f"{os.fspath(path)} holds neither pairs nor a partition")
+        if kind is not None and kind != stored:
+            raise ValueError(f"{os.fspath(path)} does not hold {kind}")
+        return stored
+    if kind is None:
+        raise ValueError("the kind of text inputs must be given with --kind")
+    return kind
+
+
+def _record_ids(path: PathLike) -> dict[Hashable, int] | None:
+    records = load_records(path)
+    return None if records is None else dict(zip(records, range(len(records))))
+
+
+def read_ground_truth(
+    path: PathLike,
+    format: str | None = None,
+    kind: str | None = None,
+    chunk_size: int = 100_000,
+) -> _Reference:
+    """Read and index a ground truth file."""
+    format = _format(path, format)
+    kind = _kind(path, format, kind)
+    if format == "binary":
+        if kind == "partition":
+            return _Reference(kind, load_ground_truth(path), _record_ids(path))
+        records = _read_header(path)[0]["records"] is not None
+        ground_truth = load_ground_truth(path, records=records)
+        ids = ground_truth._pairs.interner.ids if records else None
+        return _Reference(kind, ground_truth, ids)
+    if kind == "pairs":
+        chunks = read_pairs(path, format, chunk_size)
+        ground_truth = GroundTruth.from_pairs(itertools.chain.from_iterable(chunks))
+        return _Reference(kind, ground_truth, ground_truth._pairs.interner.ids)
+    ids: dict[Hashable, int] = {}
+
+    def _number(records: Sequence[Hashable]) -> np.ndarray:
+        return np.fromiter(
+            (ids.setdefault(record, len(ids)) for record in records),
+            dtype=np.int64,
+            count=len(records),
+        )
+
+    codes = _assign(read_assignments(path, format, chunk_size), _number, 0)
+    return _Reference(kind, GroundTruth.from_partition(codes), ids)
+
+
+def _locator(
+    ids: dict[Hashable, int] | None,
+) -> Callable[[Sequence[Hashable]], np.ndarray]:
+    """Look up the positions of records, numbering unknown ones after the rest."""
+    if ids is None:
+        return lambda records: np.asarray(records, dtype=np.int64)
+    unknown: dict[Hashable, int] = {}
+    n = len(ids)
+
+    def _locate(records: Sequence[Hashable]) -> np.ndarray:
+        positions = np.fromiter(
+            map(ids.get, records, itertools.repeat(-1)),
+            dtype=np.int64,
+            count=len(records),
+        )
+        for missing in np.flatnonzero(positions < 0).tolist():
+            record = records[missing]
+            positions[missing] = unknown.setdefault(record, n + len(unknown))
+        return positions
+
+    return _locate
+
+
+def _assign(
+    chunks: Iterable[tuple[Sequence[Hashable], Sequence[int]]],
+    locate: Callable[[Sequence[Hashable]], np.ndarray],
+    n_records: int,
+) -> np.ndarray:
+    """Gather chunks of cluster assignments into an array of labels."""
+    positions, labels = [np.empty(0, dtype=np.int64)], [np.empty(0, dtype=np.int64)]
+    for records, chunk_labels in chunks:
+        positions.append(locate(records))
+        labels.append(np.asarray(chunk_labels, dtype=np.int64))
+    positions = np.concatenate(positions)
+    if len(positions):
+        n_records = max(n_records, int(positions.max()) + 1)
+    codes = np.full(n_records, -1, dtype=np.int64)
+    codes[positions] = np.concatenate(labels)
+    return codes
+
+
+def _labels(
+    reference: _Reference, path: PathLike, format: str, chunk_size: int
+) -> np.ndarray:
+    """Read the cluster labels of a result, aligned with the ground truth.
+
+    Records missing from the ground truth are numbered after its own.
+    """
+    n_records = len(reference.ground_truth._partition_index().codes)
+    if format != "binary":
+        chunks = read_assignments(path, format, chunk_size)
+        return _assign(chunks, _locator(reference.ids), n_records)
+    codes = load_partition(path)
+    records = load_records(path)
+    if records is None and reference.ids is None:
+        return codes
+    if records is None:
+        records = range(len(codes))
+    return _assign([(records, codes)], _locator(reference.ids), n_records)
+
+
+def _evaluate_partition(
+    reference: _Reference, labels: np.ndarray, metrics: Sequence[str]
+) -> dict[str, float]:
+    ground_truth = reference.ground_truth
+    index = ground_truth._partition_index()
+    if len(labels) > len(index.codes):
+        # Records missing from the ground truth are labelled -1 there.
+        codes = np.full(len(labels), -1, dtype=np.int64)
+        codes[: len(index.codes)] = index.codes
+        ground_truth = GroundTruth(
+            partition=_PartitionIndex.from_codes(codes, index.sizes)
+        )
+    elif len(labels) < len(index.codes):
+        labels = np.concatenate([labels, np.full(len(index.codes) - len(labels), -1)])
+    return Evaluation(ground_truth, labels).compute_all(metrics)
+
+
+def _pair_chunks(
+    reference: _Reference, path: PathLike, format: str, chunk_size: int
+) -> Iterator:
+    if format != "binary":
+        return read_pairs(path, format, chunk_size)
+    pairs = load_pairs(path)
+    records = load_records(path)
+    chunks = (
+        pairs[start : start + chunk_size] for start in range(0, len(pairs), chunk_size)
+    )
+    if records is None:
+        return prefetch(np.asarray(chunk, dtype=np.int64) for chunk in chunks)
+    return prefetch(
+        [(records[low], records[high]) for low, high in chunk.tolist()]
+        for chunk in chunks
+    )
+
+
+def _evaluate_pairs(
+    reference: _Reference,
+    path: PathLike,
+    format: str,
+    metrics: Sequence[str],
+    chunk_size: int,
+) -> dict[str, float]:
+    accumulator = ConfusionAccumulator(reference.ground_truth, distinct=True)
+    for chunk in _pair_chunks(reference, path, format, chunk_size):
+        accumulator.update(chunk)
+    counts = accumulator.confusion
+    return {
+        **counts._asdict(),
+        **{name: PAIR_METRICS[name](counts) for name in metrics},
+    }
+
+
+def evaluate_file(
+    reference: _Reference,
+    path: PathLike,
+    format: str | None = None,
+    metrics: Sequence[str] | None = None,
+    chunk_size: int = 100_000,
+) -> dict[str, float]:
+    """Evaluate a result file against a ground truth read beforehand.
+
+    The outcome counts of pairs are always reported, along with the chosen
+    ``metrics`` among those of ``PAIR_METRICS``. Partitions are scored with
+    the chosen metrics of :attr:`Evaluation.METRICS`.
+    """
+    format = _format(path, format)
+    _kind(path, format, reference.kind)
+    if reference.kind == "pairs":
+        metrics = _select_metrics(metrics, PAIR_METRICS)
+        return _evaluate_pairs(reference, path, format, metrics, chunk_size)
+    labels = _labels(reference, path, format, chunk_size)
+    return _evaluate_partition(reference, labels, _select_metrics(metrics))
+
+
+def _evaluate_shared(path: str, options: dict) -> dict[str, float]:
+    return evaluate_file(_shared(), path, **options)
+
+
+def _result_paths(paths: Sequence[str]) -> list[str]:
+    """List the result files, expanding directories into the files they hold."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(
+                os.path.join(path, name)
+                for name in sorted(os.listdir(path))
+                if os.path.isfile(os.path.join(path, name))
+            )
+        else:
+            files.append(path)
+    return files
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="pyresolvemetrics",
+        description="Evaluate entity resolution results against a ground truth.",
+    )
+    parser.add_argument("ground_truth", help="the ground truth file")
+    parser.add_argument(
+        "results", nargs="+", help="result files, or directories of result files"
+    )
+    parser.add_argument(
+        "--kind",
+        choices=KINDS,
+        help="whether the text files hold matching pairs or clusters; binary "
+        "files record it themselves",
+    )
+    parser.add_argument(
+        "--format",
+        choices=FORMATS,
+        help="the format of every file, told from its contents or extension "
+        "by default",
+    )
+    parser.add_argument(
+        "--metrics",
+        nargs="+",
+        choices=(*Evaluation.METRICS, *PAIR_METRICS),
+        help="the metrics to compute, all those of the kind of inputs by default",
+    )
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--chunk-size", type=int, default=100_000)
+    parser.add_argument("--output", help="the JSON file to write, stdout by default")
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = _parser()
+    args = parser.parse_args(argv)
+    try:
+        reference = read_ground_truth(
+            args.ground_truth, args.format, args.kind, args.chunk_size
+        )
+        available = PAIR_METRICS if reference.kind == "pairs" else Evaluation.METRICS
+        unknown = sorted(set(args.metrics or ()) - set(available))
+        if unknown:
+            parser.error(f"{', '.join(unknown)} cannot score {reference.kind}")
+        paths = _result_paths(args.results)
+        options = {
+            "format": args.format,
+            "metrics": args.metrics,
+            "chunk_size": args.chunk_size,
+        }
+        if args.workers <= 1:
+            evaluations = [evaluate_file(reference, path, **options) for path in paths]
+        else:
+            with _process_pool(args.workers, reference) as pool:
+                evaluations = list(
+                    pool.map(_evaluate_shared, paths, itertools.repeat(options))
+                )
+    except (OSError, ValueError, TypeError) as error:
+        print(f"pyresolvemetrics: {error}", file=sys.stderr)
+        return 2
+
+    report = {
+        "ground_truth": args.ground_truth,
+        "kind": reference.kind,
+        "results": [
+            {"path": path, "metrics": metrics}
+            for path, metrics in zip(paths, evaluations)
+        ],
+    }
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+    return 0
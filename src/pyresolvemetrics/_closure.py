@@ -0,0 +1,109 @@
+from typing import Hashable, Iterable
+
+import numpy as np
+
+from pyresolvemetrics._pairs import _Interner, _MAX_RECORD_ID
+from pyresolvemetrics._utils import Pairs
+
+
+def _roots(parent: np.ndarray) -> np.ndarray:
+    """Point every record of a forest straight at the root of its tree."""
+    while True:
+        grandparent = parent[parent]
+        if np.array_equal(grandparent, parent):
+            return parent
+        parent = grandparent
+
+
+def _link(parent: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """Merge the trees joined by a chunk of edges.
+
+    The trees are hooked onto each other a whole array of edges at a time:
+    the root with the higher id of every edge which still joins two trees is
+    pointed at the lowest root it is joined to. Roots only ever point at lower
+    ids, so no cycle can form. The roots which several edges joined to the
+    same higher root get linked through it in the next round.
+    """
+    low, high = edges[:, 0], edges[:, 1]
+    while len(low):
+        low, high = parent[low], parent[high]
+        joined = low != high
+        low, high = low[joined], high[joined]
+        low, high = np.minimum(low, high), np.maximum(low, high)
+        np.minimum.at(parent, high, low)
+        parent = _roots(parent)
+    return parent
+
+
+def _grow(parent: np.ndarray, size: int) -> np.ndarray:
+    if size <= len(parent):
+        return parent
+    return np.concatenate([parent, np.arange(len(parent), size, dtype=np.int64)])
+
+
+def _label_components(
+    chunks: Iterable[np.ndarray], n_records: int | None
+) -> np.ndarray:
+    parent = np.arange(n_records or 0, dtype=np.int64)
+    for chunk in chunks:
+        edges = np.asarray(chunk)
+        if edges.ndim != 2 or edges.shape[1] != 2:
+            raise ValueError("pair arrays must have the shape (m, 2)")
+        if len(edges) == 0:
+            continue
+        if edges.min() < 0 or edges.max() > _MAX_RECORD_ID:
+            raise ValueError(f"record ids must be between 0 and {_MAX_RECORD_ID}")
+        parent = _link(_grow(parent, int(edges.max()) + 1), edges.astype(np.int64))
+    return parent
+
+
+def _holds_pairs(pairs) -> bool:
+    """Tell a collection of pairs apart from an iterable of chunks of pairs."""
+    if isinstance(pairs, (set, frozenset)):
+        return True
+    return (
+        isinstance(pairs, (list, tuple))
+        and len(pairs) > 0
+        and not isinstance(pairs[0], np.ndarray)
+    )
+
+
+def connected_components(
+    pairs: Pairs | Iterable[np.ndarray],
+    records: int | Iterable[Hashable] | None = None,
+) -> np.ndarray | frozenset[frozenset]:
+    """Group the records linked by matching pairs into clusters.
+
+    This is the transitive closure of the pairs: two records end up in the
+    same cluster when a chain of pairs links them. The output can be handed to
+    the algebraic metrics, in the same form as the input.
+
+    Pair arrays are merged in rounds of vectorized union-find over an array
+    holding a parent id for every record, so memory is bounded by the number
+    of records and the size of the largest chunk, however many pairs there
+    are. The label of each cluster is the lowest id of its records.
+
+    :param pairs: an ``(m, 2)`` array of integer record ids, an iterable of
+        such arrays holding the pairs in chunks, or a set of pairs of
+        ``Hashable`` items.
+    :param records: the records which belong to a cluster even when they are
+        in no pair: the number of records for pair arrays, or the identifiers
+        of the records for other pairs.
+    :returns: for pair arrays, the cluster label of each record id below the
+        number of ``records`` or the highest id in a pair; otherwise, a set of
+        sets.
+    """
+    if isinstance(pairs, np.ndarray):
+        return _label_components([pairs], records)
+    if not _holds_pairs(pairs):
+        return _label_components(pairs, records)
+    interner = _Interner()
+    edges = interner.pair_ids(pairs)
+    if records is not None:
+        for item in records:
+            interner.ids.setdefault(item, len(interner.ids))
+    labels = _label_components([edges], len(interner.ids))
+    clusters: dict[int, list[Hashable]] = {}
+    for item, label in zip(interner.ids, labels.tolist()):
+        clusters.setdefault(label, []).append(item)
+    return frozenset(map(frozenset, clusters.values()))
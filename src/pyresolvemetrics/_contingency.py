@@ -0,0 +1,428 @@
+from collections import Counter
+from functools import cached_property
+from typing import Collection, Hashable, Iterable, Protocol
+
+import numpy as np
+
+from pyresolvemetrics._instrumentation import _phase
+from pyresolvemetrics._pairs import _Interner, _pair_keys
+from pyresolvemetrics._utils import Pairs, _comb_n_2
+
+
+class ContingencyCounts(Protocol):
+    """Aggregate counts of a contingency table which the metrics derive from.
+
+    Counts of shared records only consider the records found in both
+    partitions, whereas cluster sizes are the full sizes of the clusters.
+    """
+
+    n_rows: int  # clusters in the ground truth
+    n_cols: int  # clusters in the result
+    overlap: int  # non-empty intersections between clusters
+    total: int  # shared records
+    total_pairs: int  # pairs of shared records
+    cell_pairs: int  # pairs of shared records placed together by both
+    row_pairs: int  # pairs of shared records placed together by the ground truth
+    col_pairs: int  # pairs of shared records placed together by the result
+    ground_truth_records: int  # records in the ground truth
+    ground_truth_record_pairs: int  # pairs of records in the ground truth
+    ground_truth_pairs: int  # pairs placed together by the ground truth
+    result_pairs: int  # pairs placed together by the result
+    exact_matches: int  # clusters found identically in both partitions
+
+
+class Contingency:
+    """Sparse contingency table between two partitions of a set of records.
+
+    Only the non-empty intersections are stored, in coordinate form: the
+    ``k``-th cell says that ground truth cluster ``rows[k]`` and result cluster
+    ``cols[k]`` have ``counts[k]`` records in common. Clusters are numbered in
+    the iteration order of their partition and their full sizes are kept in
+    ``ground_truth_sizes`` and ``result_sizes``. Clusters given as label
+    arrays are numbered in ascending order of their labels, which are kept in
+    ``ground_truth_labels`` and ``result_labels``.
+    """
+
+    def __init__(
+        self,
+        rows: np.ndarray,
+        cols: np.ndarray,
+        counts: np.ndarray,
+        ground_truth_sizes: np.ndarray,
+        result_sizes: np.ndarray,
+        ground_truth_labels: np.ndarray | None = None,
+        result_labels: np.ndarray | None = None,
+    ) -> None:
+        self.rows = rows
+        self.cols = cols
+        self.counts = counts
+        self.ground_truth_sizes = ground_truth_sizes
+        self.result_sizes = result_sizes
+        self.ground_truth_labels = ground_truth_labels
+        self.result_labels = result_labels
+
+    @classmethod
+    def from_partitions(
+        cls,
+        ground_truth: Iterable[Collection[Hashable]],
+        result: Iterable[Collection[Hashable]],
+    ) -> "Contingency":
+        """Build the table in a single pass over the records of both partitions.
+
+        Each record is mapped to the label of its ground truth cluster once,
+        after which every result cluster only needs to count the labels of its
+        members. The cost is linear in the number of records.
+        """
+        return _PartitionIndex(ground_truth).contingency(result)
+
+    @classmethod
+    def from_labels(cls, ground_truth: np.ndarray, result: np.ndarray) -> "Contingency":
+        """Build the table from two aligned arrays of cluster labels.
+
+        ``ground_truth[i]`` and ``result[i]`` hold the cluster labels of the
+        ``i``-th record. Negative labels mark records that are missing from the
+        corresponding partition. Clusters are numbered in ascending order of
+        their labels.
+        """
+        return _PartitionIndex(np.asarray(ground_truth)).contingency(result)
+
+    @property
+    def n_rows(self) -> int:
+        return len(self.ground_truth_sizes)
+
+    @property
+    def n_cols(self) -> int:
+        return len(self.result_sizes)
+
+    @property
+    def overlap(self) -> int:
+        """Number of non-empty intersections between the two partitions."""
+        return len(self.counts)
+
+    @cached_property
+    def row_sums(self) -> np.ndarray:
+        """Records each ground truth cluster shares with the result."""
+        return np.bincount(
+            self.rows, weights=self.counts, minlength=self.n_rows
+        ).astype(np.int64)
+
+    @cached_property
+    def col_sums(self) -> np.ndarray:
+        """Records each result cluster shares with the ground truth."""
+        return np.bincount(
+            self.cols, weights=self.counts, minlength=self.n_cols
+        ).astype(np.int64)
+
+    @cached_property
+    def total(self) -> int:
+        """Number of records found in both partitions."""
+        return int(self.counts.sum())
+
+    @cached_property
+    def total_pairs(self) -> int:
+        """Number of pairs of records found in both partitions."""
+        return int(_comb_n_2(self.total))
+
+    @cached_property
+    def cell_pairs(self) -> int:
+        """Pairs of shared records placed together by both partitions."""
+        return int(_comb_n_2(self.counts).sum())
+
+    @cached_property
+    def row_pairs(self) -> int:
+        """Pairs of shared records placed together by the ground truth."""
+        return int(_comb_n_2(self.row_sums).sum())
+
+    @cached_property
+    def col_pairs(self) -> int:
+        """Pairs of shared records placed together by the result."""
+        return int(_comb_n_2(self.col_sums).sum())
+
+    @cached_property
+    def ground_truth_records(self) -> int:
+        """Number of records in the ground truth."""
+        return int(self.ground_truth_sizes.sum())
+
+    @cached_property
+    def ground_truth_record_pairs(self) -> int:
+        """Number of pairs of records in the ground truth."""
+        return int(_comb_n_2(self.ground_truth_records))
+
+    @cached_property
+    def ground_truth_pairs(self) -> int:
+        """Pairs of records placed together by the ground truth."""
+        return int(_comb_n_2(self.ground_truth_sizes).sum())
+
+    @cached_property
+    def result_pairs(self) -> int:
+        """Pairs of records placed together by the result."""
+        return int(_comb_n_2(self.result_sizes).sum())
+
+    @cached_property
+    def ground_truth_entropy(self) -> float:
+        """Entropy of the ground truth clusters of the shared records."""
+        return _entropy(self.row_sums, self.total)
+
+    @cached_property
+    def result_entropy(self) -> float:
+        """Entropy of the result clusters of the shared records."""
+        return _entropy(self.col_sums, self.total)
+
+    @cached_property
+    def mutual_information(self) -> float:
+        """Mutual information of the two partitions of the shared records."""
+        if self.total == 0:
+            return 0.0
+        counts = self.counts.astype(np.float64)
+        outer = self.row_sums[self.rows].astype(np.float64) * self.col_sums[self.cols]
+        information = (counts / self.total * np.log(counts * self.total / outer)).sum()
+        return max(float(information), 0.0)
+
+    @cached_property
+    def exact_cells(self) -> np.ndarray:
+        """Mask of the cells holding a whole cluster of both partitions."""
+        return (self.counts == self.ground_truth_sizes[self.rows]) & (
+            self.counts == self.result_sizes[self.cols]
+        )
+
+    @cached_property
+    def exact_matches(self) -> int:
+        """Number of clusters found identically in both partitions.
+
+        Empty clusters have no cells, so those of the ground truth are matched
+        with those of the result separately.
+        """
+        return int(np.count_nonzero(self.exact_cells)) + len(self._empty_matches[0])
+
+    @cached_property
+    def _empty_matches(self) -> tuple[np.ndarray, np.ndarray]:
+        rows = np.flatnonzero(self.ground_truth_sizes == 0)
+        cols = np.flatnonzero(self.result_sizes == 0)
+        size = min(len(rows), len(cols))
+        return rows[:size], cols[:size]
+
+    def matched_clusters(self) -> tuple[np.ndarray, np.ndarray]:
+        """The clusters found identically in both partitions.
+
+        :returns: the numbers of the matched ground truth clusters and of the
+            identical result clusters, aligned.
+        """
+        empty_rows, empty_cols = self._empty_matches
+        exact = self.exact_cells
+        return (
+            np.concatenate([self.rows[exact], empty_rows]),
+            np.concatenate([self.cols[exact], empty_cols]),
+        )
+
+    def split_clusters(self) -> np.ndarray:
+        """The ground truth clusters spread over several result clusters."""
+        return np.flatnonzero(np.bincount(self.rows, minlength=self.n_rows) > 1)
+
+    def merged_clusters(self) -> np.ndarray:
+        """The result clusters holding records of several ground truth clusters."""
+        return np.flatnonzero(np.bincount(self.cols, minlength=self.n_cols) > 1)
+
+
+class _PartitionIndex:
+    """Lookup structures of a ground truth partition, built once.
+
+    A partition given as a set of sets is indexed by a dictionary mapping each
+    record to the label of its cluster, whereas a partition given as an array
+    of labels is encoded into consecutive cluster numbers.
+    """
+
+    def __init__(self, partition) -> None:
+        with _phase("index_partition") as phase:
+            if isinstance(partition, np.ndarray):
+                if partition.ndim != 1:
+                    raise ValueError("label arrays must be one-dimensional")
+                self.labels = None
+                self.codes, self.sizes, self.values = _encode_labels(partition)
+            else:
+                self.labels: dict[Hashable, int] | None = {}
+                sizes = []
+                for label, cluster in enumerate(partition):
+                    sizes.append(len(cluster))
+                    self.labels.update(dict.fromkeys(cluster, label))
+                self.codes = None
+                self.sizes = np.array(sizes, dtype=np.int64)
+                self.values = None
+            if phase:
+                phase.set(records=int(self.sizes.sum()), clusters=len(self.sizes))
+
+    @classmethod
+    def from_codes(cls, codes: np.ndarray, sizes: np.ndarray) -> "_PartitionIndex":
+        """Wrap labels which are already encoded as consecutive cluster numbers."""
+        index = object.__new__(cls)
+        index.labels = None
+        index.codes = codes
+        index.sizes = sizes
+        index.values = None
+        return index
+
+    def contingency(self, result) -> Contingency:
+        """Build the contingency table of a result against this partition."""
+        with _phase("contingency") as phase:
+            table = self._contingency(result)
+            if phase:
+                phase.set(
+                    records=int(table.result_sizes.sum()),
+                    clusters=table.n_cols,
+                    cells=table.overlap,
+                )
+        return table
+
+    def pair_confusion(self, pairs: Pairs) -> tuple[int, int, int]:
+        """Count the outcomes of result pairs against the pairs of this partition.
+
+        The pairs of the partition are never enumerated: a result pair is a
+        true positive when it joins two records of the same cluster, and a
+        cluster of ``n`` records holds ``n * (n - 1) / 2`` pairs.
+
+        :param pairs: pairs of the record identifiers of the partition, or an
+            ``(m, 2)`` array of the positions of records in its label array.
+        """
+        with _phase("encode_pairs") as phase:
+            if self.codes is None:
+                interner = _Interner()
+                keys = interner.pair_keys(pairs)
+                labels = self.labels
+                codes = np.fromiter(
+                    (labels.get(item, -1) for item in interner.ids),
+                    dtype=np.int64,
+                    count=len(interner.ids),
+                )
+            else:
+                if not isinstance(pairs, np.ndarray):
+                    pairs = np.array(list(pairs), dtype=np.int64).reshape(-1, 2)
+                keys = _pair_keys(pairs)
+                codes = self.codes
+            phase.set(pairs=len(keys))
+        with _phase("intersect_pairs") as phase:
+            tp = _same_cluster_pairs(codes, keys)
+            gt_pairs = int(_comb_n_2(self.sizes).sum())
+            phase.set(ground_truth_pairs=gt_pairs, result_pairs=len(keys))
+        return tp, len(keys) - tp, gt_pairs - tp
+
+    def _contingency(self, result) -> Contingency:
+        if self.codes is not None:
+            if not isinstance(result, np.ndarray):
+                raise TypeError(
+                    "a result must be given as labels, like its ground truth"
+                )
+            return self._label_contingency(result)
+        if isinstance(result, np.ndarray):
+            raise TypeError(
+                "a result must be given as a set of sets, like its ground truth"
+            )
+
+        labels = self.labels
+        rows, cols, counts, result_sizes = [], [], [], []
+        for col, cluster in enumerate(result):
+            result_sizes.append(len(cluster))
+            cells = Counter(labels[item] for item in cluster if item in labels)
+            rows.extend(cells.keys())
+            cols.extend([col] * len(cells))
+            counts.extend(cells.values())
+
+        return Contingency(
+            np.array(rows, dtype=np.int64),
+            np.array(cols, dtype=np.int64),
+            np.array(counts, dtype=np.int64),
+            self.sizes,
+            np.array(result_sizes, dtype=np.int64),
+        )
+
+    def _label_contingency(self, result: np.ndarray) -> Contingency:
+        if result.shape != self.codes.shape:
+            raise ValueError("label arrays must be one-dimensional and aligned")
+        res_codes, result_sizes, result_values = _encode_labels(result)
+        shared = (self.codes >= 0) & (res_codes >= 0)
+        n_cols = max(len(result_sizes), 1)
+        cells, counts = np.unique(
+            self.codes[shared] * n_cols + res_codes[shared], return_counts=True
+        )
+        return Contingency(
+            cells // n_cols,
+            cells % n_cols,
+            counts.astype(np.int64),
+            self.sizes,
+            result_sizes,
+            self.values,
+            result_values,
+        )
+
+
+def _same_cluster_pairs(codes: np.ndarray, keys: np.ndarray) -> int:
+    """Count the pairs of distinct records which share a cluster.
+
+    :param codes: the cluster number of each record, ``-1`` for none.
+    :param keys: pairs of record ids encoded as ``uint64`` keys; ids beyond
+        ``codes`` belong to no cluster.
+    """
+    low = (keys >> np.uint64(32)).astype(np.int64)
+    high = (keys & np.uint64(0xFFFFFFFF)).astype(np.int64)
+    inside = (high < len(codes)) & (low != high)
+    low_codes = codes[low[inside]]
+    same = (low_codes >= 0) & (low_codes == codes[high[inside]])
+    return int(np.count_nonzero(same))
+
+
+def _entropy(sizes: np.ndarray, total: int) -> float:
+    """Entropy of the clusters of ``total`` records, given their sizes."""
+    if total == 0:
+        return 0.0
+    shares = sizes[sizes > 0] / total
+    return float(-(shares * np.log(shares)).sum())
+
+
+def _encode_labels(labels: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Number the clusters of a label array in ascending order of their labels.
+
+    :returns: the cluster number of each record, the size of each cluster and
+        the label of each cluster.
+    """
+    present = labels >= 0
+    values, inverse, sizes = np.unique(
+        labels[present], return_inverse=True, return_counts=True
+    )
+    codes = np.full(len(labels), -1, dtype=np.int64)
+    codes[present] = inverse
+    return codes, sizes.astype(np.int64), values
+
+
+def to_label_arrays(
+    ground_truth: Iterable[Collection[Hashable]],
+    result: Iterable[Collection[Hashable]],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Convert two partitions given as sets of sets into label arrays.
+
+    Records are numbered in the order in which they are first encountered,
+    first in the ``ground_truth`` and then in the ``result``. The ``i``-th
+    element of each returned array is the index of the cluster holding record
+    ``i`` in the corresponding partition, or ``-1`` if the partition does not
+    contain that record.
+
+    :param ground_truth: a set of sets representing the ideal partition.
+    :param result: a set of sets representing the partition produced by the
+        entity resolution task.
+    :returns: a tuple of aligned ``int64`` arrays holding the ground truth and
+        the result cluster labels of each record.
+    """
+    records: dict[Hashable, int] = {}
+
+    def _assignments(partition):
+        positions, labels = [], []
+        for label, cluster in enumerate(partition):
+            for item in cluster:
+                positions.append(records.setdefault(item, len(records)))
+                labels.append(label)
+        return positions, labels
+
+    gt_assignments = _assignments(ground_truth)
+    result_assignments = _assignments(result)
+    gt_labels = np.full(len(records), -1, dtype=np.int64)
+    gt_labels[gt_assignments[0]] = gt_assignments[1]
+    result_labels = np.full(len(records), -1, dtype=np.int64)
+    result_labels[result_assignments[0]] = result_assignments[1]
+    return gt_labels, result_labels
@@ -0,0 +1,100 @@
+from typing import Iterable, NamedTuple
+
+import numpy as np
+
+from pyresolvemetrics._ground_truth import GroundTruth, _pair_index
+from pyresolvemetrics._pairs import _encode_pairs, _find_keys
+from pyresolvemetrics._utils import Pair, Pairs
+
+
+class PrecisionRecallCurve(NamedTuple):
+    """Precision, recall and F1 of a matcher at every score threshold.
+
+    The ``i``-th element of each array describes the matcher which accepts the
+    pairs scored at least ``thresholds[i]``. Thresholds are in decreasing
+    order.
+    """
+
+    thresholds: np.ndarray
+    precision: np.ndarray
+    recall: np.ndarray
+    f1: np.ndarray
+
+    @property
+    def pr_auc(self) -> float:
+        r"""The area under the precision-recall curve.
+
+        It is computed as the average precision, i.e. the precision at each
+        threshold weighted by the increase in recall from the previous one.
+
+        .. math::
+
+            \sum_i (r_i - r_{i-1}) \cdot p_i
+        """
+        gains = np.diff(self.recall, prepend=0.0)
+        return float(np.sum(gains * self.precision))
+
+    @property
+    def best_threshold(self) -> float | None:
+        """The threshold with the highest F1 score, if there is any."""
+        if len(self.thresholds) == 0:
+            return None
+        return float(self.thresholds[np.argmax(self.f1)])
+
+
+def precision_recall_curve(
+    ground_truth: Pairs | GroundTruth,
+    result: Iterable[Pair] | np.ndarray,
+    scores: Iterable[float] | np.ndarray,
+) -> PrecisionRecallCurve:
+    r"""Evaluate a matcher at every distinct threshold of its similarity scores.
+
+    All thresholds are evaluated with a single sort of the scored pairs and a
+    cumulative sum of their true positives, instead of filtering the pairs and
+    computing :func:`pyresolvemetrics.precision` and
+    :func:`pyresolvemetrics.recall` once per threshold. When a pair is scored
+    several times, its highest score is used.
+
+    :param ground_truth: a set of pairs of ``Hashable`` items, or an
+        ``(m, 2)`` array of integer identifiers. Each pair represents a known
+        pair of matching entity reference identifiers. It may also be indexed
+        beforehand as a :class:`GroundTruth`.
+    :param result: pairs of ``Hashable`` items, or an ``(n, 2)`` array of
+        integer identifiers. Each pair represents a pair of identifiers for
+        entity references which were compared by an entity matcher.
+    :param scores: the similarity score of each pair in ``result``, in the
+        same order.
+    """
+    index = _pair_index(ground_truth)
+    gt_keys = index.keys
+    ids = index.pair_ids(result)
+    scores = np.asarray(scores, dtype=np.float64)
+    if len(scores) != len(ids):
+        raise ValueError("every pair must have exactly one score")
+
+    keys = _encode_pairs(ids)
+    order = np.lexsort((-scores, keys))
+    keys, scores = keys[order], scores[order]
+    first = np.ones(len(keys), dtype=bool)
+    first[1:] = keys[1:] != keys[:-1]
+    keys, scores = keys[first], scores[first]
+
+    _, is_match = _find_keys(gt_keys, keys)
+    order = np.argsort(-scores, kind="stable")
+    scores, is_match = scores[order], is_match[order]
+    tp = np.cumsum(is_match)
+    accepted = np.arange(1, len(scores) + 1)
+    last = np.ones(len(scores), dtype=bool)
+    last[:-1] = scores[1:] != scores[:-1]
+
+    tp, accepted = tp[last], accepted[last]
+    precision = tp / accepted
+    recall = tp / len(gt_keys) if len(gt_keys) else np.zeros(len(tp))
+    denominator = precision + recall
+    f1 = np.divide(
+        2 * precision * recall,
+        denominator,
+        out=np.zeros(len(tp)),
+        where=denominator != 0,
+    )
+    return PrecisionRecallCurve(scores[last], precision, recall, f1)
@@ -0,0 +1,276 @@
+from functools import cached_property
+from typing import Hashable, NamedTuple
+
+import numpy as np
+
+from pyresolvemetrics._contingency import Contingency
+from pyresolvemetrics._ground_truth import GroundTruth, _contingency, _pair_index
+from pyresolvemetrics._pairs import _find_keys, _pair_keys
+from pyresolvemetrics._probabilistic import Confusion
+from pyresolvemetrics._utils import Pair, Pairs, Partition, _comb_n_2
+
+
+class PairErrors:
+    """The pairs which an entity matching task got wrong.
+
+    The result is matched against the same sorted pair keys as the scores, and
+    the erroneous keys are kept encoded: only the pages which are asked for
+    are decoded back into pairs of identifiers.
+
+    :param ground_truth: a set of pairs of ``Hashable`` items, or an
+        ``(m, 2)`` array of integer identifiers. It may also be indexed
+        beforehand as a :class:`GroundTruth`.
+    :param result: a set of pairs of ``Hashable`` items, or an ``(m, 2)``
+        array of integer identifiers, output by an entity matcher.
+    """
+
+    def __init__(self, ground_truth: Pairs | GroundTruth, result: Pairs) -> None:
+        self._index = _pair_index(ground_truth)
+        self._unknown: dict[Hashable, int] = {}
+        if self._index.interner is None:
+            ids = self._index.pair_ids(result)
+        else:
+            ids = self._index.interner.lookup(result, self._unknown)
+        keys = _pair_keys(ids)
+        positions, hits = _find_keys(self._index.keys, keys)
+        self._fp_keys = keys[~hits]
+        self._found = np.zeros(len(self._index.keys), dtype=bool)
+        self._found[positions[hits]] = True
+
+    @property
+    def confusion(self) -> Confusion:
+        """The outcome counts of the result."""
+        tp = len(self._index.keys) - len(self._fn_keys)
+        return Confusion(tp, len(self._fp_keys), len(self._fn_keys))
+
+    @cached_property
+    def _fn_keys(self) -> np.ndarray:
+        return self._index.keys[~self._found]
+
+    @cached_property
+    def _identifiers(self) -> list[Hashable]:
+        return [*self._index.interner.ids, *self._unknown]
+
+    def false_positives(
+        self, offset: int = 0, limit: int | None = None
+    ) -> np.ndarray | list[Pair]:
+        """A page of the pairs of the result missing from the ground truth.
+
+        Pairs are ordered by the ids of their records, low id first.
+
+        :param offset: the number of pairs to skip.
+        :param limit: the largest number of pairs returned, all by default.
+        :returns: an ``(m, 2)`` array of identifiers when the ground truth is
+            an array, a list of pairs of identifiers otherwise.
+        """
+        return self._decode(self._fp_keys, offset, limit)
+
+    def false_negatives(
+        self, offset: int = 0, limit: int | None = None
+    ) -> np.ndarray | list[Pair]:
+        """A page of the pairs of the ground truth missing from the result.
+
+        Pairs are ordered by the ids of their records, low id first.
+
+        :param offset: the number of pairs to skip.
+        :param limit: the largest number of pairs returned, all by default.
+        :returns: an ``(m, 2)`` array of identifiers when the ground truth is
+            an array, a list of pairs of identifiers otherwise.
+        """
+        return self._decode(self._fn_keys, offset, limit)
+
+    def _decode(
+        self, keys: np.ndarray, offset: int, limit: int | None
+    ) -> np.ndarray | list[Pair]:
+        page = keys[offset : None if limit is None else offset + limit]
+        pairs = np.stack(
+            [page >> np.uint64(32), page & np.uint64(0xFFFFFFFF)], axis=1
+        ).astype(np.int64)
+        if self._index.interner is None:
+            return pairs
+        identifiers = self._identifiers
+        return [(identifiers[low], identifiers[high]) for low, high in pairs.tolist()]
+
+
+class ClusterError(NamedTuple):
+    """A cluster which shares records with several clusters of the other side.
+
+    Clusters are identified by their labels when the partitions are label
+    arrays, or by their position in the iteration order of their partition.
+
+    :param cluster: the erroneous cluster.
+    :param parts: the number of records the cluster shares with each cluster
+        of the other partition.
+    :param pairs: the pairs of records of a result cluster which the ground
+        truth places apart, or those of a ground truth cluster which the result
+        places apart.
+    """
+
+    cluster: Hashable
+    parts: dict[Hashable, int]
+    pairs: int
+
+
+class ClusterErrors:
+    """The clusters which an entity resolution task got wrong.
+
+    Everything is read off the contingency table used for the scores, so the
+    pairs of records are never enumerated.
+
+    :param ground_truth: a set of sets, or an array holding the ground truth
+        cluster label of each record. It may also be indexed beforehand as a
+        :class:`GroundTruth`.
+    :param result: a set of sets, or an array holding the result cluster label
+        of each record.
+    """
+
+    def __init__(self, ground_truth: Partition | GroundTruth, result: Partition):
+        self._table = _contingency(ground_truth, result)
+
+    @classmethod
+    def from_contingency(cls, table: Contingency) -> "ClusterErrors":
+        """Analyse a contingency table which was already built."""
+        errors = object.__new__(cls)
+        errors._table = table
+        return errors
+
+    @cached_property
+    def _split(self) -> np.ndarray:
+        return self._table.split_clusters()
+
+    @cached_property
+    def _merged(self) -> np.ndarray:
+        return self._table.merged_clusters()
+
+    @cached_property
+    def _row_order(self) -> np.ndarray:
+        return np.argsort(self._table.rows, kind="stable")
+
+    @cached_property
+    def _col_order(self) -> np.ndarray:
+        return np.argsort(self._table.cols, kind="stable")
+
+    @cached_property
+    def _missing_pairs(self) -> np.ndarray:
+        table = self._table
+        together = np.bincount(
+            table.rows, weights=_comb_n_2(table.counts), minlength=table.n_rows
+        )
+        return _comb_n_2(table.ground_truth_sizes) - together.astype(np.int64)
+
+    @cached_property
+    def _extra_pairs(self) -> np.ndarray:
+        table = self._table
+        together = np.bincount(
+            table.cols, weights=_comb_n_2(table.counts), minlength=table.n_cols
+        )
+        return _comb_n_2(table.result_sizes) - together.astype(np.int64)
+
+    @property
+    def split_count(self) -> int:
+        """The number of ground truth clusters spread over several results."""
+        return len(self._split)
+
+    @property
+    def merged_count(self) -> int:
+        """The number of result clusters mixing several ground truth clusters."""
+        return len(self._merged)
+
+    def split(self, offset: int = 0, limit: int | None = None) -> list[ClusterError]:
+        """A page of the ground truth clusters spread over several results.
+
+        :param offset: the number of clusters to skip.
+        :param limit: the largest number of clusters returned, all by default.
+        """
+        return self._ground_truth_errors(_page(self._split, offset, limit))
+
+    def merged(self, offset: int = 0, limit: int | None = None) -> list[ClusterError]:
+        """A page of the result clusters mixing several ground truth clusters.
+
+        :param offset: the number of clusters to skip.
+        :param limit: the largest number of clusters returned, all by default.
+        """
+        return self._result_errors(_page(self._merged, offset, limit))
+
+    def worst_split(self, k: int) -> list[ClusterError]:
+        """The ground truth clusters whose records the result keeps apart most.
+
+        :param k: the largest number of clusters returned, worst first.
+        """
+        return self._ground_truth_errors(_top(self._missing_pairs, k))
+
+    def worst_merged(self, k: int) -> list[ClusterError]:
+        """The result clusters which put most records of distinct entities together.
+
+        :param k: the largest number of clusters returned, worst first.
+        """
+        return self._result_errors(_top(self._extra_pairs, k))
+
+    def _ground_truth_errors(self, rows: np.ndarray) -> list[ClusterError]:
+        table = self._table
+        return _errors(
+            rows,
+            table.rows,
+            self._row_order,
+            table.cols,
+            self._missing_pairs,
+            table.ground_truth_labels,
+            table.result_labels,
+            table.counts,
+        )
+
+    def _result_errors(self, cols: np.ndarray) -> list[ClusterError]:
+        table = self._table
+        return _errors(
+            cols,
+            table.cols,
+            self._col_order,
+            table.rows,
+            self._extra_pairs,
+            table.result_labels,
+            table.ground_truth_labels,
+            table.counts,
+        )
+
+
+def _page(clusters: np.ndarray, offset: int, limit: int | None) -> np.ndarray:
+    return clusters[offset : None if limit is None else offset + limit]
+
+
+def _top(pairs: np.ndarray, k: int) -> np.ndarray:
+    """The ``k`` clusters with the most erroneous pairs, worst first."""
+    wrong = np.flatnonzero(pairs > 0)
+    if k < len(wrong):
+        wrong = wrong[np.argpartition(-pairs[wrong], k - 1)[:k]]
+    return wrong[np.argsort(-pairs[wrong], kind="stable")]
+
+
+def _errors(
+    clusters: np.ndarray,
+    own: np.ndarray,
+    order: np.ndarray,
+    other: np.ndarray,
+    pairs: np.ndarray,
+    labels: np.ndarray | None,
+    other_labels: np.ndarray | None,
+    counts: np.ndarray,
+) -> list[ClusterError]:
+    """Describe clusters through the cells of their row or column."""
+    sorted_own = own[order]
+    starts = np.searchsorted(sorted_own, clusters, side="left")
+    ends = np.searchsorted(sorted_own, clusters, side="right")
+    identities = clusters if labels is None else labels[clusters]
+    errors = []
+    for cluster, identity, start, end in zip(
+        clusters.tolist(), identities.tolist(), starts, ends
+    ):
+        cells = order[start:end]
+        parts = other[cells] if other_labels is None else other_labels[other[cells]]
+        errors.append(
+            ClusterError(
+                identity,
+                dict(zip(parts.tolist(), counts[cells].tolist())),
+                int(pairs[cluster]),
+            )
+        )
+    return errors
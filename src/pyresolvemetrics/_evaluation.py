@@ -0,0 +1,156 @@
+from functools import cached_property
+from typing import Iterable
+
+from pyresolvemetrics._algebraic import (
+    _ALL_METRICS,
+    ClusterDiagnostics,
+    Partition,
+    _adjusted_mutual_information,
+    _adjusted_rand_index,
+    _bcubed_precision,
+    _bcubed_recall,
+    _cluster_diagnostics,
+    _cluster_comparison_measure,
+    _cluster_precision,
+    _cluster_recall,
+    _completeness,
+    _fowlkes_mallows_index,
+    _generalized_merge_distance,
+    _homogeneity,
+    _normalized_mutual_information,
+    _pair_comparison_measure,
+    _pair_precision,
+    _pair_recall,
+    _rand_index,
+    _select_metrics,
+    _twi,
+    _v_measure,
+)
+from pyresolvemetrics._contingency import Contingency
+from pyresolvemetrics._errors import ClusterErrors
+from pyresolvemetrics._ground_truth import GroundTruth, _contingency
+
+
+class Evaluation:
+    """Evaluate an entity resolution result against its ground truth.
+
+    The two partitions are ingested once: the contingency table that every
+    algebraic metric derives from is built on first use and shared by all the
+    metrics, so each of them costs constant time afterwards.
+
+    :param ground_truth: a set of sets, or an array holding the ground truth
+        cluster label of each record. Represents the ideal algebraic partition
+        induced by the entity resolution relation over an algebraic set. It
+        may also be indexed beforehand as a :class:`GroundTruth`.
+    :param result: a set of sets, or an array holding the result cluster label
+        of each record. Represents the partition produced by the entity
+        resolution task over the same algebraic set as the ground truth.
+    """
+
+    METRICS = tuple(_ALL_METRICS)
+
+    def __init__(
+        self, ground_truth: Partition | GroundTruth, result: Partition
+    ) -> None:
+        self._ground_truth = ground_truth
+        self._result = result
+
+    @cached_property
+    def _table(self) -> Contingency:
+        return _contingency(self._ground_truth, self._result)
+
+    @property
+    def pair_precision(self) -> float:
+        return _pair_precision(self._table)
+
+    @property
+    def pair_recall(self) -> float:
+        return _pair_recall(self._table)
+
+    @property
+    def pair_comparison_measure(self) -> float:
+        return _pair_comparison_measure(self._table)
+
+    @property
+    def cluster_precision(self) -> float:
+        return _cluster_precision(self._table)
+
+    @property
+    def cluster_recall(self) -> float:
+        return _cluster_recall(self._table)
+
+    @property
+    def cluster_comparison_measure(self) -> float:
+        return _cluster_comparison_measure(self._table)
+
+    @property
+    def rand_index(self) -> float:
+        return _rand_index(self._table)
+
+    @property
+    def adjusted_rand_index(self) -> float:
+        return _adjusted_rand_index(self._table)
+
+    @property
+    def twi(self) -> float:
+        return _twi(self._table)
+
+    @property
+    def fowlkes_mallows_index(self) -> float:
+        return _fowlkes_mallows_index(self._table)
+
+    @property
+    def normalized_mutual_information(self) -> float:
+        return _normalized_mutual_information(self._table)
+
+    @property
+    def adjusted_mutual_information(self) -> float:
+        return _adjusted_mutual_information(self._table)
+
+    @property
+    def homogeneity(self) -> float:
+        return _homogeneity(self._table)
+
+    @property
+    def completeness(self) -> float:
+        return _completeness(self._table)
+
+    @property
+    def v_measure(self) -> float:
+        return _v_measure(self._table)
+
+    @property
+    def bcubed_precision(self) -> float:
+        return _bcubed_precision(self._table)
+
+    @property
+    def bcubed_recall(self) -> float:
+        return _bcubed_recall(self._table)
+
+    @property
+    def generalized_merge_distance(self) -> float:
+        return _generalized_merge_distance(self._table)
+
+    def cluster_diagnostics(self) -> ClusterDiagnostics:
+        """List the clusters which the result matched exactly, split and merged.
+
+        The clusters are read off the contingency table shared by the metrics.
+        """
+        return _cluster_diagnostics(self._table)
+
+    def errors(self) -> ClusterErrors:
+        """Analyse the clusters which the result split and merged.
+
+        The analysis reads the contingency table shared by the metrics.
+        """
+        return ClusterErrors.from_contingency(self._table)
+
+    def compute_all(self, metrics: Iterable[str] | None = None) -> dict[str, float]:
+        """Compute every supported metric.
+
+        :param metrics: the names of the metrics to compute, among those in
+            ``METRICS``. All of them by default.
+        :returns: a dictionary mapping the name of each metric to its value.
+        """
+        metrics = _select_metrics(metrics, dict.fromkeys(self.METRICS))
+        return {name: getattr(self, name) for name in metrics}
@@ -0,0 +1,106 @@
+import numpy as np
+
+from pyresolvemetrics._contingency import Contingency, _PartitionIndex
+from pyresolvemetrics._pairs import _PairIndex
+from pyresolvemetrics._utils import Pairs, Partition, _comb_n_2
+
+
+class GroundTruth:
+    """A ground truth indexed once, for repeated evaluations.
+
+    Every metric accepts a ``GroundTruth`` in place of the raw ground truth,
+    so that evaluating several results against it only costs the work on the
+    result side. Build it with :meth:`from_partition` for the algebraic
+    metrics, or with :meth:`from_pairs` for the Fellegi-Sunter metrics. The
+    Fellegi-Sunter metrics also accept a partition, whose pairs are counted
+    per cluster rather than enumerated.
+    """
+
+    def __init__(
+        self,
+        partition: _PartitionIndex | None = None,
+        pairs: _PairIndex | None = None,
+    ) -> None:
+        self._partition = partition
+        self._pairs = pairs
+        # Arguments of load_ground_truth, when the index is mapped from a file.
+        self._source: tuple[str, bool] | None = None
+
+    def __reduce__(self):
+        if self._source is None:
+            return super().__reduce__()
+        from pyresolvemetrics._storage import load_ground_truth
+
+        return load_ground_truth, self._source
+
+    @classmethod
+    def from_partition(cls, partition: Partition) -> "GroundTruth":
+        """Index the ideal partition of an algebraic entity resolution task.
+
+        The index maps every record to the label of its cluster and holds the
+        size of every cluster.
+
+        :param partition: a set of sets, or an array holding the cluster label
+            of each record.
+        """
+        return cls(partition=_PartitionIndex(partition))
+
+    @classmethod
+    def from_pairs(cls, pairs: Pairs) -> "GroundTruth":
+        """Index the known matches of a Fellegi-Sunter entity matching task.
+
+        The index assigns dense ids to the identifiers of the records and holds
+        the pairs as sorted ``uint64`` keys.
+
+        :param pairs: a set of pairs of ``Hashable`` items, or an ``(m, 2)``
+            array of integer identifiers.
+        """
+        return cls(pairs=_PairIndex(pairs))
+
+    @property
+    def cluster_sizes(self) -> np.ndarray:
+        """The number of records in each cluster of the partition."""
+        return self._partition_index().sizes
+
+    @property
+    def pair_count(self) -> int:
+        """The number of pairs of records which refer to the same entity."""
+        if self._pairs is not None:
+            return len(self._pairs.keys)
+        return int(_comb_n_2(self._partition.sizes).sum())
+
+    def _partition_index(self) -> _PartitionIndex:
+        if self._partition is None:
+            raise TypeError("the ground truth was not indexed as a partition")
+        return self._partition
+
+    def _pair_index(self) -> _PairIndex:
+        if self._pairs is None:
+            raise TypeError("the ground truth was not indexed as a set of pairs")
+        return self._pairs
+
+
+def _partition_index(ground_truth: Partition | GroundTruth) -> _PartitionIndex:
+    if isinstance(ground_truth, GroundTruth):
+        return ground_truth._partition_index()
+    return _PartitionIndex(ground_truth)
+
+
+def _pair_index(ground_truth: Pairs | GroundTruth) -> _PairIndex:
+    if isinstance(ground_truth, GroundTruth):
+        return ground_truth._pair_index()
+    return _PairIndex(ground_truth)
+
+
+def _contingency(
+    ground_truth: Partition | GroundTruth, result: Partition
+) -> Contingency:
+    return _partition_index(ground_truth).contingency(result)
+
+
+def _pair_confusion(
+    ground_truth: Pairs | GroundTruth, result: Pairs
+) -> tuple[int, int, int]:
+    if isinstance(ground_truth, GroundTruth) and ground_truth._pairs is None:
+        return ground_truth._partition_index().pair_confusion(result)
+    return _pair_index(ground_truth).confusion(result)
@@ -0,0 +1,395 @@
+import operator
+from typing import Hashable, Iterable, NamedTuple, Sequence
+
+import numpy as np
+
+from pyresolvemetrics._algebraic import (
+    _METRICS,
+    Partition,
+    _adjusted_rand_index,
+    _cluster_comparison_measure,
+    _cluster_precision,
+    _cluster_recall,
+    _fowlkes_mallows_index,
+    _pair_comparison_measure,
+    _pair_precision,
+    _pair_recall,
+    _rand_index,
+    _select_metrics,
+    _twi,
+)
+from pyresolvemetrics._ground_truth import GroundTruth, _partition_index
+from pyresolvemetrics._pairs import _Interner
+from pyresolvemetrics._utils import Pair, _comb_n_2
+
+
+class _Cluster:
+    __slots__ = ("labels", "size", "shared")
+
+    def __init__(self) -> None:
+        self.labels: dict[int, int] = {}  # ground truth label -> record count
+        self.size = 0
+        self.shared = 0  # records which belong to the ground truth
+
+
+class _IncrementalContingency:
+    """Contingency counts maintained while the result partition changes.
+
+    The result is made of :class:`_Cluster` objects which only change through
+    the methods of this class, so that every aggregate count is updated in
+    time proportional to the records or labels involved in the change.
+    Records with a negative label do not belong to the ground truth.
+    """
+
+    def __init__(self, ground_truth_sizes: Sequence[int]) -> None:
+        self._gt_sizes = [int(size) for size in ground_truth_sizes]
+        self._row_sizes = [0] * len(self._gt_sizes)
+        self.n_rows = len(self._gt_sizes)
+        self.n_cols = 0
+        self.overlap = 0
+        self.total = 0
+        self.total_pairs = 0
+        self.cell_pairs = 0
+        self.row_pairs = 0
+        self.col_pairs = 0
+        self.ground_truth_records = sum(self._gt_sizes)
+        self.ground_truth_record_pairs = _comb_n_2(self.ground_truth_records)
+        self.ground_truth_pairs = sum(map(_comb_n_2, self._gt_sizes))
+        self.result_pairs = 0
+        self.exact_matches = 0
+
+    def _is_exact(self, cluster: _Cluster) -> bool:
+        if len(cluster.labels) != 1 or cluster.shared != cluster.size:
+            return False
+        ((label, count),) = cluster.labels.items()
+        return count == self._gt_sizes[label]
+
+    def add_record(self, label: int, cluster: _Cluster | None = None) -> _Cluster:
+        """Add a new record to a cluster, or to a new cluster by default."""
+        if label >= 0:
+            self.row_pairs += self._row_sizes[label]
+            self._row_sizes[label] += 1
+            self.total_pairs += self.total
+            self.total += 1
+        cluster = _Cluster() if cluster is None else cluster
+        self.enter(cluster, label)
+        return cluster
+
+    def enter(self, cluster: _Cluster, label: int) -> None:
+        """Place a record of the result in ``cluster``."""
+        was_exact = self._is_exact(cluster)
+        if cluster.size == 0:
+            self.n_cols += 1
+        self.result_pairs += cluster.size
+        cluster.size += 1
+        if label >= 0:
+            count = cluster.labels.get(label, 0)
+            if count == 0:
+                self.overlap += 1
+            self.cell_pairs += count
+            self.col_pairs += cluster.shared
+            cluster.labels[label] = count + 1
+            cluster.shared += 1
+        self.exact_matches += self._is_exact(cluster) - was_exact
+
+    def remove_record(self, label: int, cluster: _Cluster) -> None:
+        """Remove a record from the result and from its cluster."""
+        if label >= 0:
+            self._row_sizes[label] -= 1
+            self.row_pairs -= self._row_sizes[label]
+            self.total -= 1
+            self.total_pairs -= self.total
+        self.leave(cluster, label)
+
+    def leave(self, cluster: _Cluster, label: int) -> None:
+        """Take a record of the result out of ``cluster``."""
+        was_exact = self._is_exact(cluster)
+        cluster.size -= 1
+        self.result_pairs -= cluster.size
+        if cluster.size == 0:
+            self.n_cols -= 1
+        if label >= 0:
+            count = cluster.labels.pop(label) - 1
+            if count == 0:
+                self.overlap -= 1
+            else:
+                cluster.labels[label] = count
+            self.cell_pairs -= count
+            cluster.shared -= 1
+            self.col_pairs -= cluster.shared
+        self.exact_matches += self._is_exact(cluster) - was_exact
+
+    def join(self, first: _Cluster, second: _Cluster) -> _Cluster:
+        """Merge two clusters, returning the one which holds all records.
+
+        The labels of the cluster with fewer distinct labels are folded into
+        the other one, so repeated joins cost amortized logarithmic time.
+        """
+        if len(first.labels) < len(second.labels):
+            first, second = second, first
+        if second.size == 0:
+            return first
+        self.exact_matches -= self._is_exact(first) + self._is_exact(second)
+        if first.size != 0:
+            self.n_cols -= 1
+        for label, count in second.labels.items():
+            other = first.labels.get(label, 0)
+            if other:
+                self.overlap -= 1
+            self.cell_pairs += count * other
+            first.labels[label] = other + count
+        self.col_pairs += first.shared * second.shared
+        self.result_pairs += first.size * second.size
+        first.size += second.size
+        first.shared += second.shared
+        second.labels, second.size, second.shared = {}, 0, 0
+        self.exact_matches += self._is_exact(first)
+        return first
+
+
+class ResolutionTracker:
+    """Evaluate a result against its ground truth while the result changes.
+
+    The result starts out empty and is built up by events which add records
+    and rearrange clusters. Each event updates the contingency counts in time
+    proportional to the records it affects, and every metric is read from
+    these counts in constant time. Clusters are identified by any
+    ``Hashable`` value chosen by the caller. Only the metrics derived from
+    these counts are tracked, as listed in ``METRICS``.
+
+    :param ground_truth: a set of sets, or an array holding the ground truth
+        cluster label of each record. Represents the ideal algebraic partition
+        induced by the entity resolution relation over an algebraic set. It
+        may also be indexed beforehand as a :class:`GroundTruth`. The records
+        of a label array are identified by their position in the array.
+    """
+
+    METRICS = tuple(_METRICS)
+
+    def __init__(self, ground_truth: Partition | GroundTruth) -> None:
+        index = _partition_index(ground_truth)
+        self._labels = index.labels
+        self._codes = index.codes
+        self._table = _IncrementalContingency(index.sizes)
+        self._clusters: dict[Hashable, _Cluster] = {}
+        self._members: dict[Hashable, set[Hashable]] = {}
+        self._cluster_of: dict[Hashable, Hashable] = {}
+
+    @property
+    def pair_precision(self) -> float:
+        return _pair_precision(self._table)
+
+    @property
+    def pair_recall(self) -> float:
+        return _pair_recall(self._table)
+
+    @property
+    def pair_comparison_measure(self) -> float:
+        return _pair_comparison_measure(self._table)
+
+    @property
+    def cluster_precision(self) -> float:
+        return _cluster_precision(self._table)
+
+    @property
+    def cluster_recall(self) -> float:
+        return _cluster_recall(self._table)
+
+    @property
+    def cluster_comparison_measure(self) -> float:
+        return _cluster_comparison_measure(self._table)
+
+    @property
+    def rand_index(self) -> float:
+        return _rand_index(self._table)
+
+    @property
+    def adjusted_rand_index(self) -> float:
+        return _adjusted_rand_index(self._table)
+
+    @property
+    def twi(self) -> float:
+        return _twi(self._table)
+
+    @property
+    def fowlkes_mallows_index(self) -> float:
+        return _fowlkes_mallows_index(self._table)
+
+    def compute_all(self, metrics: Iterable[str] | None = None) -> dict[str, float]:
+        """Compute every tracked metric.
+
+        :param metrics: the names of the metrics to compute, among those in
+            ``METRICS``. All of them by default.
+        :returns: a dictionary mapping the name of each metric to its value.
+        """
+        metrics = _select_metrics(metrics, _METRICS)
+        return {name: getattr(self, name) for name in metrics}
+
+    def _label(self, record: Hashable) -> int:
+        if self._labels is not None:
+            return self._labels.get(record, -1)
+        if isinstance(record, bool):
+            return -1
+        try:
+            position = operator.index(record)
+        except TypeError:
+            return -1
+        if 0 <= position < len(self._codes):
+            return int(self._codes[position])
+        return -1
+
+    def _place(self, record: Hashable, cluster: Hashable) -> _Cluster:
+        if cluster not in self._clusters:
+            self._clusters[cluster] = _Cluster()
+            self._members[cluster] = set()
+        self._members[cluster].add(record)
+        self._cluster_of[record] = cluster
+        return self._clusters[cluster]
+
+    def _take(self, record: Hashable) -> _Cluster:
+        cluster = self._cluster_of.pop(record)
+        counts = self._clusters[cluster]
+        self._members[cluster].remove(record)
+        if not self._members[cluster]:
+            del self._clusters[cluster], self._members[cluster]
+        return counts
+
+    def cluster_of(self, record: Hashable) -> Hashable:
+        """The cluster currently holding ``record``."""
+        return self._cluster_of[record]
+
+    def add_record(self, record: Hashable, cluster: Hashable) -> None:
+        """Add a new record to ``cluster``, which is created if it is new."""
+        if record in self._cluster_of:
+            raise ValueError(f"record {record!r} is already in the result")
+        self._table.add_record(self._label(record), self._place(record, cluster))
+
+    def remove_record(self, record: Hashable) -> None:
+        """Remove a record from the result."""
+        self._table.remove_record(self._label(record), self._take(record))
+
+    def move_record(self, record: Hashable, cluster: Hashable) -> None:
+        """Move a record to ``cluster``, which is created if it is new."""
+        label = self._label(record)
+        self._table.leave(self._take(record), label)
+        self._table.enter(self._place(record, cluster), label)
+
+    def merge(self, first: Hashable, second: Hashable) -> None:
+        """Move every record of the ``second`` cluster into the ``first`` one.
+
+        The contingency counts are updated in time proportional to the number
+        of ground truth clusters found in the smaller of the two clusters.
+        """
+        for cluster in (first, second):
+            if cluster not in self._clusters:
+                raise ValueError(f"cluster {cluster!r} is not in the result")
+        if first == second:
+            return
+        members = self._members.pop(second)
+        self._clusters[first] = self._table.join(
+            self._clusters[first], self._clusters.pop(second)
+        )
+        self._members[first] |= members
+        for record in members:
+            self._cluster_of[record] = first
+
+    def split(
+        self, cluster: Hashable, records: Iterable[Hashable], new: Hashable
+    ) -> None:
+        """Move some ``records`` of ``cluster`` into the ``new`` cluster."""
+        for record in records:
+            if self._cluster_of.get(record) != cluster:
+                raise ValueError(f"record {record!r} is not in cluster {cluster!r}")
+            self.move_record(record, new)
+
+
+class ClusteringCurve(NamedTuple):
+    """Algebraic metrics of a clustering at every merge threshold.
+
+    The ``i``-th element of each metric array describes the partition obtained
+    by merging every pair of records scored at least ``thresholds[i]``.
+    Thresholds are in decreasing order.
+    """
+
+    thresholds: np.ndarray
+    pair_precision: np.ndarray
+    pair_recall: np.ndarray
+    pair_comparison_measure: np.ndarray
+    cluster_precision: np.ndarray
+    cluster_recall: np.ndarray
+    cluster_comparison_measure: np.ndarray
+    rand_index: np.ndarray
+    adjusted_rand_index: np.ndarray
+    twi: np.ndarray
+    fowlkes_mallows_index: np.ndarray
+
+
+def clustering_curve(
+    ground_truth: Partition | GroundTruth,
+    edges: Iterable[Pair] | np.ndarray,
+    scores: Iterable[float] | np.ndarray,
+) -> ClusteringCurve:
+    """Evaluate a threshold-based clustering at every distinct threshold.
+
+    Every record starts in a cluster of its own. The ``edges`` are then merged
+    in decreasing order of their scores, as in single-linkage clustering,
+    using a union-find structure. Each merge updates the contingency counts
+    in amortized near-constant time, so the whole sweep costs about as much as
+    a single evaluation.
+
+    :param ground_truth: a set of sets, or an array holding the ground truth
+        cluster label of each record. Represents the ideal algebraic partition
+        induced by the entity resolution relation over an algebraic set. It
+        may also be indexed beforehand as a :class:`GroundTruth`.
+    :param edges: pairs of ``Hashable`` records, or an ``(m, 2)`` array of
+        record indices when the ``ground_truth`` is an array of labels. Each
+        pair links two records which the entity resolution task matched.
+    :param scores: the similarity score of each edge, in the same order.
+    """
+    index = _partition_index(ground_truth)
+    gt_sizes = index.sizes
+    if index.codes is not None:
+        labels = index.codes
+        edge_ids = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        if len(edge_ids) and (edge_ids.min() < 0 or edge_ids.max() >= len(labels)):
+            raise ValueError("edges must link records of the ground truth")
+    else:
+        interner = _Interner()
+        interner.ids = dict(zip(index.labels, range(len(index.labels))))
+        gt_labels = list(index.labels.values())
+        edge_ids = interner.pair_ids(edges)
+        labels = np.full(len(interner.ids), -1, dtype=np.int64)
+        labels[: len(gt_labels)] = gt_labels
+    scores = np.asarray(scores, dtype=np.float64)
+    if len(scores) != len(edge_ids):
+        raise ValueError("every edge must have exactly one score")
+
+    counts = _IncrementalContingency(gt_sizes)
+    clusters = [counts.add_record(label) for label in labels.tolist()]
+    parent = list(range(len(clusters)))
+
+    def find(record: int) -> int:
+        while parent[record] != record:
+            parent[record] = parent[parent[record]]
+            record = parent[record]
+        return record
+
+    order = np.argsort(-scores, kind="stable")
+    sorted_scores = scores[order].tolist()
+    thresholds: list[float] = []
+    values: dict[str, list[float]] = {name: [] for name in _METRICS}
+    for position, (a, b) in enumerate(edge_ids[order].tolist()):
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[root_b] = root_a
+            clusters[root_a] = counts.join(clusters[root_a], clusters[root_b])
+        score = sorted_scores[position]
+        if position + 1 == len(sorted_scores) or sorted_scores[position + 1] != score:
+            thresholds.append(score)
+            for name, metric in _METRICS.items():
+                values[name].append(metric(counts))
+
+    return ClusteringCurve(
+        np.array(thresholds),
+        **{name: np.array(series) for name, series in values.items()},
+    )
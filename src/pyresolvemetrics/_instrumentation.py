@@ -0,0 +1,205 @@
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Callable, Iterator, NamedTuple
+
+
+class PhaseRecord(NamedTuple):
+    """Measurements of one phase of the computation of a metric.
+
+    :param metric: the name of the metric being computed, or ``None`` for
+        work done outside of a metric, such as indexing a :class:`GroundTruth`.
+    :param phase: the name of the phase, ``"total"`` for a whole metric call.
+    :param seconds: the wall time spent in the phase.
+    :param peak_bytes: the peak memory allocated during the phase, on top of
+        the memory allocated when it began, or ``None`` when memory is not
+        traced by :mod:`tracemalloc`.
+    :param sizes: the sizes of the data handled by the phase, such as the
+        numbers of records, clusters or pairs.
+    """
+
+    metric: str | None
+    phase: str
+    seconds: float
+    peak_bytes: int | None
+    sizes: dict[str, int]
+
+
+# Like the current metric, the listeners and the open phases belong to a
+# context, so that every thread or task only reports to its own listeners.
+_listeners: ContextVar[tuple[Callable[[PhaseRecord], None], ...]] = ContextVar(
+    "_listeners", default=()
+)
+_metric: ContextVar[str | None] = ContextVar("_metric", default=None)
+# Highest peak seen so far by each open traced phase, innermost last.
+_peaks: ContextVar[tuple[int, ...]] = ContextVar("_peaks", default=())
+# Memory is traced for the whole process, as long as any context asks for it.
+_tracing_lock = threading.Lock()
+_tracers = 0
+_started_tracing = False
+
+
+@contextmanager
+def instrument(
+    callback: Callable[[PhaseRecord], None] | None = None, memory: bool = False
+) -> Iterator[list[PhaseRecord]]:
+    """Record the time spent in each phase of the metrics computed within.
+
+    Every metric call yields a ``"total"`` record, preceded by records of its
+    phases: ``"index_partition"`` and ``"contingency"`` for the algebraic
+    metrics, and ``"index_pairs"``, ``"encode_pairs"`` and
+    ``"intersect_pairs"`` for the Fellegi-Sunter metrics. Outside of this
+    context, the metrics do not measure anything.
+
+    >>> with instrument() as records:
+    ...     score = f1(ground_truth, result)
+    >>> [record.phase for record in records]
+    ['index_pairs', 'encode_pairs', 'intersect_pairs', 'total']
+
+    :param callback: receives each record as soon as its phase ends, e.g. to
+        forward it to a monitoring system.
+    :param memory: trace the peak memory of each phase with
+        :mod:`tracemalloc`, which slows down allocations noticeably. Memory is
+        traced for the whole process, so the peaks include the allocations of
+        other threads.
+    :returns: the list which receives the records of the metrics computed in
+        the current thread or asyncio task.
+    """
+    # tracemalloc imports a dozen modules, so it is only loaded once needed.
+    import tracemalloc
+
+    records: list[PhaseRecord] = []
+
+    def listener(record: PhaseRecord) -> None:
+        records.append(record)
+        if callback is not None:
+            callback(record)
+
+    if memory:
+        _trace(tracemalloc, 1)
+    token = _listeners.set((*_listeners.get(), listener))
+    try:
+        yield records
+    finally:
+        _listeners.reset(token)
+        if memory:
+            _trace(tracemalloc, -1)
+
+
+def _trace(tracemalloc, change: int) -> None:
+    """Count the contexts tracing memory, tracing it while there are any.
+
+    Tracing started by the caller of the package is left running.
+    """
+    global _tracers, _started_tracing
+    with _tracing_lock:
+        if change > 0 and _tracers == 0:
+            _started_tracing = not tracemalloc.is_tracing()
+            if _started_tracing:
+                tracemalloc.start()
+        _tracers += change
+        if change < 0 and _tracers == 0 and _started_tracing:
+            tracemalloc.stop()
+
+
+class _Phase:
+    """Measures a phase and hands its record to the listeners."""
+
+    __slots__ = ("metric", "name", "sizes", "start", "base")
+
+    def __init__(self, name: str) -> None:
+        self.metric = _metric.get()
+        self.name = name
+        self.sizes: dict[str, int] = {}
+        self.base: int | None = None
+
+    def set(self, **sizes: int) -> None:
+        """Attach the sizes of the data handled by the phase."""
+        self.sizes.update(sizes)
+
+    def __enter__(self) -> "_Phase":
+        import tracemalloc
+
+        if tracemalloc.is_tracing():
+            current, peak = tracemalloc.get_traced_memory()
+            _peaks.set((*_raise_top(_peaks.get(), peak), current))
+            tracemalloc.reset_peak()
+            self.base = current
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *_) -> None:
+        seconds = time.perf_counter() - self.start
+        peak_bytes = None
+        if self.base is not None:
+            import tracemalloc
+
+            peaks = _peaks.get()
+            peak = max(peaks[-1], tracemalloc.get_traced_memory()[1])
+            _peaks.set(_raise_top(peaks[:-1], peak))
+            peak_bytes = peak - self.base
+        record = PhaseRecord(self.metric, self.name, seconds, peak_bytes, self.sizes)
+        for listener in _listeners.get():
+            listener(record)
+
+
+def _raise_top(peaks: tuple[int, ...], peak: int) -> tuple[int, ...]:
+    """Account for a peak in the innermost open phase, if there is one."""
+    if not peaks:
+        return peaks
+    return (*peaks[:-1], max(peaks[-1], peak))
+
+
+class _NullPhase:
+    """Stands in for a phase when nothing is instrumented.
+
+    It is falsy, so that sizes which take some work to count are only counted
+    for measured phases.
+    """
+
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        return False
+
+    def set(self, **sizes: int) -> None:
+        pass
+
+    def __enter__(self) -> "_NullPhase":
+        return self
+
+    def __exit__(self, *_) -> None:
+        pass
+
+
+_NULL_PHASE = _NullPhase()
+
+
+def _phase(name: str) -> _Phase | _NullPhase:
+    """Measure the enclosed block as a phase of the current metric."""
+    if not _listeners.get():
+        return _NULL_PHASE
+    return _Phase(name)
+
+
+def _instrumented(metric: Callable) -> Callable:
+    """Record a ``"total"`` phase around the calls to a public metric.
+
+    Metrics called by another metric are attributed to the outer one.
+    """
+    name = metric.__name__
+
+    @wraps(metric)
+    def wrapper(*args, **kwargs):
+        if not _listeners.get() or _metric.get() is not None:
+            return metric(*args, **kwargs)
+        token = _metric.set(name)
+        try:
+            with _Phase("total"):
+                return metric(*args, **kwargs)
+        finally:
+            _metric.reset(token)
+
+    return wrapper
@@ -0,0 +1,192 @@
+from typing import Hashable, Iterable, Sequence
+
+import numpy as np
+
+from pyresolvemetrics._instrumentation import _phase
+from pyresolvemetrics._utils import Pair, Pairs
+
+_MAX_RECORD_ID = np.iinfo(np.uint32).max
+
+
+def _encode_pairs(pairs: np.ndarray) -> np.ndarray:
+    """Encode unordered pairs of record ids as ``uint64`` keys.
+
+    Each pair becomes ``min << 32 | max``, so ``(a, b)`` and ``(b, a)`` share a
+    key and keys of distinct pairs never collide.
+    """
+    pairs = np.asarray(pairs)
+    if pairs.ndim != 2 or pairs.shape[1] != 2:
+        raise ValueError("pair arrays must have the shape (m, 2)")
+    if len(pairs) == 0:
+        return np.empty(0, dtype=np.uint64)
+    if pairs.min() < 0 or pairs.max() > _MAX_RECORD_ID:
+        raise ValueError(f"record ids must be between 0 and {_MAX_RECORD_ID}")
+    low = np.minimum(pairs[:, 0], pairs[:, 1]).astype(np.uint64)
+    high = np.maximum(pairs[:, 0], pairs[:, 1]).astype(np.uint64)
+    return (low << np.uint64(32)) | high
+
+
+def _sorted_unique(keys: np.ndarray) -> np.ndarray:
+    """Sort keys and drop the repeated ones.
+
+    Sorting is much faster than :func:`numpy.unique` on large ``uint64``
+    arrays, which recent NumPy versions deduplicate through a hash table.
+    """
+    keys = np.sort(keys)
+    if len(keys) > 1:
+        keys = keys[np.concatenate([[True], keys[1:] != keys[:-1]])]
+    return keys
+
+
+def _pair_keys(pairs: np.ndarray) -> np.ndarray:
+    """Encode unordered pairs of record ids as sorted, unique ``uint64`` keys."""
+    return np.unique(_encode_pairs(pairs))
+
+
+def _find_keys(
+    sorted_keys: np.ndarray, keys: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Locate ``keys`` within ``sorted_keys``.
+
+    :returns: the position of each key within ``sorted_keys`` and a mask of
+        the keys which were actually found there.
+    """
+    if len(sorted_keys) == 0:
+        return np.zeros(len(keys), dtype=np.intp), np.zeros(len(keys), dtype=bool)
+    positions = np.minimum(np.searchsorted(sorted_keys, keys), len(sorted_keys) - 1)
+    return positions, sorted_keys[positions] == keys
+
+
+def _key_confusion(
+    gt_keys: np.ndarray, result_keys: np.ndarray
+) -> tuple[int, int, int]:
+    tp = len(np.intersect1d(gt_keys, result_keys, assume_unique=True))
+    return tp, len(result_keys) - tp, len(gt_keys) - tp
+
+
+class _Interner:
+    """Assign dense integer ids to record identifiers.
+
+    Ids are handed out in the order in which identifiers are first seen, so
+    ``list(interner.ids)[i]`` is the identifier of the record with id ``i``.
+    """
+
+    def __init__(self) -> None:
+        self.ids: dict[Hashable, int] = {}
+
+    def pair_ids(self, pairs: Iterable[tuple[Hashable, Hashable]]) -> np.ndarray:
+        """Replace the identifiers of each pair by their ids."""
+        ids = self.ids
+        flat = np.fromiter(
+            (ids.setdefault(item, len(ids)) for pair in pairs for item in pair),
+            dtype=np.int64,
+        )
+        return flat.reshape(-1, 2)
+
+    def pair_keys(self, pairs: Iterable[tuple[Hashable, Hashable]]) -> np.ndarray:
+        """Encode pairs of identifiers as sorted, unique ``uint64`` keys."""
+        return _pair_keys(self.pair_ids(pairs))
+
+    def lookup(
+        self,
+        pairs: Iterable[tuple[Hashable, Hashable]],
+        unknown: dict[Hashable, int] | None = None,
+    ) -> np.ndarray:
+        """Replace the identifiers of each pair by their ids, if they have any.
+
+        Unknown identifiers get temporary ids which are not recorded, so the
+        interner does not grow.
+
+        :param unknown: receives the temporary ids, following those of the
+            interner, e.g. to map them back to their identifiers.
+        """
+        ids = self.ids
+        if unknown is None:
+            unknown = {}
+
+        def _id(item: Hashable) -> int:
+            known = ids.get(item)
+            if known is not None:
+                return known
+            return unknown.setdefault(item, len(ids) + len(unknown))
+
+        flat = np.fromiter(
+            (_id(item) for pair in pairs for item in pair), dtype=np.int64
+        )
+        return flat.reshape(-1, 2)
+
+
+class _PairIndex:
+    """Sorted, unique keys of a set of pairs, along with their record ids.
+
+    Pairs given as an array already hold record ids, whereas the identifiers
+    of other pairs are interned.
+    """
+
+    def __init__(self, pairs: Pairs) -> None:
+        with _phase("index_pairs") as phase:
+            if isinstance(pairs, np.ndarray):
+                self.interner = None
+                self.keys = _pair_keys(pairs)
+            else:
+                self.interner = _Interner()
+                self.keys = self.interner.pair_keys(pairs)
+            phase.set(pairs=len(self.keys))
+
+    @classmethod
+    def from_keys(
+        cls, keys: np.ndarray, records: Sequence[Hashable] | None = None
+    ) -> "_PairIndex":
+        """Wrap keys of pairs of record ids which are already sorted and unique.
+
+        :param records: the identifiers of the records, in the order of their
+            ids, when pairs are to be given as pairs of identifiers.
+        """
+        index = object.__new__(cls)
+        index.interner = None
+        if records is not None:
+            index.interner = _Interner()
+            index.interner.ids = dict(zip(records, range(len(records))))
+        index.keys = keys
+        return index
+
+    def pair_ids(self, pairs: Iterable[Pair] | np.ndarray) -> np.ndarray:
+        """Replace the identifiers of each pair by the ids of this index."""
+        if self.interner is None:
+            if not isinstance(pairs, np.ndarray):
+                pairs = np.array(list(pairs), dtype=np.int64).reshape(-1, 2)
+            return pairs
+        return self.interner.lookup(pairs)
+
+    def encode(self, pairs: Iterable[Pair] | np.ndarray) -> np.ndarray:
+        """Encode pairs as sorted, unique keys comparable to the indexed ones."""
+        return _pair_keys(self.pair_ids(pairs))
+
+    def confusion(self, pairs: Iterable[Pair] | np.ndarray) -> tuple[int, int, int]:
+        """Count the true positives, false positives and false negatives."""
+        with _phase("encode_pairs") as phase:
+            keys = self.encode(pairs)
+            phase.set(pairs=len(keys))
+        with _phase("intersect_pairs") as phase:
+            counts = _key_confusion(self.keys, keys)
+            phase.set(ground_truth_pairs=len(self.keys), result_pairs=len(keys))
+        return counts
+
+
+def to_pair_arrays(
+    ground_truth: Iterable[tuple[Hashable, Hashable]],
+    result: Iterable[tuple[Hashable, Hashable]],
+) -> tuple[np.ndarray, np.ndarray]:
+    """Convert two sets of pairs of ``Hashable`` items into pair arrays.
+
+    Every distinct identifier is replaced by an integer, assigned in the order
+    in which identifiers are first encountered in the ``ground_truth`` and then
+    in the ``result``.
+
+    :param ground_truth: a set of pairs of known matching identifiers.
+    :param result: a set of pairs of identifiers output by an entity matcher.
+    :returns: a tuple of ``(m, 2)`` ``int64`` arrays holding the ground truth
+        and the result pairs.
+    """
+    interner = _Interner()
+    return interner.pair_ids(ground_truth), interner.pair_ids(result)
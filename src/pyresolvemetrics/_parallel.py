@@ -0,0 +1,102 @@
+import itertools
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Iterable, Iterator, Sequence
+
+from pyresolvemetrics._algebraic import _ALL_METRICS, Partition, _select_metrics
+from pyresolvemetrics._contingency import _PartitionIndex
+from pyresolvemetrics._ground_truth import GroundTruth, _partition_index
+
+# Objects shared with the workers of the running pools, by pool. With the
+# "fork" start method the workers inherit them instead of unpickling them.
+_pool_objects: dict[int, Any] = {}
+_pool_keys = itertools.count()
+_pool_lock = threading.Lock()
+
+# Object shared with the current worker process by its pool.
+_worker_object: Any = None
+
+
+def _adopt(key: int, shared: Any = None) -> None:
+    global _worker_object
+    _worker_object = _pool_objects[key] if shared is None else shared
+
+
+def _shared() -> Any:
+    """The object shared with the current worker by :func:`_process_pool`."""
+    return _worker_object
+
+
+@contextmanager
+def _process_pool(workers: int, shared: Any) -> Iterator[ProcessPoolExecutor]:
+    """Run a pool of processes whose workers read ``shared`` with :func:`_shared`.
+
+    Each pool registers its object under a key of its own, so that pools
+    started concurrently, from several threads, do not see each other's.
+    """
+    with _pool_lock:
+        key = next(_pool_keys)
+        _pool_objects[key] = shared
+    try:
+        if "fork" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("fork")
+            pool = ProcessPoolExecutor(
+                workers, context, initializer=_adopt, initargs=(key,)
+            )
+        else:
+            pool = ProcessPoolExecutor(
+                workers, initializer=_adopt, initargs=(key, shared)
+            )
+        with pool:
+            yield pool
+    finally:
+        with _pool_lock:
+            del _pool_objects[key]
+
+
+def _evaluate(
+    index: _PartitionIndex, result: Partition, metrics: Sequence[str]
+) -> dict[str, float]:
+    table = index.contingency(result)
+    return {name: _ALL_METRICS[name](table) for name in metrics}
+
+
+def _evaluate_shared(result: Partition, metrics: Sequence[str]) -> dict[str, float]:
+    return _evaluate(_shared(), result, metrics)
+
+
+def evaluate_many(
+    ground_truth: Partition | GroundTruth,
+    results: Iterable[Partition],
+    metrics: Iterable[str] | None = None,
+    workers: int = 1,
+) -> list[dict[str, float]]:
+    """Evaluate several results against the same ground truth.
+
+    The ground truth is indexed once, unless it already is a
+    :class:`GroundTruth`. With more than one worker, the results
+    are evaluated in parallel by a pool of processes. On platforms which
+    support the ``fork`` start method the workers inherit the index from the
+    parent process, otherwise it is sent once to each worker.
+
+    :param ground_truth: a set of sets, or an array holding the ground truth
+        cluster label of each record. Represents the ideal algebraic partition
+        induced by the entity resolution relation over an algebraic set. It
+        may also be indexed beforehand as a :class:`GroundTruth`.
+    :param results: the partitions produced by entity resolution tasks over the
+        same algebraic set as the ground truth, in the same form as the
+        ``ground_truth``.
+    :param metrics: the names of the algebraic metrics to compute, as listed in
+        :attr:`pyresolvemetrics.Evaluation.METRICS`. All of them by default.
+    :param workers: the number of processes evaluating results in parallel.
+    :returns: a dictionary of metric values for each result, in order.
+    """
+    metrics = _select_metrics(metrics)
+    index = _partition_index(ground_truth)
+    if workers <= 1:
+        return [_evaluate(index, result, metrics) for result in results]
+
+    with _process_pool(workers, index) as pool:
+        return list(pool.map(_evaluate_shared, results, itertools.repeat(metrics)))
@@ -1,23 +1,89 @@
-from typing import Hashable
+from __future__ import annotations
 
-from pyresolvemetrics._utils import _safe_division, _symmetric_hash
+from typing import TYPE_CHECKING, NamedTuple
 
-Pair = tuple[Hashable, Hashable]
+from pyresolvemetrics._instrumentation import _instrumented, _phase
+from pyresolvemetrics._utils import Pairs, _safe_division
 
+if TYPE_CHECKING:
+    from pyresolvemetrics._ground_truth import GroundTruth
 
-def _true_positives(ground_truth: set[int], result: set[int]) -> int:
-    return sum(1 for x in result if x in ground_truth)
+# Few pairs given as Python collections are matched as sets of frozensets, so
+# that scoring them does not import NumPy. Beyond the limit, encoding the pairs
+# as integer arrays is faster despite the cost of the import.
+_COLLECTIONS = (set, frozenset, list, tuple)
+_COLLECTION_LIMIT = 10_000
 
 
-def _false_positives(ground_truth: set[int], result: set[int]) -> int:
-    return sum(1 for x in result if x not in ground_truth)
+class Confusion(NamedTuple):
+    """Outcome counts of an entity matching task.
+
+    :param tp: matches in the result which are also found in the ground truth.
+    :param fp: matches in the result which are not found in the ground truth.
+    :param fn: matches in the ground truth which are not found in the result.
+    """
+
+    tp: int
+    fp: int
+    fn: int
 
 
-def _false_negatives(ground_truth: set[int], result: set[int]) -> int:
-    return sum(1 for x in ground_truth if x not in result)
+@_instrumented
+def confusion(ground_truth: Pairs | GroundTruth, result: Pairs) -> Confusion:
+    r"""Count the outcomes of an entity matching task in a single pass.
 
+    The returned counts can be handed to :func:`precision`, :func:`recall`,
+    :func:`f1` and the other scores in place of the pairs, so that the inputs
+    are only processed once.
 
-def precision(ground_truth: set[Pair], result: set[Pair]) -> float:
+    :param ground_truth: a set of pairs of ``Hashable`` items, or an
+        ``(m, 2)`` array of integer identifiers. Each pair represents a known
+        pair of matching entity reference identifiers. It may also be indexed
+        beforehand as a :class:`GroundTruth`, including from a partition, in
+        which case the result holds pairs of records of that partition.
+    :param result: a set of pairs of ``Hashable`` items, or an ``(m, 2)``
+        array of integer identifiers. Each pair represents a pair of
+        identifiers for entity references which were output by an entity
+        matcher.
+    """
+    if (
+        isinstance(ground_truth, _COLLECTIONS)
+        and isinstance(result, _COLLECTIONS)
+        and len(ground_truth) + len(result) <= _COLLECTION_LIMIT
+    ):
+        return Confusion(*_collection_confusion(ground_truth, result))
+    from pyresolvemetrics._ground_truth import _pair_confusion
+
+    return Confusion(*_pair_confusion(ground_truth, result))
+
+
+def _collection_confusion(ground_truth, result) -> tuple[int, int, int]:
+    with _phase("index_pairs") as phase:
+        gt_keys = set(map(frozenset, ground_truth))
+        phase.set(pairs=len(gt_keys))
+    with _phase("encode_pairs") as phase:
+        result_keys = set(map(frozenset, result))
+        phase.set(pairs=len(result_keys))
+    with _phase("intersect_pairs") as phase:
+        tp = len(gt_keys & result_keys)
+        phase.set(ground_truth_pairs=len(gt_keys), result_pairs=len(result_keys))
+    return tp, len(result_keys) - tp, len(gt_keys) - tp
+
+
+def _as_confusion(
+    ground_truth: Pairs | GroundTruth | Confusion, result: Pairs | None
+) -> Confusion:
+    if isinstance(ground_truth, Confusion):
+        if result is not None:
+            raise ValueError("a confusion must not be combined with a result")
+        return ground_truth
+    return confusion(ground_truth, result)
+
+
+@_instrumented
+def precision(
+    ground_truth: Pairs | GroundTruth | Confusion, result: Pairs | None = None
+) -> float:
     r"""Evaluate the precision of an entity matching task.
 
     True positives (tp) are matches in the ``result`` which are also found in the
@@ -28,20 +94,24 @@ def precision(ground_truth: set[Pair], result: set[Pair]) -> float:
 
         tp \over tp + fp
 
-    :param ground_truth: a set of pairs of ``Hashable`` items. Each pair
-        represents a known pair of matching entity reference identifiers.
-    :param result: a set of pairs of ``Hashable`` items. Each pair represents
-        a pair of identifiers for entity references which were output by an
-        entity matcher.
+    :param ground_truth: a set of pairs of ``Hashable`` items, or an
+        ``(m, 2)`` array of integer identifiers. Each pair represents a known
+        pair of matching entity reference identifiers. It may also be indexed
+        beforehand as a :class:`GroundTruth`, or a :class:`Confusion` computed
+        beforehand may be passed instead, without a ``result``.
+    :param result: a set of pairs of ``Hashable`` items, or an ``(m, 2)``
+        array of integer identifiers. Each pair represents a pair of
+        identifiers for entity references which were output by an entity
+        matcher.
     """
-    gt_hashes = set(map(_symmetric_hash, ground_truth))
-    result_hashes = set(map(_symmetric_hash, result))
-    tp = _true_positives(gt_hashes, result_hashes)
-    fp = _false_positives(gt_hashes, result_hashes)
+    tp, fp, _ = _as_confusion(ground_truth, result)
     return _safe_division(tp, tp + fp)
 
 
-def recall(ground_truth: set[Pair], result: set[Pair]) -> float:
+@_instrumented
+def recall(
+    ground_truth: Pairs | GroundTruth | Confusion, result: Pairs | None = None
+) -> float:
     r"""Evaluate the recall of an entity matching task.
 
     True positives (tp) are matches in the ``result`` which are also found in the
@@ -53,20 +123,24 @@ def recall(ground_truth: set[Pair], result: set[Pair]) -> float:
 
         tp \over tp + fn
 
-    :param ground_truth: a set of pairs of ``Hashable`` items. Each pair
-        represents a known pair of matching entity reference identifiers.
-    :param result: a set of pairs of ``Hashable`` items. Each pair represents
-        a pair of identifiers for entity references which were output by an
-        entity matcher.
+    :param ground_truth: a set of pairs of ``Hashable`` items, or an
+        ``(m, 2)`` array of integer identifiers. Each pair represents a known
+        pair of matching entity reference identifiers. It may also be indexed
+        beforehand as a :class:`GroundTruth`, or a :class:`Confusion` computed
+        beforehand may be passed instead, without a ``result``.
+    :param result: a set of pairs of ``Hashable`` items, or an ``(m, 2)``
+        array of integer identifiers. Each pair represents a pair of
+        identifiers for entity references which were output by an entity
+        matcher.
     """
-    gt_hashes = set(map(_symmetric_hash, ground_truth))
-    result_hashes = set(map(_symmetric_hash, result))
-    tp = _true_positives(gt_hashes, result_hashes)
-    fn = _false_negatives(gt_hashes, result_hashes)
+    tp, _, fn = _as_confusion(ground_truth, result)
     return _safe_division(tp, tp + fn)
 
 
-def f1(ground_truth: set[Pair], result: set[Pair]) -> float:
+@_instrumented
+def f1(
+    ground_truth: Pairs | GroundTruth | Confusion, result: Pairs | None = None
+) -> float:
     r"""Evaluate the F1 score of an entity matching task.
 
     The F1 score is computed as the harmonic mean of precision (p) and recall (r).
@@ -75,12 +149,74 @@ def f1(ground_truth: set[Pair], result: set[Pair]) -> float:
 
         2 \cdot p \cdot r \over p + r
 
-    :param ground_truth: a set of pairs of ``Hashable`` items. Each pair
-        represents a known pair of matching entity reference identifiers.
-    :param result: a set of pairs of ``Hashable`` items. Each pair represents
-        a pair of identifiers for entity references which were output by an
-        entity matcher.
+    :param ground_truth: a set of pairs of ``Hashable`` items, or an
+        ``(m, 2)`` array of integer identifiers. Each pair represents a known
+        pair of matching entity reference identifiers. It may also be indexed
+        beforehand as a :class:`GroundTruth`, or a :class:`Confusion` computed
+        beforehand may be passed instead, without a ``result``.
+    :param result: a set of pairs of ``Hashable`` items, or an ``(m, 2)``
+        array of integer identifiers. Each pair represents a pair of
+        identifiers for entity references which were output by an entity
+        matcher.
+    """
+    return f_beta(ground_truth, result, beta=1.0)
+
+
+@_instrumented
+def f_beta(
+    ground_truth: Pairs | GroundTruth | Confusion,
+    result: Pairs | None = None,
+    beta: float = 1.0,
+) -> float:
+    r"""Evaluate the F-beta score of an entity matching task.
+
+    The F-beta score is a weighted harmonic mean of precision (p) and recall
+    (r), where recall is considered ``beta`` times as important as precision.
+
+    .. math::
+
+        (1 + \beta^2) \cdot p \cdot r \over \beta^2 \cdot p + r
+
+    :param ground_truth: a set of pairs of ``Hashable`` items, or an
+        ``(m, 2)`` array of integer identifiers. Each pair represents a known
+        pair of matching entity reference identifiers. It may also be indexed
+        beforehand as a :class:`GroundTruth`, or a :class:`Confusion` computed
+        beforehand may be passed instead, without a ``result``.
+    :param result: a set of pairs of ``Hashable`` items, or an ``(m, 2)``
+        array of integer identifiers. Each pair represents a pair of
+        identifiers for entity references which were output by an entity
+        matcher.
+    :param beta: the relative importance of recall over precision.
+    """
+    counts = _as_confusion(ground_truth, result)
+    p = precision(counts)
+    r = recall(counts)
+    beta_2 = beta**2
+    return _safe_division((1 + beta_2) * p * r, beta_2 * p + r)
+
+
+@_instrumented
+def jaccard_index(
+    ground_truth: Pairs | GroundTruth | Confusion, result: Pairs | None = None
+) -> float:
+    r"""Evaluate the Jaccard index of an entity matching task.
+
+    The Jaccard index is the accuracy of the matcher when true negatives are
+    disregarded, which is customary since they vastly outnumber the matches.
+
+    .. math::
+
+        tp \over tp + fp + fn
+
+    :param ground_truth: a set of pairs of ``Hashable`` items, or an
+        ``(m, 2)`` array of integer identifiers. Each pair represents a known
+        pair of matching entity reference identifiers. It may also be indexed
+        beforehand as a :class:`GroundTruth`, or a :class:`Confusion` computed
+        beforehand may be passed instead, without a ``result``.
+    :param result: a set of pairs of ``Hashable`` items, or an ``(m, 2)``
+        array of integer identifiers. Each pair represents a pair of
+        identifiers for entity references which were output by an entity
+        matcher.
     """
-    p = precision(ground_truth, result)
-    r = recall(ground_truth, result)
-    return _safe_division(2 * p * r, p + r)
+    tp, fp, fn = _as_confusion(ground_truth, result)
+    return _safe_division(tp, tp + fp + fn)
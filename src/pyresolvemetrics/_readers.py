@@ -0,0 +1,137 @@
+import csv
+import itertools
+import json
+import os
+import queue
+import threading
+from typing import Hashable, Iterable, Iterator
+
+from pyresolvemetrics._storage import _MAGIC, _as_record
+
+PathLike = str | os.PathLike
+
+FORMATS = ("jsonl", "csv", "binary")
+_SUFFIXES = {".jsonl": "jsonl", ".ndjson": "jsonl", ".csv": "csv"}
+
+
+def detect_format(path: PathLike) -> str:
+    """Tell the format of a file from its magic bytes or its extension."""
+    with open(path, "rb") as file:
+        if file.read(len(_MAGIC)) == _MAGIC:
+            return "binary"
+    suffix = os.path.splitext(os.fspath(path))[1].lower()
+    if suffix not in _SUFFIXES:
+        raise ValueError(f"cannot tell the format of {os.fspath(path)}")
+    return _SUFFIXES[suffix]
+
+
+def _field(text: str) -> Hashable:
+    # Identifiers written as integers in CSV files match those of other files.
+    digits = text[1:] if text.startswith("-") else text
+    return int(text) if digits.isdecimal() else text
+
+
+def _rows(path: PathLike, format: str) -> Iterator[list]:
+    """Parse the rows of a text file, one list of values per line.
+
+    The first line of a CSV file is a header, and is skipped.
+    """
+    with open(path, newline="") as file:
+        if format == "csv":
+            reader = csv.reader(file)
+            next(reader, None)
+            for row in reader:
+                if row:
+                    yield [_field(value) for value in row]
+        else:
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def _batched(items: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def prefetch(chunks: Iterable, depth: int = 2) -> Iterator:
+    """Produce the chunks in a background thread, ahead of their consumer.
+
+    Reading and parsing the next chunks overlaps with the processing of the
+    current one. Errors raised while producing the chunks are raised again in
+    the consumer.
+
+    :param depth: the largest number of chunks produced in advance.
+    """
+    buffer: queue.Queue = queue.Queue(depth)
+    done = object()
+    stop = threading.Event()
+
+    def produce() -> None:
+        try:
+            for chunk in chunks:
+                if stop.is_set():
+                    return
+                buffer.put(chunk)
+            buffer.put(done)
+        except BaseException as error:
+            buffer.put(error)
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while (chunk := buffer.get()) is not done:
+            if isinstance(chunk, BaseException):
+                raise chunk
+            yield chunk
+    finally:
+        stop.set()
+        # Unblock a producer waiting for room in the buffer.
+        while thread.is_alive():
+            try:
+                buffer.get_nowait()
+            except queue.Empty:
+                thread.join(0.01)
+
+
+def read_pairs(
+    path: PathLike, format: str, chunk_size: int = 100_000
+) -> Iterator[list[tuple[Hashable, Hashable]]]:
+    """Read the pairs of a JSONL or CSV file in chunks.
+
+    Each line of a JSONL file is a JSON array of two identifiers, and each row
+    of a CSV file holds two identifiers in its first two columns.
+    """
+    pairs = ((_as_record(row[0]), _as_record(row[1])) for row in _rows(path, format))
+    return prefetch(_batched(pairs, chunk_size))
+
+
+def read_assignments(
+    path: PathLike, format: str, chunk_size: int = 100_000
+) -> Iterator[tuple[list[Hashable], list[int]]]:
+    """Read the clusters of a JSONL or CSV file in chunks.
+
+    Each line of a JSONL file is a JSON array holding the identifiers of the
+    records of a cluster, and each row of a CSV file holds the identifier of
+    a record and the label of its cluster in its first two columns.
+
+    :returns: chunks of records, along with their cluster numbers. Clusters
+        are numbered in the order in which they are first encountered.
+    """
+    if format == "csv":
+        clusters: dict[Hashable, int] = {}
+        assignments = (
+            (row[0], clusters.setdefault(row[1], len(clusters)))
+            for row in _rows(path, format)
+        )
+    else:
+        assignments = (
+            (_as_record(record), label)
+            for label, cluster in enumerate(_rows(path, format))
+            for record in cluster
+        )
+    return prefetch(
+        ([record for record, _ in chunk], [label for _, label in chunk])
+        for chunk in _batched(assignments, chunk_size)
+    )
@@ -0,0 +1,424 @@
+from statistics import NormalDist
+from typing import Iterable, NamedTuple
+
+import numpy as np
+
+from pyresolvemetrics._algebraic import _METRICS, Partition, _select_metrics
+from pyresolvemetrics._contingency import Contingency
+from pyresolvemetrics._ground_truth import GroundTruth, _contingency
+from pyresolvemetrics._parallel import _process_pool, _shared
+from pyresolvemetrics._utils import _comb_n_2
+
+_COUNTS = (
+    "n_rows",
+    "n_cols",
+    "overlap",
+    "total",
+    "total_pairs",
+    "cell_pairs",
+    "row_pairs",
+    "col_pairs",
+    "ground_truth_records",
+    "ground_truth_record_pairs",
+    "ground_truth_pairs",
+    "result_pairs",
+    "exact_matches",
+)
+
+# Upper bound on the elements of the intermediate arrays of a batch of
+# replicates, which bounds the number of replicates resampled at once.
+_BATCH_ELEMENTS = 1 << 22
+
+
+class ConfidenceInterval(NamedTuple):
+    """Uncertainty of a metric estimated by resampling.
+
+    :param estimate: the value of the metric over the original partitions.
+    :param low: the lower bound of the confidence interval.
+    :param high: the upper bound of the confidence interval.
+    :param standard_error: the standard deviation of the metric across the
+        replicates.
+    """
+
+    estimate: float
+    low: float
+    high: float
+    standard_error: float
+
+
+class _Replicate:
+    """The contingency counts of a single replicate."""
+
+    __slots__ = _COUNTS
+
+    def __init__(self, values: Iterable[float]) -> None:
+        for name, value in zip(_COUNTS, values):
+            setattr(self, name, value)
+
+
+def _metric_values(
+    counts: dict[str, np.ndarray], metrics: tuple[str, ...]
+) -> dict[str, np.ndarray]:
+    replicates = [
+        _Replicate(values)
+        for values in zip(*(counts[name].tolist() for name in _COUNTS))
+    ]
+    return {
+        name: np.array([_METRICS[name](table) for table in replicates], dtype=float)
+        for name in metrics
+    }
+
+
+def _grouped(values: np.ndarray, groups: np.ndarray, n_groups: int) -> np.ndarray:
+    """Sum the rows of ``values`` by group, for every replicate column."""
+    size = values.shape[1]
+    index = (groups[:, None] * size + np.arange(size)).ravel()
+    sums = np.bincount(index, values.ravel(), minlength=n_groups * size)
+    return sums.reshape(n_groups, size)
+
+
+def _pairs(sums: np.ndarray, squares: np.ndarray) -> np.ndarray:
+    """Weighted pairs of distinct units, given the sums of their weights."""
+    return (sums**2 - squares) / 2
+
+
+def _multinomial(rng: np.random.Generator, n: int, size: int) -> np.ndarray:
+    """Draw how many times each of ``n`` units is picked in ``n`` draws.
+
+    :returns: an ``(n, size)`` array holding the picks of each replicate in a
+        column.
+    """
+    picks = rng.integers(0, n, (size, n)) * size + np.arange(size)[:, None]
+    return np.bincount(picks.ravel(), minlength=n * size).reshape(n, size)
+
+
+class _ClusterResampler:
+    """Contingency counts of partitions resampled by ground truth cluster.
+
+    A replicate draws every ground truth cluster ``r`` ``m[r]`` times. Each
+    pair of records then weighs as many times as it is drawn: ``m[r]`` for two
+    records of cluster ``r`` and ``m[r] * m[s]`` for records of two clusters,
+    while records missing from the ground truth weigh once. A cluster weighs
+    the average weight of its records. Only the pairs within result clusters
+    which intersect several ground truth clusters are not linear in ``m``.
+    """
+
+    def __init__(self, table: Contingency) -> None:
+        rows, cols, counts = table.rows, table.cols, table.counts
+        gt_sizes, result_sizes = table.ground_truth_sizes, table.result_sizes
+        n_rows, n_cols = table.n_rows, table.n_cols
+        extra = result_sizes - table.col_sums  # records missing from the ground truth
+        exact = (counts == gt_sizes[rows]) & (counts == result_sizes[cols])
+
+        def per_row(weights: np.ndarray) -> np.ndarray:
+            return np.bincount(rows, weights, minlength=n_rows)
+
+        self.linear = np.column_stack(
+            [
+                np.ones(n_rows),
+                per_row(np.ones(len(rows))),
+                per_row(exact),
+                per_row(_comb_n_2(counts)),
+                _comb_n_2(table.row_sums),
+                _comb_n_2(gt_sizes),
+                table.row_sums,
+                gt_sizes,
+                per_row(counts / result_sizes[cols]),
+                per_row(counts * extra[cols]),
+            ]
+        )
+        self.squared = np.column_stack([table.row_sums**2, gt_sizes**2])
+        filled = result_sizes > 0
+        self.constant_cols = float(
+            np.count_nonzero(~filled) + (extra[filled] / result_sizes[filled]).sum()
+        )
+        self.constant_pairs = float(_comb_n_2(extra).sum())
+
+        cells_per_col = np.bincount(cols, minlength=n_cols)
+        mixed = np.flatnonzero(cells_per_col[cols] > 1)
+        self.mixed_rows = rows[mixed]
+        self.mixed_counts = counts[mixed]
+        _, self.mixed_cols = np.unique(cols[mixed], return_inverse=True)
+        self.n_mixed = int(self.mixed_cols.max(initial=-1)) + 1
+        self.n_rows = n_rows
+
+    def batch_size(self) -> int:
+        return max(1, _BATCH_ELEMENTS // max(self.n_rows, len(self.mixed_rows), 1))
+
+    def replicate(
+        self, seed: np.random.SeedSequence, size: int
+    ) -> dict[str, np.ndarray]:
+        rng = np.random.default_rng(seed)
+        return self.counts(_multinomial(rng, self.n_rows, size).astype(float))
+
+    def counts(self, copies: np.ndarray) -> dict[str, np.ndarray]:
+        """Compute the counts of the replicates given the copies of each cluster."""
+        linear = self.linear.T @ copies
+        squared = self.squared.T @ copies**2
+        weights = copies[self.mixed_rows] * self.mixed_counts[:, None]
+        sums = _grouped(weights, self.mixed_cols, self.n_mixed)
+        squares = _grouped(weights**2, self.mixed_cols, self.n_mixed)
+        col_pairs = linear[3] + _pairs(sums, squares).sum(axis=0)
+        return {
+            "n_rows": linear[0],
+            "n_cols": self.constant_cols + linear[8],
+            "overlap": linear[1],
+            "total": linear[6],
+            "total_pairs": _pairs(linear[6], squared[0]) + linear[4],
+            "cell_pairs": linear[3],
+            "row_pairs": linear[4],
+            "col_pairs": col_pairs,
+            "ground_truth_records": linear[7],
+            "ground_truth_record_pairs": _pairs(linear[7], squared[1]) + linear[5],
+            "ground_truth_pairs": linear[5],
+            "result_pairs": col_pairs + self.constant_pairs + linear[9],
+            "exact_matches": linear[2],
+        }
+
+
+class _RecordResampler:
+    """Contingency counts of partitions resampled by record.
+
+    A replicate draws the records with replacement and every record weighs
+    as many times as it is drawn. A pair of distinct records weighs the
+    product of their weights, and a cluster or an intersection of clusters
+    weighs the average weight of its records. Records are grouped by the
+    cells of the contingency table, extended with the records which are
+    missing from either partition.
+    """
+
+    def __init__(self, table: Contingency) -> None:
+        gt_only = table.ground_truth_sizes - table.row_sums
+        result_only = table.result_sizes - table.col_sums
+        gt_rows = np.flatnonzero(gt_only)
+        result_cols = np.flatnonzero(result_only)
+        sizes = np.concatenate(
+            [table.counts, gt_only[gt_rows], result_only[result_cols]]
+        )
+        self.records = np.repeat(np.arange(len(sizes)), sizes)
+        self.n_groups = len(sizes)
+        self.n_cells = len(table.counts)
+        self.cell_sizes = table.counts[:, None]
+        self.gt_rows = np.concatenate([table.rows, gt_rows])
+        self.result_cols = np.concatenate([table.cols, result_cols])
+        self.table = table
+        self.exact = (table.counts == table.ground_truth_sizes[table.rows]) & (
+            table.counts == table.result_sizes[table.cols]
+        )
+
+    def batch_size(self) -> int:
+        return max(1, _BATCH_ELEMENTS // max(len(self.records), 1))
+
+    def replicate(
+        self, seed: np.random.SeedSequence, size: int
+    ) -> dict[str, np.ndarray]:
+        rng = np.random.default_rng(seed)
+        draws = _multinomial(rng, len(self.records), size).astype(float)
+        return self.counts(draws)
+
+    def counts(self, draws: np.ndarray) -> dict[str, np.ndarray]:
+        """Compute the counts of the replicates given the draws of each record."""
+        table = self.table
+        sums = _grouped(draws, self.records, self.n_groups)
+        squares = _grouped(draws**2, self.records, self.n_groups)
+        cells = slice(self.n_cells)
+        gt_groups = slice(len(self.gt_rows))
+        result_groups = np.r_[cells, len(self.gt_rows) : self.n_groups]
+
+        def by_cluster(groups, clusters, n_clusters):
+            return (
+                _grouped(sums[groups], clusters, n_clusters),
+                _grouped(squares[groups], clusters, n_clusters),
+            )
+
+        gt_sums, gt_squares = by_cluster(gt_groups, self.gt_rows, table.n_rows)
+        row_sums, row_squares = by_cluster(cells, table.rows, table.n_rows)
+        res_sums, res_squares = by_cluster(
+            result_groups, self.result_cols, table.n_cols
+        )
+        col_sums, col_squares = by_cluster(cells, table.cols, table.n_cols)
+        shared, shared_squares = sums[cells], squares[cells]
+        mean = shared / self.cell_sizes
+        total = shared.sum(axis=0)
+        gt_records = gt_sums.sum(axis=0)
+        return {
+            "n_rows": _cluster_weights(gt_sums, table.ground_truth_sizes),
+            "n_cols": _cluster_weights(res_sums, table.result_sizes),
+            "overlap": mean.sum(axis=0),
+            "total": total,
+            "total_pairs": _pairs(total, shared_squares.sum(axis=0)),
+            "cell_pairs": _pairs(shared, shared_squares).sum(axis=0),
+            "row_pairs": _pairs(row_sums, row_squares).sum(axis=0),
+            "col_pairs": _pairs(col_sums, col_squares).sum(axis=0),
+            "ground_truth_records": gt_records,
+            "ground_truth_record_pairs": _pairs(gt_records, gt_squares.sum(axis=0)),
+            "ground_truth_pairs": _pairs(gt_sums, gt_squares).sum(axis=0),
+            "result_pairs": _pairs(res_sums, res_squares).sum(axis=0),
+            "exact_matches": mean[self.exact].sum(axis=0),
+        }
+
+
+def _cluster_weights(sums: np.ndarray, sizes: np.ndarray) -> np.ndarray:
+    """Total weight of the clusters, each weighing the mean of its records."""
+    empty = sizes == 0
+    return (sums[~empty] / sizes[~empty, None]).sum(axis=0) + np.count_nonzero(empty)
+
+
+_RESAMPLERS = {"clusters": _ClusterResampler, "records": _RecordResampler}
+
+
+def _replicate_shared(seed: np.random.SeedSequence, size: int):
+    return _shared().replicate(seed, size)
+
+
+def _interval(
+    estimate: float, values: np.ndarray, confidence: float
+) -> ConfidenceInterval:
+    alpha = (1 - confidence) / 2
+    low, high = np.quantile(values, [alpha, 1 - alpha]).tolist()
+    return ConfidenceInterval(estimate, low, high, float(np.std(values, ddof=1)))
+
+
+def bootstrap(
+    ground_truth: Partition | GroundTruth,
+    result: Partition,
+    metrics: Iterable[str] | None = None,
+    n_resamples: int = 1000,
+    confidence: float = 0.95,
+    unit: str = "clusters",
+    seed: int | None = None,
+    workers: int = 1,
+) -> dict[str, ConfidenceInterval]:
+    """Estimate percentile bootstrap confidence intervals of algebraic metrics.
+
+    Replicates are resampled from the contingency table of the two
+    partitions rather than from the partitions themselves: the counts every
+    metric derives from are computed for a batch of replicates at once, with
+    a few vectorized passes over the clusters or the records.
+
+    With ``unit="clusters"``, each replicate draws the clusters of the ground
+    truth with replacement, which keeps the records of an entity together.
+    With ``unit="records"``, each replicate draws the records with
+    replacement. Either way, the units drawn several times are weighted
+    rather than duplicated, so that a unit is never paired with its own copy.
+
+    :param ground_truth: a set of sets, or an array holding the ground truth
+        cluster label of each record. Represents the ideal algebraic partition
+        induced by the entity resolution relation over an algebraic set. It
+        may also be indexed beforehand as a :class:`GroundTruth`.
+    :param result: a set of sets, or an array holding the result cluster label
+        of each record. Represents the partition produced by the entity
+        resolution task over the same algebraic set as the ground truth.
+    :param metrics: the names of the algebraic metrics to estimate, among
+        those derived from pair and cluster counts, as listed in
+        :attr:`pyresolvemetrics.ResolutionTracker.METRICS`. All of them by
+        default.
+    :param n_resamples: the number of replicates.
+    :param confidence: the probability that an interval holds the metric.
+    :param unit: ``"clusters"`` or ``"records"``, what is drawn with
+        replacement.
+    :param seed: the seed of the random draws. Results only depend on the
+        seed, not on the number of ``workers``.
+    :param workers: the number of processes computing replicates in parallel.
+    :returns: a dictionary mapping the name of each metric to its interval.
+    """
+    metrics = _select_metrics(metrics, _METRICS)
+    if unit not in _RESAMPLERS:
+        raise ValueError(f"unknown resampling unit: {unit}")
+    if n_resamples < 2:
+        raise ValueError("at least two replicates are needed")
+    table = _contingency(ground_truth, result)
+    resampler = _RESAMPLERS[unit](table)
+    batch = resampler.batch_size()
+    sizes = [min(batch, n_resamples - start) for start in range(0, n_resamples, batch)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    if workers <= 1:
+        batches = list(map(resampler.replicate, seeds, sizes))
+    else:
+        with _process_pool(workers, resampler) as pool:
+            batches = list(pool.map(_replicate_shared, seeds, sizes))
+
+    counts = {name: np.concatenate([b[name] for b in batches]) for name in _COUNTS}
+    values = _metric_values(counts, metrics)
+    return {
+        name: _interval(_METRICS[name](table), values[name], confidence)
+        for name in metrics
+    }
+
+
+def jackknife(
+    ground_truth: Partition | GroundTruth,
+    result: Partition,
+    metrics: Iterable[str] | None = None,
+    confidence: float = 0.95,
+) -> dict[str, ConfidenceInterval]:
+    """Estimate jackknife confidence intervals of algebraic metrics.
+
+    Each replicate leaves out one cluster of the ground truth, along with its
+    records in the result. Removing a cluster only changes the counts of the
+    result clusters which intersect it, so the counts of every replicate are
+    derived from those of the full table in a single pass over its cells.
+    The intervals assume the metrics are normally distributed.
+
+    :param ground_truth: a set of sets, or an array holding the ground truth
+        cluster label of each record. Represents the ideal algebraic partition
+        induced by the entity resolution relation over an algebraic set. It
+        may also be indexed beforehand as a :class:`GroundTruth`.
+    :param result: a set of sets, or an array holding the result cluster label
+        of each record. Represents the partition produced by the entity
+        resolution task over the same algebraic set as the ground truth.
+    :param metrics: the names of the algebraic metrics to estimate, among
+        those derived from pair and cluster counts, as listed in
+        :attr:`pyresolvemetrics.ResolutionTracker.METRICS`. All of them by
+        default.
+    :param confidence: the probability that an interval holds the metric.
+    :returns: a dictionary mapping the name of each metric to its interval.
+    """
+    metrics = _select_metrics(metrics, _METRICS)
+    table = _contingency(ground_truth, result)
+    n = table.n_rows
+    if n < 2:
+        raise ValueError("at least two ground truth clusters are needed")
+    rows, cols, counts = table.rows, table.cols, table.counts
+    col_sums, result_sizes = table.col_sums[cols], table.result_sizes[cols]
+
+    def per_row(weights: np.ndarray) -> np.ndarray:
+        return np.bincount(rows, weights, minlength=n).astype(np.int64)
+
+    whole = counts == table.ground_truth_sizes[rows]
+    exact = whole & (counts == result_sizes)
+    # A result cluster left with a single ground truth cluster may match it.
+    cells_per_col = np.bincount(cols, minlength=table.n_cols)[cols]
+    other_whole = np.bincount(cols, whole, minlength=table.n_cols)[cols] - whole
+    matched = (cells_per_col == 2) & (col_sums == result_sizes) & (other_whole > 0)
+    records = table.ground_truth_records - table.ground_truth_sizes
+    removed = {
+        "n_rows": np.ones(n, dtype=np.int64),
+        "n_cols": per_row(result_sizes == counts),
+        "overlap": per_row(np.ones(len(rows))),
+        "total": table.row_sums,
+        "total_pairs": table.total_pairs - _comb_n_2(table.total - table.row_sums),
+        "cell_pairs": per_row(_comb_n_2(counts)),
+        "row_pairs": _comb_n_2(table.row_sums),
+        "col_pairs": per_row(_comb_n_2(col_sums) - _comb_n_2(col_sums - counts)),
+        "ground_truth_records": table.ground_truth_sizes,
+        "ground_truth_record_pairs": table.ground_truth_record_pairs
+        - _comb_n_2(records),
+        "ground_truth_pairs": _comb_n_2(table.ground_truth_sizes),
+        "result_pairs": per_row(
+            _comb_n_2(result_sizes) - _comb_n_2(result_sizes - counts)
+        ),
+        "exact_matches": per_row(exact) - per_row(matched),
+    }
+    replicates = {name: getattr(table, name) - removed[name] for name in _COUNTS}
+    values = _metric_values(replicates, metrics)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    intervals = {}
+    for name in metrics:
+        estimate = _METRICS[name](table)
+        spread = values[name] - values[name].mean()
+        error = float(np.sqrt((n - 1) / n * np.dot(spread, spread)))
+        intervals[name] = ConfidenceInterval(
+            estimate, estimate - z * error, estimate + z * error, error
+        )
+    return intervals
@@ -0,0 +1,275 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable
+
+import numpy as np
+
+from pyresolvemetrics._algebraic import _ALL_METRICS, _select_metrics
+from pyresolvemetrics._contingency import Contingency
+from pyresolvemetrics._storage import PathLike, _map, _read_header, _write
+
+LabelChunk = tuple[np.ndarray, np.ndarray]  # record ids and their cluster labels
+
+
+def _sum_rows(rows: np.ndarray, counts: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Add up the counts of equal rows.
+
+    :returns: the distinct rows, in lexicographic order, and their total counts.
+    """
+    if len(rows) == 0:
+        return rows, counts
+    order = np.lexsort(rows.T[::-1])
+    rows, counts = rows[order], counts[order]
+    starts = np.flatnonzero(np.r_[True, (rows[1:] != rows[:-1]).any(axis=1)])
+    return rows[starts], np.add.reduceat(counts, starts)
+
+
+def _label_sizes(labels: np.ndarray) -> np.ndarray:
+    """Count the records of each cluster, as ``(label, size)`` rows."""
+    labels, sizes = np.unique(labels[labels >= 0], return_counts=True)
+    return np.stack([labels, sizes], 1).astype(np.int64)
+
+
+class PartialContingency:
+    """Contingency counts of a share of the records, mergeable into exact totals.
+
+    Unlike a :class:`Contingency`, whose clusters are numbered, the counts are
+    keyed by the cluster labels themselves, so the counts of disjoint sets of
+    records simply add up: the ``k``-th cell says that the records labelled
+    ``cells[k, 0]`` in the ground truth and ``cells[k, 1]`` in the result
+    number ``counts[k]``, while ``ground_truth_sizes`` and ``result_sizes``
+    hold ``(label, size)`` rows.
+
+    Each record must be counted by exactly one partial. Slices of aligned
+    label arrays, such as those mapped by
+    :func:`pyresolvemetrics.load_partition`, can be counted directly with
+    :meth:`from_labels`. Records whose labels come from separate sources are
+    first spread over shards by :func:`write_shards`, which places both
+    labels of a record in the same shard.
+    """
+
+    def __init__(
+        self,
+        cells: np.ndarray,
+        counts: np.ndarray,
+        ground_truth_sizes: np.ndarray,
+        result_sizes: np.ndarray,
+    ) -> None:
+        self.cells = cells
+        self.counts = counts
+        self.ground_truth_sizes = ground_truth_sizes
+        self.result_sizes = result_sizes
+
+    @classmethod
+    def empty(cls) -> "PartialContingency":
+        """Counts of no records at all, to merge others into."""
+        rows = np.empty((0, 2), dtype=np.int64)
+        return cls(rows, np.empty(0, dtype=np.int64), rows, rows)
+
+    @classmethod
+    def from_labels(
+        cls, ground_truth: np.ndarray, result: np.ndarray
+    ) -> "PartialContingency":
+        """Count the records of two aligned arrays of cluster labels.
+
+        :param ground_truth: the ground truth cluster label of each record, or
+            a negative label if the record is missing from the ground truth.
+        :param result: the result cluster label of each record, or a negative
+            label if the record is missing from the result.
+        """
+        ground_truth, result = np.asarray(ground_truth), np.asarray(result)
+        if ground_truth.ndim != 1 or ground_truth.shape != result.shape:
+            raise ValueError("label arrays must be one-dimensional and aligned")
+        shared = (ground_truth >= 0) & (result >= 0)
+        cells = np.stack([ground_truth[shared], result[shared]], 1).astype(np.int64)
+        cells, counts = _sum_rows(cells, np.ones(len(cells), dtype=np.int64))
+        return cls(cells, counts, _label_sizes(ground_truth), _label_sizes(result))
+
+    @classmethod
+    def from_records(
+        cls, ground_truth: LabelChunk, result: LabelChunk
+    ) -> "PartialContingency":
+        """Count records whose labels are listed separately for each partition.
+
+        :param ground_truth: the ids of records and their ground truth labels.
+        :param result: the ids of records and their result labels. Records
+            which are only listed on one side are missing from the other one.
+        """
+        gt_records, gt_labels = map(np.asarray, ground_truth)
+        result_records, result_labels = map(np.asarray, result)
+        records, inverse = np.unique(
+            np.concatenate([gt_records, result_records]), return_inverse=True
+        )
+        aligned = []
+        for positions, labels in (
+            (inverse[: len(gt_records)], gt_labels),
+            (inverse[len(gt_records) :], result_labels),
+        ):
+            if len(np.unique(positions)) != len(positions):
+                raise ValueError("a record must be listed once per partition")
+            array = np.full(len(records), -1, dtype=np.int64)
+            array[positions] = labels
+            aligned.append(array)
+        return cls.from_labels(*aligned)
+
+    def merge(self, *others: "PartialContingency") -> "PartialContingency":
+        """Add the counts of other, disjoint sets of records.
+
+        Merging many partials at once adds up their counts in a single pass.
+
+        :returns: this partial contingency.
+        """
+        partials = (self, *others)
+        self.cells, self.counts = _sum_rows(
+            np.concatenate([partial.cells for partial in partials]),
+            np.concatenate([partial.counts for partial in partials]),
+        )
+        for name in ("ground_truth_sizes", "result_sizes"):
+            sizes = np.concatenate([getattr(partial, name) for partial in partials])
+            labels, counts = _sum_rows(sizes[:, :1], sizes[:, 1])
+            setattr(self, name, np.concatenate([labels, counts[:, None]], 1))
+        return self
+
+    def contingency(self) -> Contingency:
+        """Number the clusters, in ascending order of their labels."""
+        gt_labels = self.ground_truth_sizes[:, 0]
+        result_labels = self.result_sizes[:, 0]
+        return Contingency(
+            np.searchsorted(gt_labels, self.cells[:, 0]),
+            np.searchsorted(result_labels, self.cells[:, 1]),
+            np.asarray(self.counts),
+            np.asarray(self.ground_truth_sizes[:, 1]),
+            np.asarray(self.result_sizes[:, 1]),
+            gt_labels,
+            result_labels,
+        )
+
+    def evaluate(self, metrics: Iterable[str] | None = None) -> dict[str, float]:
+        """Compute algebraic metrics over the records counted so far.
+
+        :param metrics: the names of the metrics to compute, as listed in
+            :attr:`pyresolvemetrics.Evaluation.METRICS`. All of them by default.
+        """
+        table = self.contingency()
+        return {name: _ALL_METRICS[name](table) for name in _select_metrics(metrics)}
+
+    def save(self, path: PathLike) -> None:
+        """Store the counts in a binary file, to be merged by another process."""
+        arrays = {
+            "cells": self.cells,
+            "counts": self.counts,
+            "ground_truth_sizes": self.ground_truth_sizes,
+            "result_sizes": self.result_sizes,
+        }
+        _write(path, "contingency", arrays, None)
+
+    @classmethod
+    def load(cls, path: PathLike) -> "PartialContingency":
+        """Map the counts stored by :meth:`save` into memory."""
+        header, start = _read_header(path, "contingency")
+        return cls(
+            *(
+                _map(path, header, start, name)
+                for name in ("cells", "counts", "ground_truth_sizes", "result_sizes")
+            )
+        )
+
+
+def shard_of(records: np.ndarray, n_shards: int) -> np.ndarray:
+    """Hash integer record ids into shards.
+
+    The ids go through the finalizer of SplitMix64, so that consecutive ids
+    are spread evenly over the shards.
+
+    :returns: the shard of each record, between ``0`` and ``n_shards - 1``.
+    """
+    hashed = np.asarray(records).astype(np.uint64)
+    with np.errstate(over="ignore"):
+        hashed = (hashed ^ (hashed >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        hashed = (hashed ^ (hashed >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    hashed ^= hashed >> np.uint64(31)
+    return (hashed % np.uint64(n_shards)).astype(np.intp)
+
+
+_SIDES = ("ground_truth", "result")
+
+
+def _shard_path(directory: PathLike, side: str, shard: int) -> str:
+    return os.path.join(directory, f"{side}-{shard:05d}.bin")
+
+
+def write_shards(
+    directory: PathLike,
+    ground_truth: Iterable[LabelChunk],
+    result: Iterable[LabelChunk],
+    n_shards: int,
+) -> None:
+    """Spread the labels of the records over shard files, one chunk at a time.
+
+    Every record is assigned to a shard by hashing its id, so both of its
+    labels end up in the same shard, whatever the order of the inputs. Each
+    shard can then be counted by :func:`count_shard`, independently of the
+    others. Memory is bounded by the size of the largest chunk.
+
+    :param directory: an existing directory receiving the shard files, as
+        pairs of little-endian ``int64`` record ids and labels.
+    :param ground_truth: chunks of record ids and their ground truth labels.
+    :param result: chunks of record ids and their result labels.
+    :param n_shards: the number of shards.
+    """
+    for side, chunks in zip(_SIDES, (ground_truth, result)):
+        files = [open(_shard_path(directory, side, i), "wb") for i in range(n_shards)]
+        try:
+            for records, labels in chunks:
+                rows = np.stack([records, labels], 1).astype("<i8")
+                shards = shard_of(rows[:, 0], n_shards)
+                order = np.argsort(shards, kind="stable")
+                bounds = np.searchsorted(shards[order], np.arange(n_shards + 1))
+                for shard, file in enumerate(files):
+                    file.write(rows[order[bounds[shard] : bounds[shard + 1]]].tobytes())
+        finally:
+            for file in files:
+                file.close()
+
+
+def _read_shard(path: str) -> LabelChunk:
+    if os.path.getsize(path) == 0:
+        rows = np.empty((0, 2), dtype="<i8")
+    else:
+        rows = np.memmap(path, dtype="<i8", mode="r").reshape(-1, 2)
+    return rows[:, 0], rows[:, 1]
+
+
+def count_shard(directory: PathLike, shard: int) -> PartialContingency:
+    """Count the records of a shard written by :func:`write_shards`."""
+    return PartialContingency.from_records(
+        *(_read_shard(_shard_path(directory, side, shard)) for side in _SIDES)
+    )
+
+
+def evaluate_shards(
+    directory: PathLike,
+    n_shards: int,
+    metrics: Iterable[str] | None = None,
+    workers: int = 1,
+) -> dict[str, float]:
+    """Evaluate a result against its ground truth from their shard files.
+
+    The shards are counted one at a time, or in parallel by a pool of
+    processes, and their partial counts are merged into the exact values of
+    the metrics.
+
+    :param directory: the directory holding the files of :func:`write_shards`.
+    :param n_shards: the number of shards.
+    :param metrics: the names of the algebraic metrics to compute, as listed in
+        :attr:`pyresolvemetrics.Evaluation.METRICS`. All of them by default.
+    :param workers: the number of processes counting shards in parallel.
+    """
+    metrics = _select_metrics(metrics)
+    directories = [directory] * n_shards
+    if workers <= 1:
+        partials = list(map(count_shard, directories, range(n_shards)))
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            partials = list(pool.map(count_shard, directories, range(n_shards)))
+    return PartialContingency.empty().merge(*partials).evaluate(metrics)
@@ -0,0 +1,239 @@
+import json
+import os
+from typing import Hashable, Sequence
+
+import numpy as np
+
+from pyresolvemetrics._contingency import _PartitionIndex, _encode_labels
+from pyresolvemetrics._ground_truth import GroundTruth
+from pyresolvemetrics._pairs import _Interner, _PairIndex, _pair_keys
+from pyresolvemetrics._utils import Pairs, Partition
+
+# A file starts with the magic bytes and the length of a JSON header, which
+# describes the arrays that follow it. Arrays are stored in little-endian
+# order, each at an offset aligned to 64 bytes, so that they can be mapped
+# into memory as they are. The identifiers of the records are stored last, as
+# a JSON list, since they are only needed to convert other inputs.
+_MAGIC = b"PYRMF001"
+_ALIGNMENT = 64
+_DTYPES = {
+    "codes": "<i8",
+    "sizes": "<i8",
+    "keys": "<u8",
+    "cells": "<i8",
+    "counts": "<i8",
+    "ground_truth_sizes": "<i8",
+    "result_sizes": "<i8",
+}
+
+PathLike = str | os.PathLike
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _write(
+    path: PathLike,
+    kind: str,
+    arrays: dict[str, np.ndarray],
+    records: Sequence[Hashable] | None,
+) -> None:
+    layout, offset = {}, 0
+    for name, array in arrays.items():
+        layout[name] = {"shape": list(array.shape), "offset": offset}
+        offset = _aligned(offset + array.nbytes)
+    blob = b"" if records is None else json.dumps(list(records)).encode()
+    header = {
+        "kind": kind,
+        "arrays": layout,
+        "records": None if records is None else {"offset": offset, "size": len(blob)},
+    }
+    header_bytes = json.dumps(header).encode()
+    start = _aligned(len(_MAGIC) + 8 + len(header_bytes))
+    with open(path, "wb") as file:
+        file.write(_MAGIC)
+        file.write(len(header_bytes).to_bytes(8, "little"))
+        file.write(header_bytes)
+        for name, array in arrays.items():
+            file.seek(start + layout[name]["offset"])
+            file.write(np.ascontiguousarray(array, dtype=_DTYPES[name]).tobytes())
+        file.seek(start + offset)
+        file.write(blob)
+
+
+def _read_header(path: PathLike, kind: str | None = None) -> tuple[dict, int]:
+    with open(path, "rb") as file:
+        if file.read(len(_MAGIC)) != _MAGIC:
+            raise ValueError(f"{os.fspath(path)} is not a pyresolvemetrics file")
+        size = int.from_bytes(file.read(8), "little")
+        header = json.loads(file.read(size))
+    if kind is not None and header["kind"] != kind:
+        raise ValueError(f"{os.fspath(path)} does not hold {kind}")
+    return header, _aligned(len(_MAGIC) + 8 + size)
+
+
+def _map(path: PathLike, header: dict, start: int, name: str) -> np.ndarray:
+    layout = header["arrays"][name]
+    shape = tuple(layout["shape"])
+    if 0 in shape:
+        return np.empty(shape, dtype=_DTYPES[name])
+    return np.memmap(
+        path,
+        dtype=_DTYPES[name],
+        mode="r",
+        offset=start + layout["offset"],
+        shape=shape,
+    )
+
+
+def _as_record(item):
+    # JSON turns tuples into lists, which are not hashable.
+    if isinstance(item, list):
+        return tuple(map(_as_record, item))
+    return item
+
+
+def save_partition(
+    path: PathLike, partition: Partition, records: Sequence[Hashable] | None = None
+) -> None:
+    """Store a partition in a binary file which can be mapped into memory.
+
+    The file holds the cluster label of each record, encoded as consecutive
+    cluster numbers, and the size of each cluster. A partition given as a set
+    of sets is stored along with the identifiers of its records, numbered in
+    the order in which they are first encountered unless ``records`` gives
+    that order. Partitions of the same records saved with the same
+    ``records`` are aligned, so that they can be evaluated as label arrays.
+
+    :param path: the file to write.
+    :param partition: a set of sets, or an array holding the cluster label of
+        each record.
+    :param records: the identifiers of the records, in order. Identifiers
+        missing from the partition are stored with the label ``-1``. Records of
+        a set of sets which are not listed are numbered after the listed ones,
+        so the stored labels then outnumber the ``records``: to evaluate them
+        as label arrays, pad the ground truth with the label ``-1``.
+    """
+    if isinstance(partition, np.ndarray):
+        if partition.ndim != 1:
+            raise ValueError("label arrays must be one-dimensional")
+        if records is not None and len(records) != len(partition):
+            raise ValueError("there must be exactly one identifier per label")
+        codes, sizes, _ = _encode_labels(partition)
+    else:
+        ids: dict[Hashable, int] = {}
+        if records is not None:
+            ids.update(zip(records, range(len(records))))
+        positions, labels, sizes = [], [], []
+        for label, cluster in enumerate(partition):
+            sizes.append(len(cluster))
+            for item in cluster:
+                positions.append(ids.setdefault(item, len(ids)))
+                labels.append(label)
+        codes = np.full(len(ids), -1, dtype=np.int64)
+        codes[positions] = labels
+        sizes = np.array(sizes, dtype=np.int64)
+        records = list(ids)
+    _write(path, "partition", {"codes": codes, "sizes": sizes}, records)
+
+
+def save_pairs(
+    path: PathLike, pairs: Pairs, records: Sequence[Hashable] | None = None
+) -> None:
+    """Store a set of pairs in a binary file which can be mapped into memory.
+
+    The file holds every distinct pair once, packed as a sorted ``uint64`` key.
+    The identifiers of pairs given as a set are replaced by integer ids,
+    assigned in the order of ``records`` and then in the order in which new
+    identifiers are encountered, and stored along with the pairs. Pair sets
+    saved with the ``records`` of another file share its ids.
+
+    :param path: the file to write.
+    :param pairs: a set of pairs of ``Hashable`` items, or an ``(m, 2)`` array
+        of integer identifiers.
+    :param records: the identifiers of the records, in the order of their ids.
+    """
+    if isinstance(pairs, np.ndarray):
+        keys = _pair_keys(pairs)
+    else:
+        interner = _Interner()
+        if records is not None:
+            interner.ids.update(zip(records, range(len(records))))
+        keys = interner.pair_keys(pairs)
+        records = list(interner.ids)
+    _write(path, "pairs", {"keys": keys}, records)
+
+
+def load_partition(path: PathLike) -> np.ndarray:
+    """Map the cluster labels stored by :func:`save_partition` into memory.
+
+    :param path: the file to read.
+    :returns: a read-only array holding the cluster label of each record,
+        which is backed by the file rather than loaded.
+    """
+    header, start = _read_header(path, "partition")
+    return _map(path, header, start, "codes")
+
+
+def load_pairs(path: PathLike) -> np.ndarray:
+    """Map the pairs stored by :func:`save_pairs` into memory.
+
+    :param path: the file to read.
+    :returns: a read-only ``(m, 2)`` array of record ids, which is backed by the
+        file rather than loaded.
+    """
+    header, start = _read_header(path, "pairs")
+    keys = _map(path, header, start, "keys")
+    # Each little-endian key is the larger id followed by the smaller one.
+    return keys.view("<u4").reshape(-1, 2)[:, ::-1]
+
+
+def load_records(path: PathLike) -> list[Hashable] | None:
+    """Read the identifiers of the records of a stored partition or pair set.
+
+    :param path: the file to read.
+    :returns: the identifier of each record, in the order of its id, or
+        ``None`` if the file was written from an array.
+    """
+    header, start = _read_header(path)
+    if header["records"] is None:
+        return None
+    with open(path, "rb") as file:
+        file.seek(start + header["records"]["offset"])
+        return [
+            _as_record(item)
+            for item in json.loads(file.read(header["records"]["size"]))
+        ]
+
+
+def load_ground_truth(path: PathLike, records: bool = False) -> GroundTruth:
+    """Index a stored ground truth without loading it into memory.
+
+    The index works directly over the arrays mapped from the file, so every
+    process which loads the same file shares its pages. Pickling the index,
+    e.g. to send it to a worker process, only transfers the path. Results
+    must be given as label arrays or pair arrays, aligned with the records of
+    the file as returned by :func:`load_records`.
+
+    :param path: a file written by :func:`save_partition` or :func:`save_pairs`.
+    :param records: whether to load the identifiers of the records of a pair
+        set too, so that results can be given as pairs of identifiers.
+    """
+    header, start = _read_header(path)
+    if records and header["kind"] != "pairs":
+        raise ValueError("only pair sets can be loaded with their records")
+    if header["kind"] == "partition":
+        index = _PartitionIndex.from_codes(
+            _map(path, header, start, "codes"), _map(path, header, start, "sizes")
+        )
+        ground_truth = GroundTruth(partition=index)
+    else:
+        identifiers = load_records(path) if records else None
+        if records and identifiers is None:
+            raise ValueError(f"{os.fspath(path)} does not hold record identifiers")
+        ground_truth = GroundTruth(
+            pairs=_PairIndex.from_keys(_map(path, header, start, "keys"), identifiers)
+        )
+    ground_truth._source = (os.fspath(path), records)
+    return ground_truth
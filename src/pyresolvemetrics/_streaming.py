@@ -0,0 +1,204 @@
+from typing import Hashable, Iterable
+
+import numpy as np
+
+from pyresolvemetrics._ground_truth import GroundTruth, _pair_index
+from pyresolvemetrics._pairs import (
+    _encode_pairs,
+    _find_keys,
+    _pair_keys,
+    _sorted_unique,
+)
+from pyresolvemetrics._probabilistic import Confusion
+from pyresolvemetrics._utils import Pair, Pairs
+
+
+class ConfusionAccumulator:
+    """Accumulate the confusion of a result which is read in chunks.
+
+    Only a compact index of the ``ground_truth`` is held in memory: its pairs
+    encoded as sorted ``uint64`` keys, along with one flag per pair recording
+    whether the result contained it. Each chunk of the result is matched
+    against the index and discarded, so memory is bounded by the size of the
+    ground truth and of the largest chunk.
+
+    A pair which is repeated within a chunk, or across chunks, is only counted
+    once as a true positive. Repeated false positives cannot be detected
+    without holding the whole result, so they are counted every time, unless
+    the accumulator counts ``distinct`` false positives.
+
+    :param ground_truth: a set of pairs of ``Hashable`` items, or an
+        ``(m, 2)`` array of integer identifiers. Each pair represents a known
+        pair of matching entity reference identifiers. When it is an array,
+        the chunks of the result must hold integer identifiers too. It may
+        also be indexed beforehand as a :class:`GroundTruth`.
+    :param distinct: count a false positive once, however many times it is
+        repeated. The false positives seen so far are then held in memory, as
+        sorted keys, along with the identifiers of the records missing from
+        the ground truth.
+    """
+
+    def __init__(
+        self, ground_truth: Pairs | GroundTruth, distinct: bool = False
+    ) -> None:
+        self._start(_pair_index(ground_truth), distinct)
+
+    def _start(self, index, distinct: bool) -> None:
+        self._index = index
+        self._keys = index.keys
+        self._found = np.zeros(len(self._keys), dtype=bool)
+        self._fp = 0
+        self._distinct = distinct
+        # Ids of the records missing from the ground truth, which follow those
+        # of its interner, and keys of the false positives yet to be merged
+        # into the sorted, unique ones.
+        self._unknown: dict[Hashable, int] = {}
+        self._fp_keys = np.empty(0, dtype=np.uint64)
+        self._pending: list[np.ndarray] = []
+        self._pending_size = 0
+
+    def spawn(self) -> "ConfusionAccumulator":
+        """Create an empty accumulator sharing the index of this one.
+
+        Use it to accumulate a separate shard of the result, then combine the
+        partial counts with :meth:`merge`.
+        """
+        other = object.__new__(type(self))
+        other._start(self._index, self._distinct)
+        return other
+
+    def _pair_ids(self, pairs: Iterable[Pair] | np.ndarray) -> np.ndarray:
+        interner = self._index.interner
+        if not self._distinct or interner is None:
+            return self._index.pair_ids(pairs)
+        # Unknown records keep their ids across chunks, so that repeated
+        # false positives share their keys.
+        return interner.lookup(pairs, self._unknown)
+
+    def update(self, chunk: Iterable[Pair] | np.ndarray) -> "ConfusionAccumulator":
+        """Match a chunk of result pairs against the ground truth.
+
+        :param chunk: pairs of identifiers output by an entity matcher.
+        :returns: this accumulator.
+        """
+        keys = _pair_keys(self._pair_ids(chunk))
+        positions, hits = _find_keys(self._keys, keys)
+        self._found[positions[hits]] = True
+        if self._distinct:
+            self._add_false_positives(keys[~hits])
+        else:
+            self._fp += len(keys) - int(hits.sum())
+        return self
+
+    def _add_false_positives(self, keys: np.ndarray) -> None:
+        self._pending.append(keys)
+        self._pending_size += len(keys)
+        # Sorting only once the pending keys outnumber the sorted ones keeps
+        # the cost of deduplication linear in the number of keys, amortized.
+        if self._pending_size > len(self._fp_keys):
+            self._compact()
+
+    def _compact(self) -> None:
+        if self._pending:
+            self._fp_keys = _sorted_unique(
+                np.concatenate([self._fp_keys, *self._pending])
+            )
+            self._pending, self._pending_size = [], 0
+
+    def merge(self, other: "ConfusionAccumulator") -> "ConfusionAccumulator":
+        """Add the counts of an accumulator built over the same ground truth.
+
+        Accumulators built separately, e.g. in other processes, may number the
+        records of the ground truth differently. Their pairs are then matched
+        through the identifiers of the records.
+
+        :param other: an accumulator obtained through :meth:`spawn`, or built
+            from the same ground truth, which counts ``distinct`` false
+            positives if this one does.
+        :returns: this accumulator.
+        """
+        if self._distinct != other._distinct:
+            raise ValueError("accumulators must count false positives alike")
+        self._found |= self._aligned(other)
+        if self._distinct:
+            other._compact()
+            if self._index.interner is None:
+                keys = other._fp_keys
+            else:
+                # Unknown records are numbered differently by each accumulator.
+                identifiers = [*other._index.interner.ids, *other._unknown]
+                low, high = _decode_keys(other._fp_keys)
+                keys = _pair_keys(
+                    self._pair_ids(
+                        [
+                            (identifiers[first], identifiers[second])
+                            for first, second in zip(low.tolist(), high.tolist())
+                        ]
+                    )
+                )
+            self._add_false_positives(keys)
+        else:
+            self._fp += other._fp
+        return self
+
+    def _aligned(self, other: "ConfusionAccumulator") -> np.ndarray:
+        """The flags of ``other``, in the order of the pairs of this index."""
+        if other._index is self._index:
+            return other._found
+        mine, theirs = self._index.interner, other._index.interner
+        keys = other._keys
+        if mine is not None and theirs is not None and mine.ids != theirs.ids:
+            if mine.ids.keys() != theirs.ids.keys():
+                raise ValueError("accumulators must share the same ground truth")
+            # Renumber the records of the other index with the ids of this one.
+            ids = np.empty(len(theirs.ids), dtype=np.int64)
+            ids[list(theirs.ids.values())] = [mine.ids[item] for item in theirs.ids]
+            low, high = _decode_keys(keys)
+            keys = _encode_pairs(np.stack([ids[low], ids[high]], axis=1))
+        elif (mine is None) != (theirs is None):
+            raise ValueError("accumulators must share the same ground truth")
+        positions, hits = _find_keys(self._keys, keys)
+        if len(keys) != len(self._keys) or not hits.all():
+            raise ValueError("accumulators must share the same ground truth")
+        found = np.zeros(len(self._keys), dtype=bool)
+        found[positions[other._found]] = True
+        return found
+
+    @property
+    def confusion(self) -> Confusion:
+        """The outcome counts of all the chunks seen so far."""
+        tp = int(np.count_nonzero(self._found))
+        if self._distinct:
+            self._compact()
+            fp = len(self._fp_keys)
+        else:
+            fp = self._fp
+        return Confusion(tp=tp, fp=fp, fn=len(self._keys) - tp)
+
+
+def _decode_keys(keys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """The low and high record ids of pair keys."""
+    return (
+        (keys >> np.uint64(32)).astype(np.int64),
+        (keys & np.uint64(0xFFFFFFFF)).astype(np.int64),
+    )
+
+
+def streaming_confusion(
+    ground_truth: Pairs | GroundTruth, chunks: Iterable[Iterable[Pair] | np.ndarray]
+) -> Confusion:
+    """Count the outcomes of an entity matching task over a chunked result.
+
+    :param ground_truth: a set of pairs of ``Hashable`` items, or an
+        ``(m, 2)`` array of integer identifiers. Each pair represents a known
+        pair of matching entity reference identifiers. It may also be indexed
+        beforehand as a :class:`GroundTruth`.
+    :param chunks: an iterable of chunks, each holding pairs of identifiers
+        output by an entity matcher. Chunks are processed one at a time.
+    :returns: the outcome counts, which can be passed to
+        :func:`pyresolvemetrics.precision` and the other scores.
+    """
+    accumulator = ConfusionAccumulator(ground_truth)
+    for chunk in chunks:
+        accumulator.update(chunk)
+    return accumulator.confusion
@@ -1,9 +1,16 @@
-from typing import Hashable
+from typing import TYPE_CHECKING, Hashable, Union
+
+if TYPE_CHECKING:
+    import numpy as np
+
+Pair = tuple[Hashable, Hashable]
+Pairs = Union[set[Pair], "np.ndarray"]
+Partition = Union[frozenset[frozenset], "np.ndarray"]
 
 
 def _safe_division(numerator: float, denominator: float) -> float:
     return numerator / denominator if denominator != 0 else 0
 
 
-def _symmetric_hash(pair: tuple[Hashable, Hashable]) -> int:
-    return hash(frozenset(pair))
+def _comb_n_2(value: "int | np.ndarray") -> "int | np.ndarray":
+    return (value * (value - 1)) // 2
@@ -0,0 +1,271 @@
+from statistics import NormalDist
+from typing import Iterable
+
+import numpy as np
+
+from pyresolvemetrics._algebraic import _METRICS, _select_metrics
+from pyresolvemetrics._contingency import _encode_labels
+from pyresolvemetrics._ground_truth import GroundTruth, _pair_index
+from pyresolvemetrics._pairs import _encode_pairs, _find_keys
+from pyresolvemetrics._probabilistic import Confusion
+from pyresolvemetrics._resampling import ConfidenceInterval, _pairs
+from pyresolvemetrics._utils import Pairs
+
+# Metrics which only derive from counts of pairs, and can therefore be
+# estimated from the weighted pairs of a sample of records.
+_SAMPLE_METRICS = {
+    name: _METRICS[name]
+    for name in (
+        "pair_precision",
+        "pair_recall",
+        "pair_comparison_measure",
+        "rand_index",
+        "adjusted_rand_index",
+        "fowlkes_mallows_index",
+    )
+}
+_PAIR_COUNTS = (
+    "total_pairs",
+    "cell_pairs",
+    "row_pairs",
+    "col_pairs",
+    "ground_truth_record_pairs",
+    "ground_truth_pairs",
+    "result_pairs",
+)
+
+
+def weighted_confusion(
+    ground_truth: Pairs | GroundTruth, result: Pairs, weights: np.ndarray
+) -> Confusion:
+    """Estimate the outcome counts of a result from a weighted sample of it.
+
+    Each pair of the result is a sampled pair weighted by the inverse of its
+    probability of being sampled, so that the weights of the true and false
+    positives estimate their numbers in the whole result. The false negatives
+    are the pairs of the ground truth which the true positives are estimated
+    not to cover. The counts may be fractional, and can be handed to
+    :func:`precision`, :func:`recall` and :func:`f1`.
+
+    :param ground_truth: a set of pairs of ``Hashable`` items, or an
+        ``(m, 2)`` array of integer identifiers, holding every known match. It
+        may also be indexed beforehand as a :class:`GroundTruth`.
+    :param result: the sampled pairs of the result, each listed once, as a
+        sequence of pairs of ``Hashable`` items or an ``(m, 2)`` array of
+        integer identifiers.
+    :param weights: the weight of each pair of the ``result``.
+    """
+    index = _pair_index(ground_truth)
+    _, hits = _find_keys(index.keys, _encode_pairs(index.pair_ids(result)))
+    weights = np.asarray(weights, dtype=float)
+    if weights.shape != hits.shape:
+        raise ValueError("there must be one weight per pair of the result")
+    tp = float(weights[hits].sum())
+    fp = float(weights[~hits].sum())
+    return Confusion(tp, fp, max(len(index.keys) - tp, 0.0))
+
+
+class _Counts:
+    """Estimated pair counts which the pair metrics derive from."""
+
+    __slots__ = _PAIR_COUNTS
+
+    def __init__(self, values: Iterable[float]) -> None:
+        for name, value in zip(_PAIR_COUNTS, values):
+            setattr(self, name, value)
+
+
+class _Design:
+    """Random groups of records within strata, for a delete-a-group jackknife.
+
+    A replicate drops one group of a stratum and scales up the weights of the
+    rest of that stratum by ``G / (G - 1)``, ``G`` being the number of groups
+    of the stratum. Strata of a single record have no replicate.
+    """
+
+    def __init__(
+        self, strata: np.ndarray, n_groups: int, rng: np.random.Generator
+    ) -> None:
+        self.strata = strata
+        self.n_strata = int(strata.max()) + 1 if len(strata) else 0
+        sizes = np.bincount(strata, minlength=self.n_strata)
+        counts = np.minimum(sizes, n_groups)
+        counts[counts < 2] = 0
+        self.active = counts > 0
+        self.scale = np.where(self.active, counts / np.maximum(counts - 1, 1), 1.0)
+        self.offsets = np.cumsum(counts) - counts
+        self.replicate_strata = np.repeat(np.arange(self.n_strata), counts)
+        self.n_groups = max(n_groups, 1)
+
+        order = np.lexsort((rng.random(len(strata)), strata))
+        starts = np.cumsum(sizes) - sizes
+        rank = np.arange(len(strata)) - starts[strata[order]]
+        self.groups = np.empty(len(strata), dtype=np.int64)
+        self.groups[order] = rank % np.maximum(counts[strata[order]], 1)
+
+    @property
+    def n_replicates(self) -> int:
+        return len(self.replicate_strata)
+
+
+def _weighted_pairs(
+    units: np.ndarray, weights: np.ndarray, design: _Design
+) -> tuple[float, np.ndarray]:
+    """Weighted pairs of records within units, in the sample and its replicates.
+
+    Only the units holding records of the dropped stratum change in a
+    replicate, so the pairs of each replicate are those of the whole sample
+    plus the changes of the ``(unit, stratum)`` and ``(unit, stratum, group)``
+    combinations, summed with :func:`numpy.bincount`.
+
+    :param units: the unit of each record, ``-1`` for records outside units.
+    :returns: the weighted pairs of the sample and of each replicate.
+    """
+    keep = units >= 0
+    _, units = np.unique(units[keep], return_inverse=True)
+    weights = weights[keep]
+    strata, groups = design.strata[keep], design.groups[keep]
+    sums = np.bincount(units, weights)
+    squares = np.bincount(units, weights**2)
+    whole = float(_pairs(sums, squares).sum())
+    replicates = np.full(design.n_replicates, whole)
+
+    active = design.active[strata]
+    units, weights = units[active], weights[active]
+    strata, groups = strata[active], groups[active]
+    n_strata = design.n_strata
+    combos, combo = np.unique(units * n_strata + strata, return_inverse=True)
+    unit, stratum = combos // n_strata, combos % n_strata
+    combo_sums = np.bincount(combo, weights)
+    combo_squares = np.bincount(combo, weights**2)
+    scale = design.scale[stratum]
+    before = _pairs(sums[unit], squares[unit])
+    scaled = (
+        _pairs(
+            sums[unit] + (scale - 1) * combo_sums,
+            squares[unit] + (scale**2 - 1) * combo_squares,
+        )
+        - before
+    )
+    replicates += np.bincount(stratum, scaled, minlength=n_strata)[
+        design.replicate_strata
+    ]
+
+    n_groups = design.n_groups
+    parts, part = np.unique(combo * n_groups + groups, return_inverse=True)
+    parent, group = parts // n_groups, parts % n_groups
+    part_sums = np.bincount(part, weights)
+    part_squares = np.bincount(part, weights**2)
+    scale = scale[parent]
+    dropped = (
+        _pairs(
+            sums[unit[parent]]
+            - part_sums
+            + (scale - 1) * (combo_sums[parent] - part_sums),
+            squares[unit[parent]]
+            - part_squares
+            + (scale**2 - 1) * (combo_squares[parent] - part_squares),
+        )
+        - before[parent]
+        - scaled[parent]
+    )
+    replicates += np.bincount(
+        design.offsets[stratum[parent]] + group,
+        dropped,
+        minlength=design.n_replicates,
+    )
+    return whole, replicates
+
+
+def sample_estimates(
+    ground_truth: np.ndarray,
+    result: np.ndarray,
+    weights: np.ndarray | None = None,
+    strata: np.ndarray | None = None,
+    metrics: Iterable[str] | None = None,
+    n_groups: int = 20,
+    confidence: float = 0.95,
+    seed: int | None = None,
+) -> dict[str, ConfidenceInterval]:
+    """Estimate pair metrics of whole partitions from a sample of records.
+
+    The ground truth only needs to label a sample of the records. Each
+    sampled record is weighted by the inverse of its probability of being
+    sampled, which is ``N / n`` for ``n`` records sampled out of the ``N`` of
+    their stratum. The pairs of records are then estimated from weighted
+    contingency counts: a set of sampled records whose weights sum to ``W``
+    and whose squared weights sum to ``S`` stands for ``(W ** 2 - S) / 2``
+    pairs.
+
+    The variance of each estimate is that of a delete-a-group jackknife: the
+    records of each stratum are split into random groups, and each replicate
+    drops one group. All the replicates are computed at once, with a few
+    vectorized passes over the records.
+
+    :param ground_truth: the ground truth cluster label of each sampled
+        record, negative for records it does not hold.
+    :param result: the result cluster label of each sampled record, aligned
+        with the ``ground_truth``.
+    :param weights: the weight of each sampled record, ``1`` by default.
+    :param strata: the stratum each record was sampled from, a single one by
+        default.
+    :param metrics: the names of the metrics to estimate, among
+        ``"pair_precision"``, ``"pair_recall"``, ``"pair_comparison_measure"``,
+        ``"rand_index"``, ``"adjusted_rand_index"`` and
+        ``"fowlkes_mallows_index"``. All of them by default.
+    :param n_groups: the number of jackknife groups of each stratum.
+    :param confidence: the probability that an interval holds the metric,
+        assuming the estimate is normally distributed.
+    :param seed: the seed of the random assignment of records to groups.
+    :returns: the estimate and confidence interval of each metric.
+    """
+    metrics = _select_metrics(metrics, _SAMPLE_METRICS)
+    ground_truth, result = np.asarray(ground_truth), np.asarray(result)
+    if ground_truth.ndim != 1 or ground_truth.shape != result.shape:
+        raise ValueError("label arrays must be one-dimensional and aligned")
+    n = len(ground_truth)
+    weights = np.ones(n) if weights is None else np.asarray(weights, dtype=float)
+    if weights.shape != (n,):
+        raise ValueError("there must be one weight per record")
+    if strata is None:
+        strata = np.zeros(n, dtype=np.int64)
+    else:
+        strata = np.unique(np.asarray(strata), return_inverse=True)[1].ravel()
+    design = _Design(strata, n_groups, np.random.default_rng(seed))
+
+    gt_codes, _, _ = _encode_labels(ground_truth)
+    res_codes, res_sizes, _ = _encode_labels(result)
+    shared = (gt_codes >= 0) & (res_codes >= 0)
+    outside = np.full(n, -1)
+    units = {
+        "total_pairs": np.where(shared, 0, outside),
+        "cell_pairs": np.where(
+            shared, gt_codes * max(len(res_sizes), 1) + res_codes, outside
+        ),
+        "row_pairs": np.where(shared, gt_codes, outside),
+        "col_pairs": np.where(shared, res_codes, outside),
+        "ground_truth_record_pairs": np.where(gt_codes >= 0, 0, outside),
+        "ground_truth_pairs": gt_codes,
+        "result_pairs": res_codes,
+    }
+    estimated = {
+        name: _weighted_pairs(units[name], weights, design) for name in _PAIR_COUNTS
+    }
+    whole = _Counts(estimated[name][0] for name in _PAIR_COUNTS)
+    replicates = [
+        _Counts(values)
+        for values in zip(*(estimated[name][1].tolist() for name in _PAIR_COUNTS))
+    ]
+
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    factors = 1 / design.scale[design.replicate_strata]
+    intervals = {}
+    for name in metrics:
+        metric = _SAMPLE_METRICS[name]
+        estimate = metric(whole)
+        values = np.array([metric(counts) for counts in replicates], dtype=float)
+        error = float(np.sqrt((factors * (values - estimate) ** 2).sum()))
+        intervals[name] = ConfidenceInterval(
+            estimate, estimate - z * error, estimate + z * error, error
+        )
+    return intervals
@@ -0,0 +1,22 @@
+import pytest
+
+from pyresolvemetrics._algebraic import adjusted_rand_index
+
+
+def test_ari_identical_partitions_returns_one():
+    assert adjusted_rand_index([{1, 2}, {3, 4, 5}], [{1, 2}, {3, 4, 5}]) == 1
+
+
+def test_ari_singletons_returns_one():
+    assert adjusted_rand_index([{1}], [{1}]) == 1
+
+
+@pytest.mark.parametrize(
+    "ground_truth, result, expected_score",
+    [
+        ([{1, 2, 3}, {4, 5, 6}], [{1, 2}, {3, 4}, {5, 6}], 0.24242424242424246),
+        ([{1, 2, 3}, {4, 5, 6}], [{1, 4}, {2, 5}, {3, 6}], -0.36363636363636365),
+    ],
+)
+def test_ari_different_clusters(ground_truth, result, expected_score):
+    assert adjusted_rand_index(ground_truth, result) == pytest.approx(expected_score)
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from pyresolvemetrics import (
+    adjusted_rand_index,
+    cluster_precision,
+    f1,
+    pair_comparison_measure,
+    precision,
+    rand_index,
+    recall,
+    to_label_arrays,
+    to_pair_arrays,
+    twi,
+)
+
+
+@pytest.fixture
+def partitions():
+    ground_truth = frozenset([frozenset({1, 2, 3}), frozenset({4, 5}), frozenset({6})])
+    result = frozenset([frozenset({1, 2}), frozenset({3, 4, 5}), frozenset({6})])
+    return ground_truth, result
+
+
+def test_to_label_arrays_marks_missing_records():
+    gt_labels, result_labels = to_label_arrays([["a", "b"]], [["b", "c"]])
+    assert gt_labels.tolist() == [0, 0, -1]
+    assert result_labels[0] == -1
+    assert result_labels[1] == result_labels[2] == 0
+
+
+def test_to_pair_arrays_shares_identifiers():
+    gt_pairs, result_pairs = to_pair_arrays({("a", "b")}, {("b", "a")})
+    assert gt_pairs.tolist() == [[0, 1]]
+    assert result_pairs.tolist() == [[1, 0]]
+
+
+@pytest.mark.parametrize(
+    "metric",
+    [
+        adjusted_rand_index,
+        cluster_precision,
+        pair_comparison_measure,
+        rand_index,
+        twi,
+    ],
+)
+def test_label_arrays_match_sets(partitions, metric):
+    ground_truth, result = partitions
+    gt_labels, result_labels = to_label_arrays(ground_truth, result)
+    assert metric(gt_labels, result_labels) == pytest.approx(
+        metric(ground_truth, result)
+    )
+
+
+@pytest.mark.parametrize("metric", [precision, recall, f1])
+def test_pair_arrays_match_sets(metric):
+    ground_truth = {("a", "b"), ("c", "d"), ("e", "f")}
+    result = {("b", "a"), ("d", "e")}
+    gt_pairs, result_pairs = to_pair_arrays(ground_truth, result)
+    assert metric(gt_pairs, result_pairs) == pytest.approx(metric(ground_truth, result))
+
+
+def test_pair_arrays_reject_negative_ids():
+    with pytest.raises(ValueError):
+        precision(np.array([[0, -1]]), np.array([[0, 1]]))
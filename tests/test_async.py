@@ -0,0 +1,199 @@
+import asyncio
+import gc
+import threading
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from pyresolvemetrics import (
+    AsyncEvaluator,
+    Evaluation,
+    GroundTruth,
+    adjusted_rand_index,
+    f1,
+)
+
+
+@pytest.fixture
+def labels():
+    rng = np.random.default_rng(7)
+    return rng.integers(0, 50, 2_000), rng.integers(0, 60, 2_000)
+
+
+def test_small_evaluations_run_on_the_event_loop():
+    ground_truth = [{1, 2, 3}, {4, 5}, {6}]
+    result = [{1, 2}, {3, 4, 5}, {6}]
+
+    async def evaluate():
+        async with AsyncEvaluator() as evaluator:
+            score = await evaluator.adjusted_rand_index(ground_truth, result)
+            return score, evaluator._executor
+
+    score, executor = asyncio.run(evaluate())
+
+    assert score == adjusted_rand_index(ground_truth, result)
+    assert executor is None
+
+
+def test_large_evaluations_run_in_the_executor(labels):
+    ground_truth, result = labels
+    threads = []
+
+    def record(gt, res):
+        threads.append(threading.current_thread())
+        return adjusted_rand_index(gt, res)
+
+    async def evaluate():
+        async with AsyncEvaluator(inline_records=0) as evaluator:
+            return await evaluator._evaluate("partition", record, ground_truth, result)
+
+    assert asyncio.run(evaluate()) == pytest.approx(
+        adjusted_rand_index(ground_truth, result)
+    )
+    assert threads and threads[0] is not threading.main_thread()
+
+
+def test_few_large_clusters_run_in_the_executor():
+    ground_truth = [set(range(3_000)), set(range(3_000, 6_000))]
+    result = [set(range(2_000)), set(range(2_000, 6_000))]
+
+    async def evaluate():
+        async with AsyncEvaluator(inline_records=1_000) as evaluator:
+            score = await evaluator.twi(ground_truth, result)
+            return score, evaluator._executor
+
+    score, executor = asyncio.run(evaluate())
+
+    assert score == pytest.approx(Evaluation(ground_truth, result).twi)
+    assert executor is not None
+
+
+def test_compute_all_on_a_process_pool(labels):
+    ground_truth, result = labels
+
+    async def evaluate(executor):
+        evaluator = AsyncEvaluator(executor, inline_records=0)
+        return await evaluator.compute_all(ground_truth, result, ["twi", "v_measure"])
+
+    with ProcessPoolExecutor(2) as executor:
+        scores = asyncio.run(evaluate(executor))
+
+    expected = Evaluation(ground_truth, result)
+    assert scores == {
+        "twi": pytest.approx(expected.twi),
+        "v_measure": pytest.approx(expected.v_measure),
+    }
+
+
+def test_pair_counterparts(labels):
+    ground_truth = {(i, i + 1) for i in range(0, 100, 2)}
+    result = {(i, i + 1) for i in range(0, 100, 4)} | {(1, 2)}
+
+    async def evaluate():
+        async with AsyncEvaluator(inline_records=0) as evaluator:
+            return await evaluator.f1(ground_truth, result)
+
+    assert asyncio.run(evaluate()) == pytest.approx(f1(ground_truth, result))
+
+
+def test_concurrent_requests_share_one_index(labels, monkeypatch):
+    ground_truth, result = labels
+    builds = []
+    build = GroundTruth.from_partition.__func__
+
+    def counted(cls, partition):
+        builds.append(partition)
+        return build(cls, partition)
+
+    monkeypatch.setattr(GroundTruth, "from_partition", classmethod(counted))
+
+    async def evaluate():
+        async with AsyncEvaluator(inline_records=0) as evaluator:
+            return await asyncio.gather(
+                evaluator.rand_index(ground_truth, result),
+                evaluator.adjusted_rand_index(ground_truth, result),
+                evaluator.compute_all(ground_truth, result, ["twi"]),
+            )
+
+    rand, adjusted, scores = asyncio.run(evaluate())
+
+    assert len(builds) == 1
+    expected = Evaluation(ground_truth, result)
+    assert rand == pytest.approx(expected.rand_index)
+    assert adjusted == pytest.approx(expected.adjusted_rand_index)
+    assert scores == {"twi": pytest.approx(expected.twi)}
+
+
+def test_cancelled_request_keeps_the_shared_index(labels):
+    ground_truth, result = labels
+
+    async def evaluate():
+        async with AsyncEvaluator(inline_records=0) as evaluator:
+            first = asyncio.ensure_future(evaluator.index(ground_truth))
+            second = asyncio.ensure_future(evaluator.index(ground_truth))
+            await asyncio.sleep(0)
+            first.cancel()
+            index = await second
+            return first.cancelled(), index, await evaluator.index(ground_truth)
+
+    cancelled, index, cached = asyncio.run(evaluate())
+
+    assert cancelled
+    assert isinstance(index, GroundTruth)
+    assert cached is index
+
+
+def test_failed_index_is_not_cached():
+    async def evaluate():
+        async with AsyncEvaluator() as evaluator:
+            with pytest.raises(ValueError):
+                await evaluator.index(None, kind="clusters")
+            with pytest.raises(Exception):
+                await evaluator.index(42)
+            return len(evaluator._indexes)
+
+    assert asyncio.run(evaluate()) == 0
+
+
+def test_equal_ground_truths_share_an_index_through_their_key(labels, monkeypatch):
+    ground_truth, result = labels
+    builds = []
+    build = GroundTruth.from_partition.__func__
+
+    def counted(cls, partition):
+        builds.append(partition)
+        return build(cls, partition)
+
+    monkeypatch.setattr(GroundTruth, "from_partition", classmethod(counted))
+
+    async def evaluate():
+        async with AsyncEvaluator(inline_records=0) as evaluator:
+            return await asyncio.gather(
+                evaluator.twi(ground_truth.copy(), result, key="gt"),
+                evaluator.compute_all(ground_truth.copy(), result, ["twi"], key="gt"),
+            )
+
+    twi, scores = asyncio.run(evaluate())
+
+    assert len(builds) == 1
+    assert twi == pytest.approx(scores["twi"])
+
+
+def test_cached_ground_truths_stay_alive(labels):
+    ground_truth, result = labels
+
+    async def evaluate():
+        async with AsyncEvaluator(inline_records=0) as evaluator:
+            copy = ground_truth.copy()
+            alive = weakref.ref(copy)
+            first = await evaluator.index(copy)
+            del copy
+            gc.collect()
+            assert alive() is not None
+            return first, await evaluator.index(ground_truth.copy())
+
+    first, second = asyncio.run(evaluate())
+
+    assert first is not second
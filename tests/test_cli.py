@@ -0,0 +1,183 @@
+import json
+
+import numpy as np
+import pytest
+
+from pyresolvemetrics import (
+    Evaluation,
+    confusion,
+    f1,
+    save_pairs,
+    save_partition,
+    to_label_arrays,
+)
+from pyresolvemetrics._cli import main
+from pyresolvemetrics._readers import prefetch
+
+
+@pytest.fixture
+def partitions():
+    ground_truth = [["a", "b", "c"], ["d"], ["e", "f"]]
+    results = {
+        "exact.jsonl": ground_truth,
+        "merged.jsonl": [["a", "b", "c", "d"], ["e", "f"]],
+        "extra.jsonl": [["a", "b"], ["c", "x"], ["d", "e", "f"]],
+    }
+    return ground_truth, results
+
+
+def _write_jsonl(path, lines):
+    path.write_text("".join(json.dumps(line) + "\n" for line in lines))
+
+
+def _run(capsys, *argv):
+    assert main([str(arg) for arg in argv]) == 0
+    return json.loads(capsys.readouterr().out)
+
+
+def _expected(ground_truth, result):
+    labels = to_label_arrays(map(set, ground_truth), map(set, result))
+    return Evaluation(*labels).compute_all()
+
+
+def test_directory_of_jsonl_partitions(tmp_path, capsys, partitions):
+    ground_truth, results = partitions
+    _write_jsonl(tmp_path / "gt.jsonl", ground_truth)
+    (tmp_path / "results").mkdir()
+    for name, result in results.items():
+        _write_jsonl(tmp_path / "results" / name, result)
+
+    report = _run(
+        capsys, tmp_path / "gt.jsonl", tmp_path / "results", "--kind", "partition"
+    )
+
+    assert report["kind"] == "partition"
+    assert [entry["path"].split("/")[-1] for entry in report["results"]] == sorted(
+        results
+    )
+    for entry in report["results"]:
+        result = results[entry["path"].split("/")[-1]]
+        assert entry["metrics"] == pytest.approx(_expected(ground_truth, result))
+
+
+def test_csv_partitions_with_workers(tmp_path, capsys, partitions):
+    ground_truth, results = partitions
+    for name, partition in [
+        ("gt.csv", ground_truth),
+        ("res.csv", results["extra.jsonl"]),
+    ]:
+        rows = [
+            f"{record},c{label}" for label, c in enumerate(partition) for record in c
+        ]
+        (tmp_path / name).write_text("record,cluster\n" + "\n".join(rows) + "\n")
+
+    report = _run(
+        capsys,
+        tmp_path / "gt.csv",
+        tmp_path / "res.csv",
+        tmp_path / "res.csv",
+        "--kind",
+        "partition",
+        "--metrics",
+        "twi",
+        "rand_index",
+        "--workers",
+        "2",
+        "--chunk-size",
+        "2",
+    )
+
+    expected = _expected(ground_truth, results["extra.jsonl"])
+    for entry in report["results"]:
+        assert entry["metrics"] == pytest.approx(
+            {"twi": expected["twi"], "rand_index": expected["rand_index"]}
+        )
+
+
+def test_binary_partitions(tmp_path, capsys):
+    rng = np.random.default_rng(0)
+    ground_truth = rng.integers(0, 50, 500)
+    result = np.where(rng.random(500) < 0.8, ground_truth, rng.integers(0, 80, 500))
+    save_partition(tmp_path / "gt.bin", ground_truth)
+    save_partition(tmp_path / "res.bin", result)
+
+    report = _run(capsys, tmp_path / "gt.bin", tmp_path / "res.bin")
+
+    assert report["kind"] == "partition"
+    assert report["results"][0]["metrics"] == pytest.approx(
+        Evaluation(ground_truth, result).compute_all()
+    )
+
+
+def test_pairs_across_formats(tmp_path, capsys):
+    ground_truth = [(1, 2), (3, 4), (5, 6), (7, 8)]
+    result = [(2, 1), (3, 5), (7, 8), (9, 10)]
+    _write_jsonl(tmp_path / "gt.jsonl", ground_truth)
+    (tmp_path / "res.csv").write_text(
+        "left,right\n" + "".join(f"{a},{b}\n" for a, b in result)
+    )
+    save_pairs(tmp_path / "res.bin", set(result))
+
+    report = _run(
+        capsys,
+        tmp_path / "gt.jsonl",
+        tmp_path / "res.csv",
+        tmp_path / "res.bin",
+        "--kind",
+        "pairs",
+    )
+
+    counts = confusion(set(ground_truth), set(result))
+    for entry in report["results"]:
+        assert entry["metrics"]["tp"] == counts.tp
+        assert entry["metrics"]["fp"] == counts.fp
+        assert entry["metrics"]["f1"] == pytest.approx(f1(counts))
+
+
+def test_metrics_of_pairs(tmp_path, capsys):
+    ground_truth = [(1, 2), (3, 4)]
+    _write_jsonl(tmp_path / "gt.jsonl", ground_truth)
+    gt, res = str(tmp_path / "gt.jsonl"), str(tmp_path / "gt.jsonl")
+
+    report = _run(capsys, gt, res, "--kind", "pairs", "--metrics", "recall")
+    assert report["results"][0]["metrics"] == {"tp": 2, "fp": 0, "fn": 0, "recall": 1}
+
+    with pytest.raises(SystemExit) as exit:
+        main([gt, res, "--kind", "pairs", "--metrics", "twi"])
+    assert exit.value.code == 2
+    assert "twi" in capsys.readouterr().err
+
+
+def test_repeated_pairs_do_not_depend_on_the_chunk_size(tmp_path, capsys):
+    _write_jsonl(tmp_path / "gt.jsonl", [(1, 2), (3, 4)])
+    _write_jsonl(tmp_path / "res.jsonl", [(1, 2), (5, 6), (2, 1), (6, 5), (5, 6)])
+
+    for chunk_size in ("1", "2", "100"):
+        report = _run(
+            capsys,
+            tmp_path / "gt.jsonl",
+            tmp_path / "res.jsonl",
+            "--kind",
+            "pairs",
+            "--chunk-size",
+            chunk_size,
+        )
+        metrics = report["results"][0]["metrics"]
+        assert (metrics["tp"], metrics["fp"], metrics["fn"]) == (1, 1, 1)
+
+
+def test_text_inputs_need_a_kind(tmp_path, capsys):
+    _write_jsonl(tmp_path / "gt.jsonl", [[1, 2]])
+    assert main([str(tmp_path / "gt.jsonl"), str(tmp_path / "gt.jsonl")]) == 2
+    assert "--kind" in capsys.readouterr().err
+
+
+def test_prefetch_raises_errors_of_the_producer():
+    def chunks():
+        yield 1
+        raise RuntimeError("broken")
+
+    iterator = prefetch(chunks())
+    assert next(iterator) == 1
+    with pytest.raises(RuntimeError, match="broken"):
+        next(iterator)
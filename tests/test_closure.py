@@ -0,0 +1,100 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from pyresolvemetrics import (
+    GroundTruth,
+    adjusted_rand_index,
+    confusion,
+    connected_components,
+    f1,
+)
+
+
+def _union_find(n_records, pairs):
+    parent = list(range(n_records))
+
+    def root(record):
+        while parent[record] != record:
+            record = parent[record]
+        return record
+
+    for first, second in pairs:
+        low, high = sorted((root(first), root(second)))
+        parent[high] = low
+    return np.array([root(record) for record in range(n_records)])
+
+
+def _cluster_pairs(labels):
+    return {
+        pair
+        for pair in itertools.combinations(range(len(labels)), 2)
+        if labels[pair[0]] >= 0 and labels[pair[0]] == labels[pair[1]]
+    }
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_components_of_pair_arrays(seed):
+    rng = np.random.default_rng(seed)
+    pairs = rng.integers(0, 50, (40, 2))
+    expected = _union_find(60, pairs)
+
+    assert np.array_equal(connected_components(pairs, 60), expected)
+    chunks = iter(np.array_split(pairs, 4))
+    assert np.array_equal(connected_components(chunks, 60), expected)
+
+
+def test_components_of_a_path():
+    pairs = np.stack([np.arange(1, 1_000), np.arange(999)], axis=1)
+    assert np.array_equal(connected_components(pairs), np.zeros(1_000))
+
+
+def test_components_of_a_star_around_the_highest_id():
+    # Each round used to hook a single leaf onto the center, one per leaf.
+    leaves = 100_000
+    pairs = np.stack([np.arange(leaves), np.full(leaves, leaves)], axis=1)
+    assert np.array_equal(connected_components(pairs), np.zeros(leaves + 1))
+
+
+def test_components_of_identifiers():
+    pairs = {("a", "b"), ("c", "b"), ("d", "e")}
+    assert connected_components(pairs, records=["f", "a"]) == frozenset(
+        {frozenset("abc"), frozenset("de"), frozenset("f")}
+    )
+
+
+def test_components_reject_negative_ids():
+    with pytest.raises(ValueError):
+        connected_components(np.array([[0, -1]]))
+
+
+def test_closure_feeds_partition_metrics():
+    ground_truth = np.array([0, 0, 0, 1, 1, 2])
+    result_pairs = np.array([[0, 1], [3, 4], [4, 5]])
+    result = connected_components(result_pairs, len(ground_truth))
+
+    assert result.tolist() == [0, 0, 2, 3, 3, 3]
+    assert adjusted_rand_index(ground_truth, result) == adjusted_rand_index(
+        ground_truth, np.array([0, 0, 1, 2, 2, 2])
+    )
+
+
+def test_pair_metrics_of_a_label_partition():
+    rng = np.random.default_rng(3)
+    labels = rng.integers(-1, 8, 40)
+    result = np.concatenate([rng.integers(0, 45, (60, 2)), [[2, 2], [0, 1], [1, 0]]])
+    expected = confusion(np.array(sorted(_cluster_pairs(labels))), result)
+
+    assert confusion(GroundTruth.from_partition(labels), result) == expected
+    assert expected.tp > 0
+
+
+def test_pair_metrics_of_a_set_partition():
+    ground_truth = GroundTruth.from_partition(
+        frozenset({frozenset("abc"), frozenset("de")})
+    )
+    result = {("a", "c"), ("c", "a"), ("d", "e"), ("e", "f"), ("a", "a")}
+
+    assert confusion(ground_truth, result) == (2, 2, 2)
+    assert f1(ground_truth, result) == 0.5
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from pyresolvemetrics import (
+    ClusterDiagnostics,
+    Evaluation,
+    cluster_comparison_measure,
+    cluster_diagnostics,
+    cluster_precision,
+    cluster_recall,
+)
+
+
+@pytest.fixture
+def ground_truth():
+    return frozenset(
+        {frozenset({1, 2}), frozenset({3, 4, 5}), frozenset({6}), frozenset({7, 8})}
+    )
+
+
+@pytest.fixture
+def result():
+    return frozenset(
+        {frozenset({1, 2}), frozenset({3, 4}), frozenset({5, 6}), frozenset({7, 8})}
+    )
+
+
+def test_cluster_metrics(ground_truth, result):
+    assert cluster_precision(ground_truth, result) == 0.5
+    assert cluster_recall(ground_truth, result) == 0.5
+    assert cluster_comparison_measure(ground_truth, result) == 0.5
+
+
+def test_clusters_may_be_lists(ground_truth, result):
+    listed_gt = [sorted(cluster) for cluster in ground_truth]
+    listed_result = [sorted(cluster) for cluster in result]
+    assert cluster_precision(listed_gt, listed_result) == 0.5
+    assert cluster_recall(listed_gt, listed_result) == 0.5
+
+
+def test_empty_clusters_match():
+    ground_truth = frozenset({frozenset(), frozenset({1})})
+    result = frozenset({frozenset(), frozenset({1}), frozenset({2})})
+    assert cluster_precision(ground_truth, result) == 2 / 3
+    assert cluster_recall(ground_truth, result) == 1.0
+
+
+def test_diagnostics_of_label_arrays():
+    ground_truth = np.array([10, 10, 20, 20, 20, 30, 40, 40])
+    result = np.array([5, 5, 6, 6, 7, 7, 8, 8])
+    assert cluster_diagnostics(ground_truth, result) == ClusterDiagnostics(
+        matched=[(10, 5), (40, 8)], split=[20], merged=[7]
+    )
+
+
+def test_diagnostics_of_sets(ground_truth, result):
+    diagnostics = Evaluation(ground_truth, result).cluster_diagnostics()
+    gt_clusters, result_clusters = list(ground_truth), list(result)
+
+    assert {
+        (gt_clusters[row], result_clusters[col]) for row, col in diagnostics.matched
+    } == {(frozenset({1, 2}),) * 2, (frozenset({7, 8}),) * 2}
+    assert [gt_clusters[row] for row in diagnostics.split] == [frozenset({3, 4, 5})]
+    assert [result_clusters[col] for col in diagnostics.merged] == [frozenset({5, 6})]
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from pyresolvemetrics import (
+    Evaluation,
+    ResolutionTracker,
+    clustering_curve,
+    to_label_arrays,
+)
+
+
+@pytest.fixture
+def ground_truth():
+    return [{1, 2, 3}, {4, 5}, {6}]
+
+
+@pytest.fixture
+def edges():
+    return [(1, 2), (4, 5), (2, 3), (3, 4), (6, 7)], [0.9, 0.9, 0.8, 0.4, 0.2]
+
+
+def test_curve_matches_evaluation_of_each_clustering(ground_truth, edges):
+    curve = clustering_curve(ground_truth, *edges)
+    partitions = [
+        [{1, 2}, {3}, {4, 5}, {6}, {7}],
+        [{1, 2, 3}, {4, 5}, {6}, {7}],
+        [{1, 2, 3, 4, 5}, {6}, {7}],
+        [{1, 2, 3, 4, 5}, {6, 7}],
+    ]
+
+    assert curve.thresholds.tolist() == [0.9, 0.8, 0.4, 0.2]
+    for i, result in enumerate(partitions):
+        evaluation = Evaluation(ground_truth, result)
+        for name, value in evaluation.compute_all(ResolutionTracker.METRICS).items():
+            assert getattr(curve, name)[i] == pytest.approx(value), (i, name)
+
+
+def test_perfect_threshold_scores_one(ground_truth, edges):
+    curve = clustering_curve(ground_truth, *edges)
+
+    assert curve.pair_comparison_measure[1] == 1
+    assert curve.adjusted_rand_index[1] == 1
+
+
+def test_label_arrays(ground_truth, edges):
+    gt_labels, _ = to_label_arrays(ground_truth, [])
+    pairs, scores = edges
+    index = {record: i for i, record in enumerate([1, 2, 3, 4, 5, 6])}
+    edge_ids = np.array([[index[a], index[b]] for a, b in pairs[:4]])
+
+    curve = clustering_curve(gt_labels, edge_ids, scores[:4])
+    expected = clustering_curve(ground_truth, pairs[:4], scores[:4])
+
+    assert curve.adjusted_rand_index == pytest.approx(expected.adjusted_rand_index)
+
+
+def test_edges_and_scores_must_align(ground_truth):
+    with pytest.raises(ValueError):
+        clustering_curve(ground_truth, [(1, 2)], [0.5, 0.4])
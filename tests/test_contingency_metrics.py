@@ -0,0 +1,155 @@
+import itertools
+import math
+
+import numpy as np
+import pytest
+
+from pyresolvemetrics import (
+    Evaluation,
+    ResolutionTracker,
+    adjusted_mutual_information,
+    bcubed_precision,
+    bcubed_recall,
+    completeness,
+    fowlkes_mallows_index,
+    generalized_merge_distance,
+    homogeneity,
+    normalized_mutual_information,
+    v_measure,
+)
+from pyresolvemetrics._algebraic import _expected_mutual_information
+
+
+@pytest.fixture
+def labels():
+    rng = np.random.default_rng(5)
+    return rng.integers(0, 6, 60), rng.integers(0, 9, 60)
+
+
+def test_information_metrics_of_identical_partitions():
+    ground_truth = np.array([0, 0, 1, 1, 2])
+    result = np.array([7, 7, 3, 3, 5])
+    for metric in (
+        normalized_mutual_information,
+        adjusted_mutual_information,
+        homogeneity,
+        completeness,
+        v_measure,
+    ):
+        assert metric(ground_truth, result) == pytest.approx(1.0), metric
+
+
+def test_information_metrics_of_independent_partitions():
+    ground_truth = np.array([0, 0, 0, 0])
+    result = np.array([0, 1, 2, 3])
+    assert normalized_mutual_information(ground_truth, result) == 0
+    assert adjusted_mutual_information(ground_truth, result) == 0
+    assert homogeneity(ground_truth, result) == 1
+    assert completeness(ground_truth, result) == 0
+
+
+def test_v_measure():
+    ground_truth = np.array([0, 0, 1, 2])
+    result = np.array([0, 0, 1, 1])
+    assert homogeneity(ground_truth, result) == pytest.approx(2 / 3)
+    assert completeness(ground_truth, result) == 1
+    assert v_measure(ground_truth, result) == pytest.approx(0.8)
+    assert v_measure(ground_truth, result, beta=0) == pytest.approx(2 / 3)
+
+
+def _brute_expected_mutual_information(a, b, n):
+    expected = 0.0
+    for ai, bj in itertools.product(a, b):
+        for nij in range(max(1, ai + bj - n), min(ai, bj) + 1):
+            log_probability = (
+                math.lgamma(ai + 1)
+                + math.lgamma(bj + 1)
+                + math.lgamma(n - ai + 1)
+                + math.lgamma(n - bj + 1)
+                - math.lgamma(n + 1)
+                - math.lgamma(nij + 1)
+                - math.lgamma(ai - nij + 1)
+                - math.lgamma(bj - nij + 1)
+                - math.lgamma(n - ai - bj + nij + 1)
+            )
+            expected += (
+                nij / n * math.log(n * nij / (ai * bj)) * math.exp(log_probability)
+            )
+    return expected
+
+
+def test_expected_mutual_information_groups_equal_sizes(labels):
+    a, b = (np.bincount(partition) for partition in labels)
+    assert _expected_mutual_information(a, b, 60) == pytest.approx(
+        _brute_expected_mutual_information(a.tolist(), b.tolist(), 60)
+    )
+
+
+def test_adjusted_mutual_information_of_random_partitions(labels):
+    assert abs(adjusted_mutual_information(*labels)) < 0.1
+    assert adjusted_mutual_information(*labels) < normalized_mutual_information(*labels)
+
+
+def test_fowlkes_mallows_index(labels):
+    ground_truth, result = labels
+    pairs = list(itertools.combinations(range(len(ground_truth)), 2))
+    tp = sum(
+        ground_truth[i] == ground_truth[j] and result[i] == result[j] for i, j in pairs
+    )
+    fp_tp = sum(result[i] == result[j] for i, j in pairs)
+    fn_tp = sum(ground_truth[i] == ground_truth[j] for i, j in pairs)
+
+    assert fowlkes_mallows_index(*labels) == pytest.approx(
+        tp / math.sqrt(fp_tp * fn_tp)
+    )
+    assert fowlkes_mallows_index(np.zeros(4), np.arange(4)) == 0
+
+
+def test_bcubed(labels):
+    ground_truth, result = labels
+    same_gt = ground_truth[:, None] == ground_truth[None, :]
+    same_result = result[:, None] == result[None, :]
+    both = (same_gt & same_result).sum(axis=1)
+
+    assert bcubed_precision(*labels) == pytest.approx(
+        np.mean(both / same_result.sum(axis=1))
+    )
+    assert bcubed_recall(*labels) == pytest.approx(np.mean(both / same_gt.sum(axis=1)))
+
+
+def test_bcubed_of_missing_records():
+    ground_truth = np.array([0, 0, -1])
+    result = np.array([0, 0, 0])
+    assert bcubed_precision(ground_truth, result) == pytest.approx(4 / 9)
+    assert bcubed_recall(ground_truth, result) == 1
+
+
+def test_generalized_merge_distance():
+    ground_truth = [{1, 2, 3}, {4, 5}, {6}]
+    result = [{1, 2}, {3, 4}, {5, 6}]
+    # Split {3, 4} and {5, 6}, then merge {1, 2} with {3}, and {4} with {5}.
+    assert generalized_merge_distance(ground_truth, result) == 4
+    assert generalized_merge_distance(ground_truth, ground_truth) == 0
+    assert (
+        generalized_merge_distance(
+            ground_truth, result, lambda x, y: x * y, lambda x, y: x + y
+        )
+        == 2 * 1 + 1 * 1 + 2 + 2
+    )
+
+
+def test_evaluation_reports_every_metric(labels):
+    report = Evaluation(*labels).compute_all()
+    assert report["bcubed_recall"] == bcubed_recall(*labels)
+    assert report["generalized_merge_distance"] == generalized_merge_distance(*labels)
+
+
+def test_tracker_only_tracks_count_metrics():
+    tracker = ResolutionTracker([{1, 2}])
+    tracker.add_record(1, "a")
+
+    assert tracker.fowlkes_mallows_index == 0
+    assert not hasattr(tracker, "bcubed_precision")
+    assert not hasattr(tracker, "errors")
+    with pytest.raises(ValueError):
+        tracker.compute_all(["bcubed_precision"])
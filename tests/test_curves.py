@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from pyresolvemetrics import f1, precision, precision_recall_curve, recall
+
+
+@pytest.fixture
+def ground_truth():
+    return {("a", "b"), ("c", "d"), ("e", "f")}
+
+
+@pytest.fixture
+def scored_pairs():
+    return [("a", "b"), ("c", "x"), ("d", "c"), ("e", "x"), ("f", "e")], [
+        0.9,
+        0.8,
+        0.8,
+        0.5,
+        0.1,
+    ]
+
+
+def test_curve_matches_thresholded_metrics(ground_truth, scored_pairs):
+    pairs, scores = scored_pairs
+    curve = precision_recall_curve(ground_truth, pairs, scores)
+
+    assert curve.thresholds.tolist() == [0.9, 0.8, 0.5, 0.1]
+    for i, threshold in enumerate(curve.thresholds):
+        accepted = {p for p, s in zip(pairs, scores) if s >= threshold}
+        assert curve.precision[i] == pytest.approx(precision(ground_truth, accepted))
+        assert curve.recall[i] == pytest.approx(recall(ground_truth, accepted))
+        assert curve.f1[i] == pytest.approx(f1(ground_truth, accepted))
+
+
+def test_best_threshold_and_auc(ground_truth, scored_pairs):
+    curve = precision_recall_curve(ground_truth, *scored_pairs)
+
+    assert curve.best_threshold == 0.1
+    assert curve.pr_auc == pytest.approx((1 + 2 / 3 + 3 / 5) / 3)
+
+
+def test_repeated_pairs_keep_their_best_score():
+    curve = precision_recall_curve(
+        np.array([[0, 1]]), np.array([[0, 1], [1, 0]]), [0.2, 0.7]
+    )
+
+    assert curve.thresholds.tolist() == [0.7]
+    assert curve.recall.tolist() == [1]
+
+
+def test_empty_result(ground_truth):
+    curve = precision_recall_curve(ground_truth, [], [])
+
+    assert len(curve.thresholds) == 0
+    assert curve.best_threshold is None
+    assert curve.pr_auc == 0
@@ -0,0 +1,98 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from pyresolvemetrics import (
+    ClusterError,
+    ClusterErrors,
+    Evaluation,
+    GroundTruth,
+    PairErrors,
+    confusion,
+)
+
+
+def _pairs(labels):
+    return {
+        pair
+        for pair in itertools.combinations(range(len(labels)), 2)
+        if labels[pair[0]] >= 0 and labels[pair[0]] == labels[pair[1]]
+    }
+
+
+def test_pair_errors_of_identifiers():
+    ground_truth = [("a", "b"), ("c", "d"), ("e", "f")]
+    result = [("b", "a"), ("d", "x"), ("y", "z"), ("a", "b")]
+    errors = PairErrors(GroundTruth.from_pairs(ground_truth), result)
+
+    assert errors.confusion == confusion(ground_truth, result)
+    assert errors.false_positives() == [("d", "x"), ("y", "z")]
+    assert errors.false_negatives() == [("c", "d"), ("e", "f")]
+    assert errors.false_negatives(offset=1, limit=5) == [("e", "f")]
+
+
+def test_pair_errors_of_arrays():
+    rng = np.random.default_rng(2)
+    ground_truth = rng.integers(0, 30, (50, 2))
+    result = np.concatenate([ground_truth[::3, ::-1], rng.integers(0, 30, (20, 2))])
+    errors = PairErrors(ground_truth, result)
+
+    gt_pairs = {tuple(sorted(pair)) for pair in ground_truth.tolist()}
+    result_pairs = {tuple(sorted(pair)) for pair in result.tolist()}
+    false_positives = errors.false_positives()
+    assert false_positives.dtype == np.int64
+    assert list(map(tuple, false_positives.tolist())) == sorted(result_pairs - gt_pairs)
+    pages = [errors.false_negatives(offset, 7) for offset in range(0, 100, 7)]
+    assert list(map(tuple, np.concatenate(pages).tolist())) == sorted(
+        gt_pairs - result_pairs
+    )
+    assert errors.confusion == confusion(ground_truth, result)
+
+
+@pytest.fixture
+def labels():
+    ground_truth = np.array([10, 10, 10, 20, 20, 30, 30, -1])
+    result = np.array([1, 1, 2, 2, 2, 3, 4, 4])
+    return ground_truth, result
+
+
+def test_split_and_merged_clusters(labels):
+    errors = ClusterErrors(*labels)
+
+    assert errors.split_count == 2
+    assert errors.split() == [
+        ClusterError(10, {1: 2, 2: 1}, 2),
+        ClusterError(30, {3: 1, 4: 1}, 1),
+    ]
+    assert errors.split(offset=1, limit=1) == [ClusterError(30, {3: 1, 4: 1}, 1)]
+    assert errors.merged_count == 1
+    assert errors.merged() == [ClusterError(2, {10: 1, 20: 2}, 2)]
+
+
+def test_worst_clusters_add_up_to_the_pair_errors():
+    rng = np.random.default_rng(4)
+    ground_truth = rng.integers(0, 15, 80)
+    result = rng.integers(0, 12, 80)
+    errors = Evaluation(ground_truth, result).errors()
+    gt_pairs, result_pairs = _pairs(ground_truth), _pairs(result)
+
+    worst = errors.worst_merged(100)
+    assert sum(error.pairs for error in worst) == len(result_pairs - gt_pairs)
+    assert [error.pairs for error in worst] == sorted(
+        (error.pairs for error in worst), reverse=True
+    )
+    assert [error.pairs for error in errors.worst_merged(3)] == [
+        error.pairs for error in worst[:3]
+    ]
+    assert sum(error.pairs for error in errors.worst_split(100)) == len(
+        gt_pairs - result_pairs
+    )
+
+
+def test_clusters_of_sets_are_numbered():
+    ground_truth = [{1, 2}, {3}]
+    result = [{1}, {2, 3}]
+    errors = ClusterErrors(ground_truth, result)
+    assert errors.split() == [ClusterError(0, {0: 1, 1: 1}, 1)]
+    assert errors.worst_merged(5) == [ClusterError(1, {0: 1, 1: 1}, 1)]
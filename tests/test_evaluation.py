@@ -0,0 +1,35 @@
+import pytest
+
+import pyresolvemetrics
+from pyresolvemetrics import Evaluation, to_label_arrays
+
+
+@pytest.fixture
+def ground_truth():
+    return frozenset(
+        [frozenset({1, 2, 3}), frozenset({4, 5}), frozenset({6}), frozenset({7})]
+    )
+
+
+@pytest.fixture
+def result():
+    return frozenset(
+        [frozenset({1, 2}), frozenset({3, 4, 5}), frozenset({6}), frozenset({7})]
+    )
+
+
+def test_compute_all_matches_individual_metrics(ground_truth, result):
+    scores = Evaluation(ground_truth, result).compute_all()
+
+    assert set(scores) == set(Evaluation.METRICS)
+    for name, value in scores.items():
+        expected = getattr(pyresolvemetrics, name)(ground_truth, result)
+        assert value == pytest.approx(expected), name
+
+
+def test_label_arrays_match_sets(ground_truth, result):
+    gt_labels, result_labels = to_label_arrays(ground_truth, result)
+
+    assert Evaluation(gt_labels, result_labels).compute_all() == pytest.approx(
+        Evaluation(ground_truth, result).compute_all()
+    )
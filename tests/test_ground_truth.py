@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+import pyresolvemetrics
+from pyresolvemetrics import (
+    ConfusionAccumulator,
+    Evaluation,
+    GroundTruth,
+    confusion,
+    precision,
+    to_label_arrays,
+    twi,
+)
+
+
+@pytest.fixture
+def partition():
+    return [{1, 2, 3}, {4, 5}, {6}]
+
+
+@pytest.fixture
+def result():
+    return [{1, 2}, {3, 4, 5}, {6, 7}]
+
+
+@pytest.fixture
+def pairs():
+    return {("a", "b"), ("c", "d"), ("e", "f")}
+
+
+def test_partition_index(partition):
+    ground_truth = GroundTruth.from_partition(partition)
+
+    assert ground_truth.cluster_sizes.tolist() == [3, 2, 1]
+    assert ground_truth.pair_count == 4
+
+
+def test_pair_index(pairs):
+    assert GroundTruth.from_pairs(pairs).pair_count == 3
+
+
+@pytest.mark.parametrize("metric", Evaluation.METRICS)
+def test_algebraic_metrics_accept_index(partition, result, metric):
+    partition = frozenset(map(frozenset, partition))
+    result = frozenset(map(frozenset, result))
+    ground_truth = GroundTruth.from_partition(partition)
+    compute = getattr(pyresolvemetrics, metric)
+
+    assert compute(ground_truth, result) == pytest.approx(compute(partition, result))
+
+
+def test_index_is_reusable(partition, result):
+    ground_truth = GroundTruth.from_partition(partition)
+
+    assert twi(ground_truth, result) == twi(ground_truth, result)
+    assert twi(ground_truth, partition) == 1
+
+
+def test_label_array_index(partition, result):
+    gt_labels, result_labels = to_label_arrays(partition, result)
+    ground_truth = GroundTruth.from_partition(gt_labels)
+
+    assert twi(ground_truth, result_labels) == twi(partition, result)
+    with pytest.raises(TypeError):
+        twi(ground_truth, result)
+
+
+def test_pair_metrics_accept_index(pairs):
+    ground_truth = GroundTruth.from_pairs(pairs)
+    result = {("b", "a"), ("x", "y"), ("y", "x")}
+
+    assert confusion(ground_truth, result) == confusion(pairs, result)
+    assert precision(ground_truth, result) == 0.5
+    assert ConfusionAccumulator(ground_truth).update(result).confusion == (1, 1, 2)
+
+
+def test_pair_array_index():
+    ground_truth = GroundTruth.from_pairs(np.array([[0, 1], [2, 3]]))
+
+    assert precision(ground_truth, [(1, 0), (1, 2)]) == 0.5
+
+
+def test_pairs_are_counted_against_a_partition(partition, pairs):
+    assert precision(GroundTruth.from_partition(partition), pairs) == 0
+    assert precision(GroundTruth.from_partition(partition), {(1, 3)}) == 1
+    with pytest.raises(TypeError):
+        twi(GroundTruth.from_pairs(pairs), partition)
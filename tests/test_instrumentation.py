@@ -0,0 +1,119 @@
+import threading
+
+import numpy as np
+
+from pyresolvemetrics import (
+    GroundTruth,
+    cluster_comparison_measure,
+    f1,
+    instrument,
+    rand_index,
+)
+
+
+def test_records_phases_of_pair_metrics():
+    ground_truth = {("a", "b"), ("c", "d")}
+    result = {("a", "b"), ("b", "c"), ("e", "f")}
+    with instrument() as records:
+        f1(ground_truth, result)
+
+    assert [record.phase for record in records] == [
+        "index_pairs",
+        "encode_pairs",
+        "intersect_pairs",
+        "total",
+    ]
+    assert {record.metric for record in records} == {"f1"}
+    assert records[1].sizes == {"pairs": 3}
+    assert records[2].sizes == {"ground_truth_pairs": 2, "result_pairs": 3}
+    assert all(record.seconds >= 0 for record in records)
+    assert all(record.peak_bytes is None for record in records)
+
+
+def test_records_phases_of_partition_metrics():
+    ground_truth = np.array([0, 0, 1, 1, 1])
+    result = np.array([0, 0, 0, 1, -1])
+    with instrument() as records:
+        rand_index(ground_truth, result)
+
+    assert [record.phase for record in records] == [
+        "index_partition",
+        "contingency",
+        "total",
+    ]
+    assert records[0].sizes == {"records": 5, "clusters": 2}
+    assert records[1].sizes == {"records": 4, "clusters": 2, "cells": 3}
+
+
+def test_cluster_metrics_over_sets_count_the_contingency(algebraic_ground_truth):
+    ground_truth = frozenset(map(frozenset, algebraic_ground_truth))
+    result = frozenset({frozenset({"a", "b"}), frozenset({"c"}), frozenset({"d"})})
+    with instrument() as records:
+        cluster_comparison_measure(ground_truth, result)
+
+    assert [record.phase for record in records] == [
+        "index_partition",
+        "contingency",
+        "total",
+    ]
+    assert {record.metric for record in records} == {"cluster_comparison_measure"}
+
+
+def test_indexing_outside_of_metrics_has_no_metric():
+    with instrument() as records:
+        GroundTruth.from_partition(np.array([0, 0, 1]))
+    assert [(record.metric, record.phase) for record in records] == [
+        (None, "index_partition")
+    ]
+
+
+def test_callback_and_memory():
+    received = []
+    ground_truth = np.arange(20_000).reshape(-1, 2)
+    with instrument(received.append, memory=True) as records:
+        f1(ground_truth, ground_truth[::2])
+
+    assert received == records
+    phases = {record.phase: record for record in records}
+    assert phases["index_pairs"].peak_bytes > 10_000 * 8
+    assert phases["total"].peak_bytes >= phases["index_pairs"].peak_bytes
+
+
+def test_nothing_is_recorded_outside_of_the_context():
+    with instrument() as records:
+        pass
+    f1({("a", "b")}, {("a", "b")})
+    assert records == []
+
+
+def test_threads_only_record_their_own_metrics():
+    ground_truth = np.arange(20_000).reshape(-1, 2)
+    barrier = threading.Barrier(3)
+    seen = {}
+
+    def measure(metric, inputs):
+        barrier.wait()
+        with instrument(memory=True) as records:
+            for _ in range(20):
+                metric(*inputs)
+        barrier.wait()
+        seen[metric.__name__] = records
+
+    threads = [
+        threading.Thread(target=measure, args=(f1, (ground_truth, ground_truth))),
+        threading.Thread(
+            target=measure, args=(rand_index, ([{1, 2}, {3}], [{1}, {2, 3}]))
+        ),
+    ]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    f1(ground_truth, ground_truth)  # outside of any instrument() block
+    barrier.wait()
+    for thread in threads:
+        thread.join()
+
+    for name, records in seen.items():
+        assert {record.metric for record in records} == {name}
+        assert sum(record.phase == "total" for record in records) == 20
+        assert all(record.peak_bytes >= 0 for record in records)
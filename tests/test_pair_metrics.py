@@ -0,0 +1,52 @@
+import pytest
+
+from pyresolvemetrics._algebraic import (
+    pair_comparison_measure,
+    pair_precision,
+    pair_recall,
+)
+
+
+@pytest.mark.parametrize(
+    "ground_truth, result, expected",
+    [
+        ([{1, 2}, {3, 4}], [{1, 2}, {3, 4}], 1),
+        ([{1, 2, 3}, {4}], [{1, 2}, {3, 4}], 0.5),
+        ([{1, 2}, {3}], [{1, 2, 3}], 1 / 3),
+        ([{1, 2}], [{1}, {2}], 0),
+    ],
+)
+def test_pair_precision(ground_truth, result, expected):
+    assert pair_precision(ground_truth, result) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    "ground_truth, result, expected",
+    [
+        ([{1, 2}, {3, 4}], [{1, 2}, {3, 4}], 1),
+        ([{1, 2, 3}, {4}], [{1, 2}, {3, 4}], 1 / 3),
+        ([{1, 2}, {3}], [{1, 2, 3}], 1),
+        ([{1}, {2}], [{1, 2}], 0),
+    ],
+)
+def test_pair_recall(ground_truth, result, expected):
+    assert pair_recall(ground_truth, result) == pytest.approx(expected)
+
+
+def test_pair_comparison_measure_counts_pairs_of_records_missing_from_gt():
+    ground_truth = [{1, 2}, {3, 4}]
+    result = [{1, 2, 5}, {3, 4}]
+
+    assert pair_precision(ground_truth, result) == pytest.approx(0.5)
+    assert pair_comparison_measure(ground_truth, result) == pytest.approx(2 / 3)
+
+
+def test_pair_metrics_handle_giant_clusters():
+    size = 50_000
+    ground_truth = [set(range(size // 2)), set(range(size // 2, size))]
+    result = [set(range(size))]
+
+    assert pair_precision(ground_truth, result) == pytest.approx(
+        2 * (size // 2) * (size // 2 - 1) / (size * (size - 1))
+    )
+    assert pair_recall(ground_truth, result) == 1
@@ -0,0 +1,60 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pyresolvemetrics import Evaluation, evaluate_many, to_label_arrays
+
+
+@pytest.fixture
+def ground_truth():
+    return [{1, 2, 3}, {4, 5}, {6}]
+
+
+@pytest.fixture
+def results():
+    return [
+        [{1, 2, 3}, {4, 5}, {6}],
+        [{1, 2}, {3, 4, 5}, {6}],
+        [{1, 2, 3, 4, 5, 6}],
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_evaluate_many_matches_evaluation(ground_truth, results, workers):
+    scores = evaluate_many(ground_truth, results, workers=workers)
+
+    assert scores == [Evaluation(ground_truth, r).compute_all() for r in results]
+
+
+def test_evaluate_many_selects_metrics(ground_truth, results):
+    scores = evaluate_many(ground_truth, results, metrics=["twi", "rand_index"])
+
+    assert all(set(score) == {"twi", "rand_index"} for score in scores)
+
+
+def test_evaluate_many_label_arrays(ground_truth, results):
+    gt_labels, result_labels = to_label_arrays(ground_truth, results[1])
+
+    assert evaluate_many(gt_labels, [result_labels], workers=2) == [
+        Evaluation(ground_truth, results[1]).compute_all()
+    ]
+
+
+def test_evaluate_many_rejects_unknown_metrics(ground_truth, results):
+    with pytest.raises(ValueError):
+        evaluate_many(ground_truth, results, metrics=["accuracy"])
+
+
+def test_concurrent_pools_keep_their_own_ground_truth(results):
+    ground_truths = [[{1, 2, 3}, {4, 5}, {6}], [{1}, {2}, {3}, {4}, {5}, {6}]]
+
+    with ThreadPoolExecutor(4) as threads:
+        scores = list(
+            threads.map(
+                lambda gt: evaluate_many(gt, results, workers=2), ground_truths * 3
+            )
+        )
+
+    assert scores == [
+        [Evaluation(gt, r).compute_all() for r in results] for gt in ground_truths * 3
+    ]
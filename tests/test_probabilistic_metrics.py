@@ -1,6 +1,18 @@
+import os
+import subprocess
+import sys
+
 import pytest
 
-from pyresolvemetrics._probabilistic import precision, recall, f1
+from pyresolvemetrics._probabilistic import (
+    Confusion,
+    confusion,
+    f1,
+    f_beta,
+    jaccard_index,
+    precision,
+    recall,
+)
 
 
 @pytest.fixture
@@ -26,6 +38,7 @@ def result(request):
         ({("a", "b"), ("c", "d")}, {("a", "c")}, 0),
         ({("a", "b"), ("c", "d")}, {("b", "a"), ("d", "e")}, 0.5),
         ({("a", "b"), ("c", "d")}, set(), 0),
+        ({(-1, 5)}, {(-2, 5)}, 0),
     ],
 )
 def test_precision(ground_truth, result, expected):
@@ -62,3 +75,58 @@ def test_recall(ground_truth, result, expected):
 def test_f1(ground_truth, result, expected):
     actual = f1(ground_truth, result)
     assert round(actual, 2) == expected
+
+
+def test_confusion_counts_outcomes():
+    actual = confusion({("a", "b"), ("c", "d")}, {("b", "a"), ("d", "e")})
+    assert actual == Confusion(tp=1, fp=1, fn=1)
+
+
+@pytest.mark.parametrize("metric", [precision, recall, f1, f_beta, jaccard_index])
+def test_metrics_accept_confusion(metric):
+    ground_truth = {("a", "b"), ("c", "d"), ("e", "f")}
+    result = {("b", "a"), ("d", "e")}
+    counts = confusion(ground_truth, result)
+    assert metric(counts) == metric(ground_truth, result)
+
+
+def test_metrics_reject_confusion_with_result():
+    with pytest.raises(ValueError):
+        precision(Confusion(1, 0, 0), {("a", "b")})
+
+
+@pytest.mark.parametrize(
+    "beta, expected",
+    [(1, 0.4), (2, 0.29), (0.5, 0.62)],
+)
+def test_f_beta(beta, expected):
+    counts = Confusion(tp=1, fp=0, fn=3)
+    assert round(f_beta(counts, beta=beta), 2) == expected
+
+
+def test_jaccard_index():
+    assert jaccard_index(Confusion(tp=2, fp=1, fn=1)) == 0.5
+
+
+def test_small_and_large_collections_agree(monkeypatch):
+    ground_truth = {(i, i + 1) for i in range(0, 300, 2)}
+    result = [(i + 1, i) for i in range(0, 300, 3)] + [(0, 1)]
+    expected = confusion(ground_truth, result)
+    monkeypatch.setattr("pyresolvemetrics._probabilistic._COLLECTION_LIMIT", 0)
+    assert confusion(ground_truth, result) == expected
+
+
+def test_scoring_pairs_does_not_import_numpy():
+    script = (
+        "import sys, pyresolvemetrics;"
+        "pyresolvemetrics.f1({('a', 'b')}, {('a', 'b'), ('b', 'c')});"
+        "print('numpy' in sys.modules)"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    ).stdout
+    assert output.strip() == "False"
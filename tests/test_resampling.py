@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+
+from pyresolvemetrics import Evaluation, ResolutionTracker, bootstrap, jackknife
+from pyresolvemetrics._contingency import Contingency
+from pyresolvemetrics._resampling import (
+    _COUNTS,
+    _ClusterResampler,
+    _RecordResampler,
+)
+
+
+@pytest.fixture
+def partitions():
+    rng = np.random.default_rng(5)
+    ground_truth = rng.integers(0, 200, 1000)
+    result = ground_truth.copy()
+    noisy = rng.random(1000) < 0.2
+    result[noisy] = rng.integers(0, 200, noisy.sum())
+    result[:10] = -1
+    return ground_truth, result
+
+
+@pytest.mark.parametrize("resampler", [_ClusterResampler, _RecordResampler])
+def test_unit_weights_reproduce_the_table(partitions, resampler):
+    table = Contingency.from_labels(*partitions)
+    sampler = resampler(table)
+    units = len(sampler.records) if resampler is _RecordResampler else table.n_rows
+    counts = sampler.counts(np.ones((units, 1)))
+
+    for name in _COUNTS:
+        assert counts[name][0] == pytest.approx(getattr(table, name)), name
+
+
+def test_cluster_weights_count_pairs_once_per_copy():
+    table = Contingency.from_labels(np.array([0, 0, 1, 1]), np.array([0, 0, 0, 1]))
+    counts = _ClusterResampler(table).counts(np.array([[2.0], [1.0]]))
+
+    # Two copies of the pair {0, 1}, and record 2 paired with both of them.
+    assert counts["cell_pairs"][0] == 2
+    assert counts["col_pairs"][0] == 2 + 2 * 2
+    assert counts["ground_truth_record_pairs"][0] == 2 + 1 + 2 * 2 * 2
+
+
+@pytest.mark.parametrize("unit", ["clusters", "records"])
+def test_bootstrap_intervals(partitions, unit):
+    intervals = bootstrap(*partitions, n_resamples=300, unit=unit, seed=3)
+    expected = Evaluation(*partitions).compute_all(ResolutionTracker.METRICS)
+
+    assert set(intervals) == set(expected)
+    for name, interval in intervals.items():
+        assert interval.estimate == expected[name]
+        assert interval.low <= interval.estimate <= interval.high, name
+        assert interval.standard_error > 0, name
+
+
+def test_bootstrap_is_reproducible(partitions):
+    first = bootstrap(*partitions, metrics=["twi"], n_resamples=50, seed=1)
+    parallel = bootstrap(
+        *partitions, metrics=["twi"], n_resamples=50, seed=1, workers=2
+    )
+
+    assert first == parallel
+    assert first != bootstrap(*partitions, metrics=["twi"], n_resamples=50, seed=2)
+
+
+def test_bootstrap_of_identical_partitions(partitions):
+    ground_truth, _ = partitions
+    intervals = bootstrap(ground_truth, ground_truth, n_resamples=20, seed=0)
+
+    for name in ["pair_precision", "cluster_recall", "twi", "rand_index"]:
+        assert intervals[name].low == intervals[name].high == 1, name
+
+
+def test_jackknife_matches_leaving_clusters_out():
+    ground_truth = [{1, 2, 3}, {4, 5}, {6}, {7, 8}]
+    result = [{1, 2}, {3, 4, 5}, {6, 7, 8}]
+    intervals = jackknife(ground_truth, result, ["adjusted_rand_index", "twi"])
+
+    for name, interval in intervals.items():
+        values = np.array(
+            [
+                getattr(
+                    Evaluation(
+                        [c for c in ground_truth if c is not left_out],
+                        [r - left_out for r in result if r - left_out],
+                    ),
+                    name,
+                )
+                for left_out in ground_truth
+            ]
+        )
+        spread = values - values.mean()
+        error = np.sqrt(3 / 4 * np.dot(spread, spread))
+        assert interval.standard_error == pytest.approx(error)
+        assert interval.low < interval.estimate < interval.high
+
+
+def test_invalid_arguments(partitions):
+    with pytest.raises(ValueError):
+        bootstrap(*partitions, unit="entities")
+    with pytest.raises(ValueError):
+        bootstrap(*partitions, metrics=["f1"])
+    with pytest.raises(ValueError):
+        jackknife([{1, 2}], [{1}, {2}])
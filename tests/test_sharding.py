@@ -0,0 +1,108 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from pyresolvemetrics import (
+    Evaluation,
+    PartialContingency,
+    count_shard,
+    evaluate_shards,
+    shard_of,
+    write_shards,
+)
+
+
+@pytest.fixture
+def labels():
+    rng = np.random.default_rng(7)
+    ground_truth = rng.integers(0, 300, 5_000) * 3 + 11
+    result = np.where(
+        rng.random(5_000) < 0.8, ground_truth, rng.integers(0, 900, 5_000)
+    )
+    ground_truth[rng.random(5_000) < 0.05] = -1
+    result[rng.random(5_000) < 0.05] = -1
+    return ground_truth, result
+
+
+def _expected(labels):
+    return Evaluation(*labels).compute_all()
+
+
+def test_merged_chunks_match_the_whole(labels):
+    ground_truth, result = labels
+    bounds = [0, 1_000, 1_001, 3_500, 5_000]
+    partials = [
+        PartialContingency.from_labels(ground_truth[a:b], result[a:b])
+        for a, b in zip(bounds, bounds[1:])
+    ]
+    merged = PartialContingency.empty().merge(*partials)
+
+    assert merged.evaluate() == pytest.approx(_expected(labels))
+
+
+def test_merge_one_at_a_time(labels):
+    ground_truth, result = labels
+    merged = PartialContingency.from_labels(ground_truth[:2_000], result[:2_000])
+    merged.merge(PartialContingency.from_labels(ground_truth[2_000:], result[2_000:]))
+
+    assert merged.evaluate(["twi", "rand_index"]) == pytest.approx(
+        {
+            "twi": _expected(labels)["twi"],
+            "rand_index": _expected(labels)["rand_index"],
+        }
+    )
+
+
+def test_from_records_joins_on_record_ids():
+    partial = PartialContingency.from_records(
+        (np.array([5, 1, 9]), np.array([0, 0, 1])),
+        (np.array([9, 5, 7]), np.array([4, 3, 3])),
+    )
+    assert partial.cells.tolist() == [[0, 3], [1, 4]]
+    assert partial.counts.tolist() == [1, 1]
+    assert partial.ground_truth_sizes.tolist() == [[0, 2], [1, 1]]
+    assert partial.result_sizes.tolist() == [[3, 2], [4, 1]]
+
+
+def test_duplicate_records_are_rejected():
+    with pytest.raises(ValueError):
+        PartialContingency.from_records(
+            (np.array([1, 1]), np.array([0, 1])), (np.array([1]), np.array([0]))
+        )
+
+
+def test_save_and_load(tmp_path, labels):
+    partial = PartialContingency.from_labels(*labels)
+    partial.save(tmp_path / "partial.bin")
+    loaded = PartialContingency.load(tmp_path / "partial.bin")
+
+    assert loaded.evaluate() == partial.evaluate()
+    assert pickle.loads(pickle.dumps(partial)).evaluate() == partial.evaluate()
+
+
+def test_shard_of_spreads_records():
+    shards = shard_of(np.arange(10_000), 4)
+    assert set(shards.tolist()) == {0, 1, 2, 3}
+    assert np.bincount(shards).min() > 2_000
+    assert np.array_equal(shard_of(np.arange(100), 4), shards[:100])
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_sharded_evaluation(tmp_path, labels, workers):
+    ground_truth, result = labels
+    records = np.arange(len(ground_truth)) * 7
+    gt_present = np.flatnonzero(ground_truth >= 0)
+    result_present = np.random.default_rng(0).permutation(np.flatnonzero(result >= 0))
+    ground_truth_chunks = [
+        (records[chunk], ground_truth[chunk]) for chunk in np.array_split(gt_present, 3)
+    ]
+    result_chunks = [
+        (records[chunk], result[chunk]) for chunk in np.array_split(result_present, 5)
+    ]
+    write_shards(tmp_path, ground_truth_chunks, result_chunks, 4)
+
+    assert evaluate_shards(tmp_path, 4, workers=workers) == pytest.approx(
+        _expected(labels)
+    )
+    assert count_shard(tmp_path, 0).counts.sum() < len(ground_truth)
@@ -0,0 +1,128 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from pyresolvemetrics import (
+    adjusted_rand_index,
+    confusion,
+    evaluate_many,
+    load_ground_truth,
+    load_pairs,
+    load_partition,
+    load_records,
+    save_pairs,
+    save_partition,
+    twi,
+)
+
+
+@pytest.fixture
+def partition():
+    return [{1, 2, 3}, {(4, "a"), 5}, {6}]
+
+
+@pytest.fixture
+def result():
+    return [{1, 2}, {3, (4, "a"), 5}, {6}]
+
+
+def test_partition_round_trip(tmp_path, partition, result):
+    gt_path, result_path = tmp_path / "gt.bin", tmp_path / "result.bin"
+    save_partition(gt_path, partition)
+    records = load_records(gt_path)
+    save_partition(result_path, result, records)
+
+    assert sorted(records, key=str) == sorted([1, 2, 3, (4, "a"), 5, 6], key=str)
+    assert isinstance(load_partition(gt_path), np.memmap)
+    assert twi(load_partition(gt_path), load_partition(result_path)) == twi(
+        partition, result
+    )
+
+
+def test_unlisted_records_follow_the_listed_ones(tmp_path, partition, result):
+    save_partition(tmp_path / "gt.bin", partition)
+    records = load_records(tmp_path / "gt.bin")
+    save_partition(tmp_path / "result.bin", [*result, {7, 8}], records)
+
+    stored = load_records(tmp_path / "result.bin")
+    assert stored[: len(records)] == records
+    assert sorted(stored[len(records) :]) == [7, 8]
+    labels = load_partition(tmp_path / "result.bin")
+    ground_truth = np.concatenate([load_partition(tmp_path / "gt.bin"), [-1, -1]])
+    assert twi(ground_truth, labels) == twi(partition, [*result, {7, 8}])
+
+
+def test_label_array_round_trip(tmp_path):
+    labels = np.array([7, 7, -1, 3, 3, 3])
+    save_partition(tmp_path / "gt.bin", labels)
+
+    assert load_partition(tmp_path / "gt.bin").tolist() == [1, 1, -1, 0, 0, 0]
+    assert load_records(tmp_path / "gt.bin") is None
+
+
+def test_pairs_round_trip(tmp_path):
+    gt = {("a", "b"), ("c", "d"), ("b", "a")}
+    result = {("b", "a"), ("d", "e")}
+    save_pairs(tmp_path / "gt.bin", gt)
+    save_pairs(tmp_path / "result.bin", result, load_records(tmp_path / "gt.bin"))
+
+    gt_pairs = load_pairs(tmp_path / "gt.bin")
+    assert gt_pairs.tolist() == [[0, 1], [2, 3]]
+    assert confusion(gt_pairs, load_pairs(tmp_path / "result.bin")) == confusion(
+        gt, result
+    )
+
+
+def test_empty_pairs(tmp_path):
+    save_pairs(tmp_path / "gt.bin", np.empty((0, 2), dtype=np.int64))
+
+    assert load_pairs(tmp_path / "gt.bin").shape == (0, 2)
+
+
+def test_load_ground_truth(tmp_path, partition, result):
+    save_partition(tmp_path / "gt.bin", partition)
+    save_partition(tmp_path / "result.bin", result, load_records(tmp_path / "gt.bin"))
+    ground_truth = load_ground_truth(tmp_path / "gt.bin")
+    labels = load_partition(tmp_path / "result.bin")
+
+    assert adjusted_rand_index(ground_truth, labels) == pytest.approx(
+        adjusted_rand_index(partition, result)
+    )
+    assert (
+        evaluate_many(ground_truth, [labels, labels], ["twi"], workers=2)
+        == [{"twi": twi(partition, result)}] * 2
+    )
+
+
+def test_loaded_ground_truth_pickles_its_path(tmp_path):
+    save_pairs(tmp_path / "gt.bin", np.arange(20_000).reshape(-1, 2))
+    ground_truth = load_ground_truth(tmp_path / "gt.bin")
+    data = pickle.dumps(ground_truth)
+
+    assert len(data) < 1000
+    assert pickle.loads(data).pair_count == 10_000
+
+
+def test_ground_truth_loaded_with_its_records(tmp_path, partition):
+    gt = {("a", "b"), ("c", "d")}
+    result = {("b", "a"), ("d", "e")}
+    save_pairs(tmp_path / "gt.bin", gt)
+    ground_truth = pickle.loads(
+        pickle.dumps(load_ground_truth(tmp_path / "gt.bin", records=True))
+    )
+
+    assert confusion(ground_truth, result) == confusion(gt, result)
+    save_pairs(tmp_path / "ids.bin", np.array([[0, 1]]))
+    with pytest.raises(ValueError):
+        load_ground_truth(tmp_path / "ids.bin", records=True)
+    save_partition(tmp_path / "partition.bin", partition)
+    with pytest.raises(ValueError):
+        load_ground_truth(tmp_path / "partition.bin", records=True)
+
+
+def test_wrong_kind(tmp_path):
+    save_pairs(tmp_path / "gt.bin", {(1, 2)})
+
+    with pytest.raises(ValueError):
+        load_partition(tmp_path / "gt.bin")
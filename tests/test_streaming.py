@@ -0,0 +1,107 @@
+import os
+import pickle
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+
+from pyresolvemetrics import (
+    Confusion,
+    ConfusionAccumulator,
+    confusion,
+    streaming_confusion,
+)
+
+
+@pytest.fixture
+def ground_truth():
+    return {("a", "b"), ("c", "d"), ("e", "f")}
+
+
+def test_streaming_matches_confusion(ground_truth):
+    chunks = [[("b", "a"), ("x", "y")], [("d", "e")], [("f", "e")]]
+    result = set().union(*map(set, chunks))
+
+    assert streaming_confusion(ground_truth, chunks) == confusion(ground_truth, result)
+
+
+def test_repeated_true_positives_are_counted_once(ground_truth):
+    chunks = [[("a", "b")], [("b", "a")]]
+    assert streaming_confusion(ground_truth, chunks) == Confusion(1, 0, 2)
+
+
+def test_array_chunks():
+    ground_truth = np.array([[0, 1], [2, 3]])
+    chunks = [np.array([[1, 0], [1, 2]]), np.array([[3, 2]])]
+    assert streaming_confusion(ground_truth, chunks) == Confusion(2, 1, 0)
+
+
+def test_empty_ground_truth():
+    assert streaming_confusion(set(), [[("a", "b")]]) == Confusion(0, 1, 0)
+
+
+def test_merge_shards(ground_truth):
+    first = ConfusionAccumulator(ground_truth)
+    second = first.spawn()
+    first.update([("a", "b"), ("x", "y")])
+    second.update([("a", "b"), ("c", "d")])
+
+    assert first.merge(second).confusion == Confusion(2, 1, 1)
+
+
+def test_merge_rejects_different_ground_truth(ground_truth):
+    with pytest.raises(ValueError):
+        ConfusionAccumulator(ground_truth).merge(ConfusionAccumulator(set()))
+
+
+def test_merge_accumulators_of_a_reordered_ground_truth():
+    first = ConfusionAccumulator([("a", "b"), ("c", "d")]).update([("a", "b")])
+    second = ConfusionAccumulator([("c", "d"), ("a", "b")]).update([("a", "b")])
+
+    assert first.merge(second).confusion == Confusion(1, 0, 1)
+
+
+_SHARD = """
+import pickle, sys
+from pyresolvemetrics import ConfusionAccumulator
+ground_truth = {("r0", "r1"), ("r2", "r3")}
+accumulator = ConfusionAccumulator(ground_truth).update([(sys.argv[1], sys.argv[2])])
+sys.stdout.buffer.write(pickle.dumps(accumulator))
+"""
+
+
+def test_merge_accumulators_of_processes_with_other_hash_seeds():
+    shards = []
+    for seed, pair in [("1", ("r0", "r1")), ("2", ("r2", "r3"))]:
+        env = {**os.environ, "PYTHONHASHSEED": seed}
+        env["PYTHONPATH"] = os.pathsep.join(sys.path)
+        output = subprocess.run(
+            [sys.executable, "-c", _SHARD, *pair],
+            check=True,
+            capture_output=True,
+            env=env,
+        )
+        shards.append(pickle.loads(output.stdout))
+
+    assert shards[0].merge(shards[1]).confusion == Confusion(2, 0, 0)
+
+
+def test_distinct_false_positives(ground_truth):
+    chunks = [[("x", "y"), ("a", "b")], [("y", "x"), ("z", "a")], [("a", "z")]]
+    accumulator = ConfusionAccumulator(ground_truth, distinct=True)
+    for chunk in chunks:
+        accumulator.update(chunk)
+
+    assert accumulator.confusion == Confusion(1, 2, 2)
+
+
+def test_merge_distinct_false_positives(ground_truth):
+    first = ConfusionAccumulator(ground_truth, distinct=True)
+    second = ConfusionAccumulator(list(ground_truth)[::-1], distinct=True)
+    first.update([("x", "y"), ("a", "b")])
+    second.update([("y", "x"), ("c", "d"), ("x", "z")])
+
+    assert first.merge(second).confusion == Confusion(2, 2, 1)
+    with pytest.raises(ValueError):
+        first.merge(ConfusionAccumulator(ground_truth))
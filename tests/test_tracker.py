@@ -0,0 +1,122 @@
+import random
+
+import numpy as np
+import pytest
+
+from pyresolvemetrics import Evaluation, GroundTruth, ResolutionTracker
+
+
+@pytest.fixture
+def ground_truth():
+    return [{1, 2, 3}, {4, 5}, {6}]
+
+
+def _partition(tracker, records):
+    clusters = {}
+    for record in records:
+        clusters.setdefault(tracker.cluster_of(record), set()).add(record)
+    return [frozenset(cluster) for cluster in clusters.values()]
+
+
+def test_events(ground_truth):
+    tracker = ResolutionTracker(ground_truth)
+    for record in range(1, 8):
+        tracker.add_record(record, record)
+    assert tracker.cluster_recall == 1 / 3
+
+    tracker.merge(1, 2)
+    tracker.merge(1, 3)
+    tracker.merge(4, 5)
+    assert tracker.compute_all() == Evaluation(
+        ground_truth, [{1, 2, 3}, {4, 5}, {6}, {7}]
+    ).compute_all(ResolutionTracker.METRICS)
+
+    tracker.merge(1, 4)
+    tracker.split(1, [4, 5], "b")
+    tracker.move_record(7, 6)
+    tracker.remove_record(7)
+    assert tracker.compute_all() == Evaluation(ground_truth, ground_truth).compute_all(
+        ResolutionTracker.METRICS
+    )
+
+
+def test_split_requires_members(ground_truth):
+    tracker = ResolutionTracker(ground_truth)
+    tracker.add_record(1, "a")
+    tracker.add_record(2, "b")
+
+    with pytest.raises(ValueError):
+        tracker.split("a", [2], "c")
+    with pytest.raises(ValueError):
+        tracker.add_record(1, "c")
+
+
+def test_merge_requires_both_clusters(ground_truth):
+    tracker = ResolutionTracker(ground_truth)
+    tracker.add_record(1, "a")
+    tracker.add_record(2, "b")
+
+    with pytest.raises(ValueError):
+        tracker.merge("zzz", "b")
+    with pytest.raises(ValueError):
+        tracker.merge("b", "zzz")
+
+    tracker.merge("a", "b")
+    assert tracker.cluster_of(2) == "a"
+    tracker.move_record(2, "c")
+    assert tracker.cluster_of(2) == "c"
+
+
+def test_random_events_match_evaluation():
+    rng = random.Random(7)
+    labels = np.array([rng.randrange(8) for _ in range(60)])
+    gt = [frozenset(np.flatnonzero(labels == label).tolist()) for label in range(8)]
+    tracker = ResolutionTracker(GroundTruth.from_partition(gt))
+    records = []
+    for step in range(400):
+        event = rng.random()
+        clusters = list({tracker.cluster_of(record) for record in records})
+        if event < 0.3 or len(clusters) < 2:
+            record = rng.randrange(70)
+            if record not in records:
+                tracker.add_record(record, rng.choice(clusters + [step]))
+                records.append(record)
+        elif event < 0.5:
+            tracker.merge(*rng.sample(clusters, 2))
+        elif event < 0.7:
+            cluster = rng.choice(clusters)
+            members = [r for r in records if tracker.cluster_of(r) == cluster]
+            tracker.split(cluster, members[: len(members) // 2], ("split", step))
+        elif event < 0.9:
+            tracker.move_record(rng.choice(records), rng.choice(clusters))
+        else:
+            record = rng.choice(records)
+            tracker.remove_record(record)
+            records.remove(record)
+        expected = Evaluation(gt, _partition(tracker, records)).compute_all(
+            ResolutionTracker.METRICS
+        )
+        for name, value in tracker.compute_all().items():
+            assert value == pytest.approx(expected[name]), (step, name)
+
+
+def test_label_array_ground_truth():
+    tracker = ResolutionTracker(np.array([0, 0, 1, -1]))
+    for record in range(5):
+        tracker.add_record(record, 0)
+    tracker.split(0, [2, 4], 1)
+
+    assert tracker.compute_all() == Evaluation(
+        np.array([0, 0, 1, -1, -1]), np.array([0, 0, 1, 0, 1])
+    ).compute_all(ResolutionTracker.METRICS)
+
+
+def test_numpy_integer_records():
+    labels = np.array([0, 0, 1, 1])
+    tracker = ResolutionTracker(labels)
+    for record in np.arange(4):
+        tracker.add_record(record, labels[record])
+
+    assert tracker.compute_all() == Evaluation(labels, labels).compute_all(
+        ResolutionTracker.METRICS
+    )
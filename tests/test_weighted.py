@@ -0,0 +1,101 @@
+import numpy as np
+import pytest
+
+from pyresolvemetrics import (
+    Evaluation,
+    confusion,
+    precision,
+    recall,
+    sample_estimates,
+    weighted_confusion,
+)
+from pyresolvemetrics._weighted import _Design, _weighted_pairs
+
+
+def _pairs_of_units(units, weights):
+    pairs = 0.0
+    for unit in set(units[units >= 0].tolist()):
+        inside = weights[units == unit]
+        pairs += (inside.sum() ** 2 - (inside**2).sum()) / 2
+    return pairs
+
+
+def test_replicates_drop_one_group_of_a_stratum():
+    rng = np.random.default_rng(0)
+    units = rng.integers(-1, 12, 150)
+    weights = rng.random(150) + 0.5
+    strata = np.append(rng.integers(0, 3, 149), 3)  # the last stratum is too small
+    design = _Design(strata, 5, rng)
+    whole, replicates = _weighted_pairs(units, weights, design)
+
+    assert whole == pytest.approx(_pairs_of_units(units, weights))
+    assert design.n_replicates == 15
+    for replicate, stratum in enumerate(design.replicate_strata):
+        group = replicate - design.offsets[stratum]
+        inside = strata == stratum
+        replicate_weights = np.where(inside, weights * design.scale[stratum], weights)
+        replicate_weights[inside & (design.groups == group)] = 0
+        assert replicates[replicate] == pytest.approx(
+            _pairs_of_units(units, replicate_weights)
+        )
+
+
+@pytest.fixture
+def labels():
+    rng = np.random.default_rng(1)
+    ground_truth = rng.integers(0, 2_000, 20_000)
+    result = np.where(
+        rng.random(20_000) < 0.9, ground_truth, rng.integers(0, 4_000, 20_000)
+    )
+    return ground_truth, result
+
+
+def test_unweighted_estimates_of_a_full_sample(labels):
+    estimates = sample_estimates(*labels, seed=0)
+    expected = Evaluation(*labels).compute_all(estimates)
+
+    for name, interval in estimates.items():
+        assert interval.estimate == pytest.approx(expected[name])
+        assert interval.low <= interval.estimate <= interval.high
+
+
+def test_stratified_sample_covers_the_whole(labels):
+    ground_truth, result = labels
+    rng = np.random.default_rng(2)
+    strata = (ground_truth % 2).astype(np.int64)
+    rates = np.array([0.5, 0.2])
+    sampled = rng.random(len(ground_truth)) < rates[strata]
+    estimates = sample_estimates(
+        ground_truth[sampled],
+        result[sampled],
+        weights=1 / rates[strata[sampled]],
+        strata=strata[sampled],
+        metrics=["pair_precision", "adjusted_rand_index"],
+        seed=0,
+    )
+    expected = Evaluation(*labels)
+
+    assert set(estimates) == {"pair_precision", "adjusted_rand_index"}
+    for name, interval in estimates.items():
+        assert interval.standard_error > 0
+        assert abs(interval.estimate - getattr(expected, name)) < 4 * (
+            interval.standard_error
+        )
+
+
+def test_unknown_metrics_are_rejected(labels):
+    with pytest.raises(ValueError):
+        sample_estimates(*labels, metrics=["cluster_precision"])
+
+
+def test_weighted_confusion():
+    ground_truth = np.arange(20).reshape(-1, 2)
+    result = np.array([[1, 0], [2, 3], [5, 7]])
+    counts = weighted_confusion(ground_truth, result, [2, 2, 4])
+
+    assert counts == (4, 4, 6)
+    assert precision(counts) == 0.5
+    assert recall(counts) == 0.4
+    assert weighted_confusion(ground_truth, result, np.ones(3)) == confusion(
+        ground_truth, result
+    )